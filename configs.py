@@ -0,0 +1,153 @@
+from pathlib import Path
+from yaml import safe_load
+
+import hashlib
+import json
+import os
+
+import dark_arts
+import encounters
+import hogwarts
+import locations
+import villains
+
+# Bump when GameDefinition or the cache layout changes
+COMPILED_VERSION = 1
+
+CACHE_DIR = Path(__file__).parent / ".config_cache"
+
+_REQUIRED = ('name', 'hero_abilities', 'encounters', 'locations', 'dark_arts_deck', 'villains_deck', 'hogwarts_deck')
+
+
+class ConfigError(ValueError):
+    pass
+
+
+class GameDefinition(dict):
+    """A game config, checked against the registries and indexed.
+
+    Still the config dict itself, so it's written to traces and sent to worker
+    processes as before. The decks are also kept as multisets (name: count)
+    and as ID arrays: each card's index into the distinct names, so building a
+    game's decks looks each card class up once rather than once per copy.
+    """
+
+    def __init__(self, config, hogwarts_names, hogwarts_ids, dark_arts_names, dark_arts_ids):
+        super().__init__(config)
+        self.hogwarts_names = hogwarts_names
+        self.hogwarts_ids = hogwarts_ids
+        self.hogwarts_counts = _counts(hogwarts_names, hogwarts_ids)
+        self.dark_arts_names = dark_arts_names
+        self.dark_arts_ids = dark_arts_ids
+        self.dark_arts_counts = _counts(dark_arts_names, dark_arts_ids)
+        # Card classes by ID, looked up (and imported) by the first game built
+        self._hogwarts_classes = None
+        self._dark_arts_classes = None
+
+    def hogwarts_cards(self):
+        """A fresh Hogwarts deck, in config order."""
+        if self._hogwarts_classes is None:
+            self._hogwarts_classes = [hogwarts.CARDS_BY_NAME[name] for name in self.hogwarts_names]
+        classes = self._hogwarts_classes
+        return [classes[i]() for i in self.hogwarts_ids]
+
+    def dark_arts_cards(self):
+        """A fresh Dark Arts deck, in config order."""
+        if self._dark_arts_classes is None:
+            self._dark_arts_classes = [dark_arts.CARDS_BY_NAME[name] for name in self.dark_arts_names]
+        classes = self._dark_arts_classes
+        return [classes[i]() for i in self.dark_arts_ids]
+
+    def _cached(self):
+        return {
+            'version': COMPILED_VERSION,
+            'config': dict(self),
+            'hogwarts_names': self.hogwarts_names,
+            'hogwarts_ids': self.hogwarts_ids,
+            'dark_arts_names': self.dark_arts_names,
+            'dark_arts_ids': self.dark_arts_ids,
+        }
+
+
+def _counts(names, ids):
+    counts = dict.fromkeys(names, 0)
+    for i in ids:
+        counts[names[i]] += 1
+    return counts
+
+
+def _index(names):
+    distinct = list(dict.fromkeys(names))
+    ids = {name: i for i, name in enumerate(distinct)}
+    return distinct, [ids[name] for name in names]
+
+
+def _check_names(names, registry, what):
+    unknown = sorted({name for name in names if name not in registry})
+    if unknown:
+        raise ConfigError(f"Unknown {what}: {', '.join(unknown)}")
+
+
+def compile(config):
+    """Check every name in a config against the registries and index its decks."""
+    missing = [key for key in _REQUIRED if key not in config]
+    if missing:
+        raise ConfigError(f"Config is missing {', '.join(missing)}")
+    _check_names(config['locations'], locations.LOCATIONS_BY_NAME, "locations")
+    _check_names(config['dark_arts_deck'], dark_arts.CARDS_BY_NAME, "Dark Arts cards")
+    _check_names(config['hogwarts_deck'], hogwarts.CARDS_BY_NAME, "Hogwarts cards")
+    villains_deck = config['villains_deck']
+    if isinstance(villains_deck['villains'], list):
+        _check_names(villains_deck['villains'], villains.VILLAINS_BY_NAME, "villains")
+    elif villains_deck['villains'] > len(villains.VILLAINS_BY_NAME):
+        raise ConfigError(f"Only {len(villains.VILLAINS_BY_NAME)} villains to draw {villains_deck['villains']} from")
+    if villains_deck['voldemort']:
+        _check_names([villains_deck['voldemort']], villains.VOLDEMORTS_BY_NAME, "Voldemort")
+    if config['encounters']:
+        _check_names(config['encounters']['deck'], encounters.ENCOUNTERS_BY_NAME, "encounters")
+    return GameDefinition(config, *_index(config['hogwarts_deck']), *_index(config['dark_arts_deck']))
+
+
+def definition(config):
+    """config as a GameDefinition, compiling it if it isn't one already."""
+    if isinstance(config, GameDefinition):
+        return config
+    return compile(config)
+
+
+def _registry_key():
+    # Cached definitions were checked against these names, so they're only
+    # good for as long as the registries stay the same
+    names = [list(hogwarts.CARDS_BY_NAME), list(dark_arts.CARDS_BY_NAME), list(villains.VILLAINS_BY_NAME),
+             list(villains.VOLDEMORTS_BY_NAME), list(encounters.ENCOUNTERS_BY_NAME), list(locations.LOCATIONS_BY_NAME)]
+    return json.dumps(names).encode('utf-8')
+
+
+def load(path, cache_dir=CACHE_DIR):
+    """Read a config file, from the compiled cache if it's been read before.
+
+    Cache entries are keyed by a hash of the file's contents (and of the
+    registries), so editing a config or adding cards just makes a new one.
+    """
+    text = Path(path).read_bytes()
+    digest = hashlib.sha256(text + b'\0' + _registry_key()).hexdigest()
+    cache_file = Path(cache_dir) / f"{digest}.json"
+    try:
+        cached = json.loads(cache_file.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        cached = None
+    if cached is not None and cached.get('version') == COMPILED_VERSION:
+        return GameDefinition(cached['config'], cached['hogwarts_names'], cached['hogwarts_ids'],
+                              cached['dark_arts_names'], cached['dark_arts_ids'])
+
+    compiled = compile(safe_load(text))
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename, so workers starting together never read half a file
+        partial = cache_file.with_name(f"{cache_file.name}.{os.getpid()}")
+        partial.write_text(json.dumps(compiled._cached(), ensure_ascii=False), encoding='utf-8')
+        partial.replace(cache_file)
+    except OSError:
+        # Read-only checkout: just compile every time
+        pass
+    return compiled
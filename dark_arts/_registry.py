@@ -0,0 +1,41 @@
+# Generated by registry.py from the modules in this package; don't edit by hand.
+# After adding, renaming or removing a card, run: python3 registry.py
+
+CARDS_BY_NAME = {
+    "Acromantula Attack": "acromantula_attack",
+    "Avada Kedavra": "avadakedavra",
+    "Blast-ended": "blast_ended",
+    "Bombarda!": "bombarda",
+    "Centaur Attack": "centaur_attack",
+    "Crucio": "crucio",
+    "Dementor's Kiss": "dementors_kiss",
+    "Dragon's Breath": "dragons_breath",
+    "Educational Decree": "educational_decree",
+    "Expulso": "expulso",
+    "Fiendfyre": "fiendfyre",
+    "Fight and Flight": "fight_and_flight",
+    "Flipendo": "flipendo",
+    "Hand of Glory": "hand_of_glory",
+    "He Who Must Not Be Named": "he_who_must_not_be_named",
+    "Heir of Slytherin": "heir_of_slytherin",
+    "Imperio": "imperio",
+    "Inquisitorial Squad": "inquisitorial_squad",
+    "Legilimency": "legilimency",
+    "Leprechaun Gold": "leprechaun_gold",
+    "Menacing Growl": "menacing_growl",
+    "Morsmordre": "morsmordre",
+    "Obliviate": "obliviate",
+    "Opugno": "opugno",
+    "Petrification": "petrification",
+    "Poison": "poison",
+    "Raging Troll": "raging_troll",
+    "Regeneration": "regeneration",
+    "Relashio": "relashio",
+    "Sectumsempra": "sectumsempra",
+    "Seriously Misunderstood Creatures": "seriously_misunderstood_creatures",
+    "Slugulus Eructo": "slugulus_eructo",
+    "Tarantallegra": "tarantallegra",
+    "The Grim": "the_grim",
+    "Transformed": "transformed",
+    "Vicious Bite": "vicious_bite",
+}
@@ -1,14 +1,23 @@
 import curses
-import random
+
+import event_log
+import registry
+import state
+
+from ._registry import CARDS_BY_NAME as _CARD_MODULES
 
 class DarkArtsDeck(object):
-    def __init__(self, window, chosen_cards):
+    def __init__(self, window, cards, rng):
         self._window = window
-        self._init_window()
-        self._pad = curses.newpad(100, 100)
+        if self._window is not None:
+            self._init_window()
+            self._pad = curses.newpad(100, 100)
+        # What the panel last drew, to skip redrawing when nothing changed
+        self._displayed = None
 
-        self._deck = [CARDS_BY_NAME[card_name]() for card_name in chosen_cards]
-        random.shuffle(self._deck)
+        self._rng = rng
+        self._deck = cards
+        self._rng.shuffle(self._deck)
         self._discard = []
         self._played = []
 
@@ -24,20 +33,26 @@ class DarkArtsDeck(object):
         self._pad_end_col = self._pad_start_col + end[1] - 3
 
     def display_state(self, resize=False, size=None):
+        if self._window is None:
+            return
         if resize:
             self._window.resize(*size)
             self._window.clear()
             self._init_window()
-        self._pad.clear()
+        key = tuple(map(id, self._played))
+        if not resize and key == self._displayed:
+            return
+        self._displayed = key
+        self._pad.erase()
         for i, card in enumerate(self._played):
             self._pad.addstr(f"{card.name}: {card.description}\n")
         self._pad.noutrefresh(0,0, self._pad_start_line,self._pad_start_col, self._pad_end_line,self._pad_end_col)
 
     def play_turn(self, game):
-        game.log("-----Dark Arts phase-----")
+        game.log("-----Dark Arts phase-----", event_log.PHASE)
         count = game.locations.current.dark_arts_count
-        self._only_one_card = any(card.name == "Finite Incantatem" for card in game.heroes.active_hero._hand)
-        game.log(f"Playing {count} dark arts cards")
+        self._only_one_card = game.heroes.active_hero._hand.count_named("Finite Incantatem") > 0
+        game.log("Playing {count} dark arts cards", event_log.DARK_ARTS, count=count)
         self.play(game, count)
 
     def play(self, game, count):
@@ -57,7 +72,7 @@ class DarkArtsDeck(object):
     def _draw(self):
         if not self._deck:
             self._deck = self._discard
-            random.shuffle(self._deck)
+            self._rng.shuffle(self._deck)
             self._discard = []
         return self._deck.pop()
 
@@ -71,11 +86,12 @@ class DarkArtsDeck(object):
 
     def end_turn(self, game):
         for card in self._played:
-            card._end_turn(game)
+            with game.effect_source(card):
+                card._end_turn(game)
         self._played = []
 
 
-CARDS_BY_NAME = {}
+CARDS_BY_NAME = registry.Registry(__package__, _CARD_MODULES)
 
 
 class DarkArtsCard(object):
@@ -84,8 +100,9 @@ class DarkArtsCard(object):
         self.description = description
 
     def play(self, game):
-        game.log(f"Playing {self.name} dark arts card: {self.description}")
-        self._effect(game)
+        game.log("Playing {card} dark arts card: {description}", event_log.DARK_ARTS, card=self.name, description=self.description)
+        with game.effect_source(self):
+            self._effect(game)
 
     def _effect(self, game):
         raise ValueError(f"Programmer Error! Forgot to implement effect for {self.name}")
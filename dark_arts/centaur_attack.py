@@ -12,7 +12,7 @@ class CentaurAttack(DarkArtsCard):
         game.heroes.all_heroes.effect(game, self.__per_hero)
 
     def __per_hero(self, game, hero):
-        spells = sum(1 for card in hero._hand if card.is_spell())
+        spells = hero._hand.count_spells()
         game.log(f"Centaur Attack: {hero.name} has {spells} Spells")
         if spells >= 3:
             hero.remove_hearts(game, 1)
@@ -1,5 +1,3 @@
-import random
-
 from . import CARDS_BY_NAME, DarkArtsCard
 import constants
 
@@ -12,9 +10,9 @@ class HeirOfSlytherin(DarkArtsCard):
 
     def _effect(self, game):
         faces = [constants.DAMAGE, constants.DAMAGE, constants.DAMAGE, constants.INFLUENCE, constants.HEART, constants.CARD]
-        die_result = random.choice(faces)
+        die_result = game.rng.choice(faces)
         if game.heroes.active_hero.can_reroll_die(house_die=True) and game.input(f"Rolled {die_result}, (a)ccept or (r)eroll? ", "ar") == "r":
-            die_result = random.choice(faces)
+            die_result = game.rng.choice(faces)
         if die_result == constants.DAMAGE:
             game.log(f"Rolled {constants.DAMAGE}, ALL heroes lose 1{constants.HEART}")
             game.heroes.all_heroes.remove_hearts(game, 1)
@@ -13,7 +13,7 @@ class IngquisitorialSquad(DarkArtsCard):
         game.heroes.all_heroes.effect(game, self.__per_hero)
 
     def __per_hero(self, game, hero):
-        total = sum(1 for card in hero._hand if card.name == "Detention!")
+        total = hero._hand.count_named("Detention!")
         game.log(f"Inquisitorial Squad: {hero.name} has {total} Detention! cards")
         hero.remove_hearts(game, total)
 
@@ -10,7 +10,7 @@ class Morsmordre(DarkArtsCard):
 
     def _effect(self, game):
         # Bit of a hack. Maybe import and do type check?
-        death_eaters = sum(1 for v in game.villain_deck.current if v.name == "Death Eater" and not v._stunned)
+        death_eaters = game.villain_deck.count_active("Death Eater")
         if death_eaters > 0:
             game.log(f"Damage increased to {death_eaters+1}{constants.HEART} by Death Eater(s)")
         game.heroes.all_heroes.remove_hearts(game, 1 + death_eaters)
@@ -12,7 +12,7 @@ class Obliviate(DarkArtsCard):
         game.heroes.all_heroes.effect(game, self.__per_hero)
 
     def __per_hero(self, game, hero):
-        spells = sum(1 for card in hero._hand if card.is_spell())
+        spells = hero._hand.count_spells()
         if hero.is_stunned:
             game.log(f"{hero.name} is stunned and can't lose {constants.HEART}. Ignoring obliviate!")
             return
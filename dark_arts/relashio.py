@@ -12,7 +12,7 @@ class Relashio(DarkArtsCard):
         game.heroes.all_heroes.effect(game, self.__per_hero)
 
     def __per_hero(self, game, hero):
-        items = sum(1 for card in hero._hand if card.is_item())
+        items = hero._hand.count_items()
         if hero.is_stunned:
             game.log(f"{hero.name} is stunned and can't lose {constants.HEART}. Ignoring relashio!")
             return
@@ -1,5 +1,3 @@
-import random
-
 from . import CARDS_BY_NAME, DarkArtsCard
 import constants
 
@@ -12,9 +10,9 @@ class SeriouslyMisunderstoodCreatures(DarkArtsCard):
 
     def _effect(self, game):
         faces = [constants.HEART, constants.HEART + constants.HEART, constants.CARD, constants.CARD + constants.CARD, constants.DAMAGE, constants.CONTROL]
-        die_result = random.choice(faces)
+        die_result = game.rng.choice(faces)
         if game.heroes.active_hero.can_reroll_die(house_die=False) and game.input(f"Rolled {die_result}, (a)ccept or (r)eroll? ", "ar") == "r":
-            die_result = random.choice(faces)
+            die_result = game.rng.choice(faces)
         if die_result == constants.HEART or die_result == constants.HEART + constants.HEART:
             game.log(f"Rolled {constants.HEART}{constants.HEART}, ALL foes heal 1{constants.DAMAGE} and/or {constants.INFLUENCE}")
             game.villain_deck.all.remove_damage(game, 1)
@@ -9,7 +9,7 @@ class SlugulusEructo(DarkArtsCard):
             f"ALL heroes lose 1{constants.HEART} for each Creature in play")
 
     def _effect(self, game):
-        total = sum(1 for card in game.villain_deck.current if card.is_creature)
+        total = len(game.villain_deck.all_creatures)
         game.log(f"Slugulus Eructo: {total} Creatures in play")
         game.heroes.all_heroes.remove_hearts(game, total)
 
@@ -12,6 +12,6 @@ class Tarantallegra(DarkArtsCard):
         hero = game.heroes.active_hero
         hero.remove_hearts(game, 1)
         for villain in game.villain_deck.all_villains:
-            villain._max_damage_per_turn = 1
+            villain.limit_damage_per_turn(game, 1)
 
 CARDS_BY_NAME['Tarantallegra'] = Tarantallegra
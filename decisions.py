@@ -0,0 +1,135 @@
+from enum import Enum, auto
+
+import random
+
+
+class DecisionKind(Enum):
+    # Anything not covered below, mostly card effects picking between options
+    CHOICE = auto()
+    # Main turn menu: play, assign, buy, extra actions, end turn
+    ACTION = auto()
+    PLAY_CARD = auto()
+    ASSIGN_DAMAGE = auto()
+    ASSIGN_INFLUENCE = auto()
+    BUY = auto()
+    CHOOSE_HERO = auto()
+    DISCARD = auto()
+    BANISH = auto()
+    RECYCLE = auto()
+    # Yes/no questions, like ending the turn with cards left in hand
+    CONFIRM = auto()
+    ROLL_DIE = auto()
+
+
+class Decision(object):
+    def __init__(self, kind, prompt, choices, hero=None, legal=None):
+        self.kind = kind
+        self.prompt = prompt
+        # Every key the prompt accepts
+        self.choices = choices
+        self.hero = hero
+        # The choices the rules will actually carry out right now; the rest
+        # just log why not (no damage to assign, can't afford that) and ask again
+        self.legal = list(choices) if legal is None else legal
+
+    def __repr__(self):
+        return f"Decision({self.kind.name}, {self.prompt!r}, {self.choices!r})"
+
+
+class DecisionProvider(object):
+    def start_turn(self, game):
+        pass
+
+    def choose(self, game, decision):
+        raise NotImplementedError()
+
+
+class KeyboardProvider(DecisionProvider):
+    def __init__(self, renderer):
+        self._renderer = renderer
+
+    def choose(self, game, decision):
+        return self._renderer.read_key(game, decision.choices)
+
+
+class ScriptedProvider(DecisionProvider):
+    def __init__(self, answers):
+        self._answers = list(answers)
+        self._next = 0
+
+    def choose(self, game, decision):
+        if self._next >= len(self._answers):
+            raise ValueError(f"Programmer Error! Script ran out of answers at {decision}")
+        answer = self._answers[self._next]
+        self._next += 1
+        if answer not in decision.choices:
+            raise ValueError(f"Programmer Error! Scripted answer {answer!r} not valid for {decision}")
+        return answer
+
+
+class RandomProvider(DecisionProvider):
+    def __init__(self, seed=None):
+        self._random = random.Random(seed)
+
+    def choose(self, game, decision):
+        choices = list(decision.legal)
+        if decision.kind == DecisionKind.ACTION:
+            # Bots never quit
+            choices.remove('q')
+        return self._random.choice(choices)
+
+
+class GreedyProvider(DecisionProvider):
+    """Cheap bot: play everything, hit whatever is closest to defeat, buy the priciest card it can afford.
+
+    Anything it has no opinion on is answered at random.
+    """
+
+    def __init__(self, seed=None):
+        self._random = random.Random(seed)
+
+    def choose(self, game, decision):
+        if decision.kind == DecisionKind.ACTION:
+            return self._choose_action(game, decision.hero)
+        if decision.kind == DecisionKind.PLAY_CARD:
+            return 'a'
+        if decision.kind == DecisionKind.ASSIGN_DAMAGE:
+            return self._choose_foe(game, decision, lambda foe: foe._hearts - foe._damage)
+        if decision.kind == DecisionKind.ASSIGN_INFLUENCE:
+            return self._choose_foe(game, decision, lambda foe: foe._cost - foe._influence)
+        if decision.kind == DecisionKind.BUY:
+            return self._choose_buy(game, decision.hero)
+        if decision.kind == DecisionKind.CONFIRM:
+            return 'y'
+        if decision.kind == DecisionKind.RECYCLE:
+            return 'c'
+        # Only fall back on every key when the prompt didn't say which are legal
+        return self._random.choice(list(decision.legal) or list(decision.choices))
+
+    def _choose_action(self, game, hero):
+        if len(hero._hand) > 0:
+            return 'p'
+        if hero._damage_tokens > 0 and game.villain_deck.can_assign_damage(game):
+            return 'a'
+        if hero._influence_tokens > 0 and game.villain_deck.can_assign_influence(game):
+            return 'i'
+        if hero._influence_tokens > 0 and self._affordable(game, hero):
+            return 'b'
+        return 'e'
+
+    def _choose_foe(self, game, decision, remaining):
+        foes = [(remaining(game.villain_deck[key]), key) for key in decision.legal if key != 'c']
+        if len(foes) == 0:
+            return 'c'
+        return min(foes)[1]
+
+    def _affordable(self, game, hero):
+        market = game.hogwarts_deck
+        return [(market[i].cost, str(i)) for i in range(len(market._market))
+                if market[i].cost + hero._proficiency.cost_modifier(game, market[i]) <= hero._influence_tokens]
+
+    def _choose_buy(self, game, hero):
+        affordable = self._affordable(game, hero)
+        if len(affordable) == 0:
+            return 'c'
+        return max(affordable)[1]
@@ -0,0 +1,160 @@
+from collections import deque
+
+import curses
+
+import event_log
+
+# Long log lines are clipped to the window, same as the old 1000 column pad
+LOG_VIEW_WIDTH = 1000
+
+
+class DebugGame(Exception):
+    pass
+
+
+class NullRenderer(object):
+    """Renderer for headless games: no windows, nothing drawn, nothing logged."""
+
+    def layout(self, config, num_heroes):
+        return {}
+
+    def display_state(self, game, resize=False):
+        pass
+
+    def attach(self, events):
+        pass
+
+    def read_key(self, game, valid_choices):
+        raise ValueError("Programmer Error! Headless games cannot read keys")
+
+
+class CursesRenderer(object):
+    def __init__(self, window):
+        self._window = window
+        # [event, echoed key] for every line the log window can scroll back to
+        self._log_lines = deque(maxlen=1000)
+        self._last_shown_log_line = 0
+
+    def attach(self, events):
+        events.subscribe(self._on_event)
+
+    def layout(self, config, num_heroes):
+        window = self._window
+        window.noutrefresh()
+        windows = {}
+        if config['encounters']:
+            windows['locations'] = window.subwin(7, curses.COLS // 3, 0, 0)
+            windows['encounters'] = window.subwin(7, curses.COLS // 3, 0, curses.COLS // 3)
+            windows['dark_arts'] = window.subwin(7, curses.COLS // 3, 0, curses.COLS * 2 // 3)
+        else:
+            windows['locations'] = window.subwin(7, curses.COLS // 2, 0, 0)
+            windows['dark_arts'] = window.subwin(7, curses.COLS // 2, 0, curses.COLS // 2)
+
+        windows['villains'] = window.subwin(15, curses.COLS // 2, 7, 0)
+        windows['hogwarts'] = window.subwin(15, curses.COLS // 2, 7, curses.COLS // 2)
+
+        # self._heroes_height = 40 if num_heroes > 2 else 20
+        self._heroes_height = (curses.LINES - 22) // 4 * 3
+        windows['heroes'] = window.subwin(self._heroes_height, curses.COLS, 22, 0)
+
+        log_begin = 22 + self._heroes_height
+        self._log_window = window.subwin(curses.LINES - log_begin, curses.COLS, log_begin, 0)
+        self._init_log_window()
+        return windows
+
+    def _init_log_window(self):
+        self._log_window.box()
+        self._log_window.addstr(0, 1, "Log")
+        self._log_window.noutrefresh()
+        beg = self._log_window.getbegyx()
+        self._log_start_line = beg[0] + 1
+        self._log_start_col = beg[1] + 1
+        end = self._log_window.getmaxyx()
+        self._log_end_line = self._log_start_line + end[0] - 3
+        self._log_end_col = self._log_start_col + end[1] - 3
+        self._log_lines_to_show = self._log_end_line - self._log_start_line + 1
+        self._log_view = curses.newpad(max(self._log_lines_to_show, 1), LOG_VIEW_WIDTH)
+
+    def display_state(self, game, resize=False):
+        if resize:
+            curses.update_lines_cols()
+            self._log_window.resize(curses.LINES - 22 - self._heroes_height, curses.COLS)
+            self._init_log_window()
+            self._refresh_log()
+
+            game.hogwarts_deck._window.mvwin(7, curses.COLS // 2)
+            if game.encounters is None:
+                game.dark_arts_deck._window.mvwin(0, curses.COLS // 2)
+            else:
+                game.encounters._window.mvwin(0, curses.COLS // 3)
+                game.dark_arts_deck._window.mvwin(0, curses.COLS * 2 // 3)
+        if game.encounters is None:
+            game.locations.display_state(resize=resize, size=(7, curses.COLS // 2))
+            game.dark_arts_deck.display_state(resize=resize, size=(7, curses.COLS // 2))
+        else:
+            game.locations.display_state(resize=resize, size=(7, curses.COLS // 3))
+            game.encounters.display_state(resize=resize, size=(7, curses.COLS // 3))
+            game.dark_arts_deck.display_state(resize=resize, size=(7, curses.COLS // 3))
+        game.villain_deck.display_state(game, resize=resize, size=(15, curses.COLS // 2))
+        game.hogwarts_deck.display_state(resize=resize, size=(15, curses.COLS // 2))
+        game.heroes.display_state(game, resize=resize, size=(self._heroes_height, curses.COLS))
+        curses.doupdate()
+
+    def read_key(self, game, valid_choices):
+        while True:
+            try:
+                key = self._window.getkey()
+                if key == "KEY_F(1)":
+                    raise DebugGame()
+                if key == "KEY_UP":
+                    self.scroll_log_up()
+                    continue
+                if key == "KEY_DOWN":
+                    self.scroll_log_down()
+                    continue
+                if key == " ":
+                    self.scroll_log_to_bottom(game)
+                    continue
+                if key == "\t":
+                    game.heroes.next_display_mode()
+                    self.display_state(game)
+                    continue
+                if key in valid_choices:
+                    break
+
+            except curses.error:
+                self.display_state(game, True)
+        if self._log_lines:
+            self._log_lines[-1][1] += key
+            self._refresh_log()
+        return key
+
+    def _on_event(self, event):
+        self._log_lines.append([event, ""])
+        self._last_shown_log_line = len(self._log_lines)
+        self._refresh_log()
+
+    def scroll_log_up(self):
+        if max(self._last_shown_log_line - self._log_lines_to_show, 0) != 0:
+            self._last_shown_log_line -= 1
+        self._refresh_log()
+
+    def scroll_log_down(self):
+        self._last_shown_log_line = min(len(self._log_lines), self._last_shown_log_line + 1)
+        self._refresh_log()
+
+    def scroll_log_to_bottom(self, game):
+        self._last_shown_log_line = len(self._log_lines)
+        self._refresh_log()
+        self.display_state(game)
+
+    def _refresh_log(self):
+        # Only the events in view are ever formatted
+        self._log_view.erase()
+        first = max(self._last_shown_log_line - self._log_lines_to_show, 0)
+        for row, line in enumerate(range(first, self._last_shown_log_line)):
+            event, key = self._log_lines[line]
+            attr = curses.A_BOLD | curses.color_pair(1) if event.kind == event_log.PROMPT else curses.A_NORMAL
+            self._log_view.addnstr(row, 0, event.text + key, LOG_VIEW_WIDTH - 1, attr)
+        self._log_view.refresh(0,0, self._log_start_line,self._log_start_col, self._log_end_line,self._log_end_col)
+
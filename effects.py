@@ -0,0 +1,146 @@
+class EffectSources(object):
+    """Stack of the objects (cards, foes, encounters, ...) whose effects are resolving.
+
+    Use as `with game.effect_source(card): ...`; `game.effect_source.current`
+    is whatever pushed last, or None between effects. Callbacks also say which
+    trigger they're running for, for ProfiledEffectSources.
+    """
+
+    def __init__(self):
+        self._stack = []
+
+    def __call__(self, source, trigger=None):
+        self._stack.append(source)
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stack.pop()
+
+    @property
+    def current(self):
+        return self._stack[-1] if self._stack else None
+
+
+class ProfiledEffectSources(EffectSources):
+    """EffectSources that also times each effect on a profiling.Profiler.
+
+    A separate class so games that aren't being profiled don't pay for it.
+    """
+
+    def __init__(self, profiler):
+        super().__init__()
+        self._profiler = profiler
+
+    def __call__(self, source, trigger=None):
+        self._stack.append(source)
+        self._profiler.enter_source(source, trigger)
+        return self
+
+    def __exit__(self, *exc_info):
+        self._profiler.exit()
+        self._stack.pop()
+
+
+def owner(callback):
+    """The object a callback belongs to: the instance for bound methods, else the callback itself."""
+    return getattr(callback, '__self__', callback)
+
+
+# Triggers effects can wait on, and what they're called with (after game)
+ACQUIRE = 'acquire'                        # hero, card: a hero gained a card
+DISCARD = 'discard'                        # hero: a hero discarded a card
+HEARTS = 'hearts'                          # hero, amount, source: a hero's hearts changed
+CONTROL = 'control'                        # amount: the current location's control changed
+SHUFFLE = 'shuffle'                        # hero: a hero's discard is about to become their deck
+PLAY_CARD = 'play_card'                    # card: the hero played a card
+ASSIGN_DAMAGE = 'assign_damage'            # foe, amount: the hero assigned damage
+ASSIGN_INFLUENCE = 'assign_influence'      # foe, amount: the hero assigned influence
+DEFEAT_VILLAIN = 'defeat_villain'          # (nothing): the hero defeated a villain
+DEFEAT_CREATURE = 'defeat_creature'        # (nothing): the hero defeated a creature
+
+
+class Listeners(object):
+    """Callbacks waiting on triggers, kept per (trigger, subject).
+
+    The subject is whoever the trigger happens to (a hero, or the locations),
+    so running a trigger only looks at its own table, and adding or removing a
+    callback doesn't search anything. Callbacks run in the order they were
+    added, once per time they were added: two copies of a card can both wait
+    on the same trigger. Ones added with turn=True go away at the end of the
+    subject's turn.
+    """
+
+    def __init__(self):
+        self._next_token = 0
+        # {(trigger, subject): {token: callback}}, oldest first
+        self._tables = {}
+        # {(trigger, subject, callback): [token, ...]}, oldest first
+        self._tokens = {}
+        # {subject: [(trigger, token, callback), ...]} for turn-scoped callbacks
+        self._turn = {}
+
+    def add(self, trigger, subject, callback, turn=False):
+        token = self._next_token
+        self._next_token += 1
+        key = (trigger, subject)
+        table = self._tables.get(key)
+        if table is None:
+            table = self._tables[key] = {}
+        table[token] = callback
+        self._tokens.setdefault((trigger, subject, callback), []).append(token)
+        if turn:
+            self._turn.setdefault(subject, []).append((trigger, token, callback))
+
+    def remove(self, trigger, subject, callback):
+        """Remove the oldest time callback was added, like list.remove."""
+        tokens = self._tokens.get((trigger, subject, callback))
+        if not tokens:
+            raise ValueError(f"Programmer Error! {callback} isn't waiting on {trigger}")
+        self._drop(trigger, subject, callback, tokens[0])
+
+    def clear(self, trigger, subject):
+        """Remove everything waiting on trigger for subject."""
+        for token, callback in list(self._tables.get((trigger, subject), {}).items()):
+            self._drop(trigger, subject, callback, token)
+
+    def end_turn(self, subject):
+        for trigger, token, callback in self._turn.pop(subject, ()):
+            if token in self._tables.get((trigger, subject), ()):
+                self._drop(trigger, subject, callback, token)
+
+    def run(self, game, trigger, subject, *args):
+        key = (trigger, subject)
+        table = self._tables.get(key)
+        if not table:
+            return
+        # Callbacks can add or remove others (or themselves) as they go: ones
+        # added now wait for next time, and ones removed before their turn
+        # don't run. The table is looked up again each time since snapshots
+        # restored along the way (bot rollouts) replace it.
+        for token, callback in list(table.items()):
+            if token not in self._tables.get(key, ()):
+                continue
+            with game.effect_source(owner(callback), trigger):
+                callback(game, *args)
+
+    def adopt(self, other):
+        """Take over everything waiting in other, e.g. a hero's own from before the game started."""
+        turn_tokens = {token for entries in other._turn.values() for _, token, _ in entries}
+        for (trigger, subject), table in other._tables.items():
+            for token, callback in table.items():
+                self.add(trigger, subject, callback, turn=token in turn_tokens)
+
+    def _drop(self, trigger, subject, callback, token):
+        key = (trigger, subject)
+        table = self._tables[key]
+        del table[token]
+        if not table:
+            del self._tables[key]
+        key = (trigger, subject, callback)
+        tokens = self._tokens[key]
+        tokens.remove(token)
+        if not tokens:
+            del self._tokens[key]
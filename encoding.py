@@ -0,0 +1,264 @@
+from array import array
+from collections import deque
+
+import dark_arts
+import heroes
+import hogwarts
+import proficiencies
+import villains
+
+# Bump whenever the layout below changes
+ENCODING_VERSION = 1
+# Everything is stored a byte at a time
+_BYTE = 255
+
+
+def _card_classes():
+    classes = dict(hogwarts.CARDS_BY_NAME)
+    classes[hogwarts.Detention().name] = hogwarts.Detention
+    # Starting decks aren't in the registry, so deal one of each hero's
+    for hero_class in heroes.HEROES.values():
+        hero = hero_class(1, proficiencies.NullProficiency())
+        for card in hero._discard:
+            classes.setdefault(card.name, type(card))
+    return classes
+
+
+class _Tables(object):
+    """Card and foe IDs. Numbering everything imports every card and foe
+    module, so it's only done the first time something needs it (see _tables)."""
+
+    def __init__(self):
+        hogwarts_classes = _card_classes()
+        # Stable numbering (sorted by name), so IDs mean the same thing in every process
+        self.card_names = sorted(hogwarts_classes)
+        self.card_ids = {name: i for i, name in enumerate(self.card_names)}
+        self.dark_arts_names = sorted(dark_arts.CARDS_BY_NAME)
+        self.dark_arts_ids = {name: i for i, name in enumerate(self.dark_arts_names)}
+        # Foes go by class: some are registered under a different name than they
+        # show ("Dementor") or share a name with another ("Death Eater 2")
+        self.villain_classes = [villains.VILLAINS_BY_NAME[name] for name in sorted(villains.VILLAINS_BY_NAME)]
+        self.villain_ids = {cls: i for i, cls in enumerate(self.villain_classes)}
+
+        self.hogwarts_factories = [hogwarts_classes[name] for name in self.card_names]
+        self.dark_arts_factories = [dark_arts.CARDS_BY_NAME[name] for name in self.dark_arts_names]
+        for table in (self.card_names, self.dark_arts_names, self.villain_classes):
+            if len(table) > _BYTE:
+                raise ValueError(f"Programmer Error! {len(table)} IDs don't fit in a byte, bump ENCODING_VERSION and widen them")
+
+
+_TABLES = None
+
+
+def _tables():
+    global _TABLES
+    if _TABLES is None:
+        _TABLES = _Tables()
+    return _TABLES
+
+
+# The ID tables, for other modules, built on first use
+_PUBLIC_TABLES = {
+    'CARD_NAMES': 'card_names',
+    'CARD_IDS': 'card_ids',
+    'DARK_ARTS_NAMES': 'dark_arts_names',
+    'DARK_ARTS_IDS': 'dark_arts_ids',
+    'VILLAIN_CLASSES': 'villain_classes',
+    'VILLAIN_IDS': 'villain_ids',
+}
+
+
+def __getattr__(name):
+    if name in _PUBLIC_TABLES:
+        return getattr(_tables(), _PUBLIC_TABLES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _card_id(card):
+    return _tables().card_ids[card.name]
+
+
+def _dark_arts_id(card):
+    return _tables().dark_arts_ids[card.name]
+
+
+def _villain_id(foe):
+    return _tables().villain_ids[type(foe)]
+
+
+def encode(game):
+    """Pack the board into a few hundred bytes.
+
+    Covers what's on the table between effects: hero hearts, tokens and every
+    card zone (in order), foes and their damage, the villain, Hogwarts and
+    Dark Arts decks, the market and location control. Cards are stored as IDs
+    into the name registries, one byte each. Not covered: effects and
+    callbacks registered for the current turn, encounters and the random
+    number generator, so encodings taken at the same point in a turn can be
+    compared and stored, and decoded back onto a game of the same setup.
+    Boards with a zone of more than 255 cards, or any other value that
+    doesn't fit in its byte, raise ValueError.
+    """
+    try:
+        return _encode(game)
+    except OverflowError as e:
+        raise ValueError(f"Programmer Error! Board doesn't fit the encoding: {e}") from e
+
+
+def _encode(game):
+    tables = _tables()
+    out = array('B', [ENCODING_VERSION])
+    _put16(out, game.turns)
+    all_heroes = game.heroes._heroes
+    out.extend([len(all_heroes), game.heroes._current])
+    for hero in all_heroes:
+        out.extend([hero._hearts, hero._max_hearts, hero._damage_tokens, hero._influence_tokens, hero._cards_acquired])
+        for zone in (hero._deck, hero._hand, hero._play_area, hero._discard):
+            _put_cards(out, zone, _card_id)
+
+    villain_deck = game.villain_deck
+    _put_cards(out, villain_deck._deck, _villain_id)
+    out.append(len(villain_deck.current))
+    for foe in villain_deck.current:
+        out.append(_villain_id(foe))
+        _put_foe(out, foe, all_heroes)
+    _put_cards(out, villain_deck._discard, _villain_id)
+    if villain_deck._voldemort is not None:
+        _put_foe(out, villain_deck._voldemort, all_heroes)
+
+    locations = game.locations
+    out.append(locations._current)
+    out.extend(location._control for location in locations._locations)
+
+    market = game.hogwarts_deck
+    _put_cards(out, market._deck, _card_id)
+    out.append(len(market._market))
+    for name, cards in market._market.items():
+        out.extend([tables.card_ids[name], len(cards)])
+
+    dark_arts_deck = game.dark_arts_deck
+    for zone in (dark_arts_deck._deck, dark_arts_deck._discard, dark_arts_deck._played):
+        _put_cards(out, zone, _dark_arts_id)
+    return out.tobytes()
+
+
+def decode(data, game):
+    """Put an encoded board back onto a game set up the same way (config and heroes).
+
+    Card and foe objects the game already has are reused where the names
+    match, so their identity survives round trips; anything missing is
+    created fresh from its registry.
+    """
+    values = array('B')
+    values.frombytes(data)
+    reader = iter(values)
+    if next(reader) != ENCODING_VERSION:
+        raise ValueError(f"Programmer Error! Not a version {ENCODING_VERSION} encoding")
+    game.turns = _get16(reader)
+    all_heroes = game.heroes._heroes
+    if next(reader) != len(all_heroes):
+        raise ValueError("Programmer Error! Encoding is for a different number of heroes")
+    game.heroes._current = next(reader)
+
+    tables = _tables()
+    market = game.hogwarts_deck
+    hogwarts_pool = _Pool(tables.hogwarts_factories, _card_id)
+    for hero in all_heroes:
+        for zone in (hero._deck, hero._hand, hero._play_area, hero._discard):
+            hogwarts_pool.add(zone)
+    hogwarts_pool.add(market._deck)
+    for cards in market._market.values():
+        hogwarts_pool.add(cards)
+
+    for hero in all_heroes:
+        hero._hearts, hero._max_hearts, hero._damage_tokens, hero._influence_tokens, hero._cards_acquired = (
+            next(reader), next(reader), next(reader), next(reader), next(reader))
+        hero._deck = _get_cards(reader, hogwarts_pool)
+        hero._hand = _get_cards(reader, hogwarts_pool)
+        hero._play_area = _get_cards(reader, hogwarts_pool)
+        hero._discard = _get_cards(reader, hogwarts_pool)
+
+    villain_deck = game.villain_deck
+    villain_pool = _Pool(tables.villain_classes, _villain_id)
+    for zone in (villain_deck._deck, villain_deck.current, villain_deck._discard):
+        villain_pool.add(zone)
+    villain_deck._deck = _get_cards(reader, villain_pool)
+    villain_deck.current = []
+    for _ in range(next(reader)):
+        foe = villain_pool.take(next(reader))
+        _get_foe(reader, foe, all_heroes)
+        villain_deck.current.append(foe)
+    villain_deck._discard = _get_cards(reader, villain_pool)
+    if villain_deck._voldemort is not None:
+        _get_foe(reader, villain_deck._voldemort, all_heroes)
+    villain_deck._recount()
+
+    locations = game.locations
+    locations._current = next(reader)
+    for location in locations._locations:
+        location._control = next(reader)
+
+    market._deck = deque(_get_cards(reader, hogwarts_pool))
+    market._market.clear()
+    for _ in range(next(reader)):
+        card_id, count = next(reader), next(reader)
+        market._market[tables.card_names[card_id]] = [hogwarts_pool.take(card_id) for _ in range(count)]
+    market._slots_changed()
+
+    dark_arts_deck = game.dark_arts_deck
+    dark_arts_pool = _Pool(tables.dark_arts_factories, _dark_arts_id)
+    for zone in (dark_arts_deck._deck, dark_arts_deck._discard, dark_arts_deck._played):
+        dark_arts_pool.add(zone)
+    dark_arts_deck._deck = _get_cards(reader, dark_arts_pool)
+    dark_arts_deck._discard = _get_cards(reader, dark_arts_pool)
+    dark_arts_deck._played = _get_cards(reader, dark_arts_pool)
+
+
+class _Pool(object):
+    """Objects available for reuse while decoding, by ID."""
+
+    def __init__(self, factories, object_id):
+        self._factories = factories
+        self._object_id = object_id
+        self._free = {}
+
+    def add(self, objects):
+        for obj in objects:
+            self._free.setdefault(self._object_id(obj), []).append(obj)
+
+    def take(self, object_id):
+        free = self._free.get(object_id)
+        if free:
+            return free.pop()
+        return self._factories[object_id]()
+
+
+def _put16(out, value):
+    out.extend([value >> 8, value & 0xff])
+
+
+def _get16(reader):
+    return (next(reader) << 8) | next(reader)
+
+
+def _put_cards(out, cards, object_id):
+    if len(cards) > _BYTE:
+        raise ValueError(f"Programmer Error! {len(cards)} cards in one zone don't fit the encoding")
+    out.append(len(cards))
+    out.extend(object_id(card) for card in cards)
+
+
+def _get_cards(reader, pool):
+    return [pool.take(next(reader)) for _ in range(next(reader))]
+
+
+def _put_foe(out, foe, all_heroes):
+    stunned_by = all_heroes.index(foe._stunned_by) + 1 if foe._stunned_by is not None else 0
+    out.extend([foe._damage, foe._influence, foe._took_damage, foe._took_influence, int(foe._stunned), stunned_by])
+
+
+def _get_foe(reader, foe, all_heroes):
+    foe._damage, foe._influence, foe._took_damage, foe._took_influence = next(reader), next(reader), next(reader), next(reader)
+    foe._stunned = bool(next(reader))
+    stunned_by = next(reader)
+    foe._stunned_by = all_heroes[stunned_by - 1] if stunned_by else None
@@ -0,0 +1,23 @@
+# Generated by registry.py from the modules in this package; don't edit by hand.
+# After adding, renaming or removing a card, run: python3 registry.py
+
+ENCOUNTERS_BY_NAME = {
+    "Cup": "horcruxes",
+    "Defensive Training": "monster_box_two",
+    "Diadem": "horcruxes",
+    "Diary": "horcruxes",
+    "Escape!": "monster_box_three",
+    "Filthy Half-Breed": "monster_box_three",
+    "Forbidden Forest": "monster_box_three",
+    "Full Moon Rises": "monster_box_two",
+    "Locket": "horcruxes",
+    "Nagini": "horcruxes",
+    "Peskipiksi Pesternomi": "monster_box_one",
+    "Ring": "horcruxes",
+    "Students Out of Bed": "monster_box_one",
+    "The First Task": "monster_box_four",
+    "The Second Task": "monster_box_four",
+    "The Third Task": "monster_box_four",
+    "Third Floor Corridor": "monster_box_one",
+    "Unregistered Animagus": "monster_box_two",
+}
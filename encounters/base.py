@@ -4,9 +4,14 @@ import curses
 import operator
 
 import constants
+import event_log
+import registry
+import state
 
+from ._registry import ENCOUNTERS_BY_NAME as _ENCOUNTER_MODULES
 
-ENCOUNTERS_BY_NAME = {}
+
+ENCOUNTERS_BY_NAME = registry.Registry(__package__, _ENCOUNTER_MODULES)
 
 
 # In game 7 these are Horcurxes, but in the expansions the concept is generalized into Encounters.
@@ -15,8 +20,11 @@ class EncountersDeck(object):
         self._title = config['title']
         self._null_encounter = NullEncounter(self._title, config['complete'])
         self._window = window
-        self._init_window()
-        self._pad = curses.newpad(100, 100)
+        if self._window is not None:
+            self._init_window()
+            self._pad = curses.newpad(100, 100)
+        # What the panel last drew, to skip redrawing when nothing changed
+        self._displayed = None
 
         self._deck = [ENCOUNTERS_BY_NAME[name]() for name in config['deck']]
         self._current = self._deck.pop(0)
@@ -33,15 +41,21 @@ class EncountersDeck(object):
         self._pad_end_col = self._pad_start_col + end[1] - 3
 
     def display_state(self, resize=False, size=None):
+        if self._window is None:
+            return
         if resize:
             self._window.resize(*size)
             self._window.clear()
             self._init_window()
-        self._window.clear()
+        key = (len(self._deck), id(self._current), state.fingerprint(self._current))
+        if not resize and key == self._displayed:
+            return
+        self._displayed = key
+        self._window.erase()
         self._window.box()
         self._window.addstr(0, 1, f"{self._title} ({len(self._deck)} left)")
         self._window.noutrefresh()
-        self._pad.clear()
+        self._pad.erase()
         self.current.display_state(self._pad)
         self._pad.noutrefresh(0,0, self._pad_start_line,self._pad_start_col, self._pad_end_line,self._pad_end_col)
 
@@ -59,9 +73,10 @@ class EncountersDeck(object):
         return self._current == self._null_encounter or self._current.completed
 
     def play_turn(self, game):
-        game.log(f"-----{self._title} phase-----")
+        game.log("-----{title} phase-----", event_log.PHASE, title=self._title)
         game.log(str(self._current))
-        self._current.effect(game)
+        with game.effect_source(self._current):
+            self._current.effect(game)
 
     def check_completion(self, game):
         self._current.end_turn(game)
@@ -69,10 +84,13 @@ class EncountersDeck(object):
             return
         game.heroes.active_hero.add_encounter(game, self._current)
         self._current = self._deck.pop(0) if len(self._deck) > 0 else self._null_encounter
-        self._current.on_reveal(game)
+        with game.effect_source(self._current):
+            self._current.on_reveal(game)
 
 
 class Encounter(object):
+    __slots__ = ('name', 'description', 'required_villains', 'reward_str', 'completed', '_complete_str')
+
     def __init__(self, name, description, reward_str, required_villains):
         self.name = name
         self.description = description
@@ -118,6 +136,8 @@ class Encounter(object):
 
 
 class NullEncounter(Encounter):
+    __slots__ = ('_title',)
+
     def __init__(self, title, complete_str):
         super().__init__("NullEncounter", "No encounter", "No reward", [])
         self._title = title
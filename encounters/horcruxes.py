@@ -6,12 +6,16 @@ import constants
 
 
 class Horcrux(Encounter):
+    __slots__ = ()
+
     def __init__(self, name, description, reward_str):
         super().__init__(name, description, reward_str, [])
         self._complete_str = "destroy"
 
 
 class Diary(Horcrux):
+    __slots__ = ('_allies_played', '_used_ability')
+
     def __init__(self):
         super().__init__(
             "Diary",
@@ -66,6 +70,8 @@ ENCOUNTERS_BY_NAME['Diary'] = Diary
 
 
 class Ring(Horcrux):
+    __slots__ = ('_damaged_villains', '_used_ability', '_used_villains')
+
     def __init__(self):
         super().__init__(
             "Ring",
@@ -105,18 +111,22 @@ class Ring(Horcrux):
 
     def reward_effect(self, game):
         self._used_ability = False
-        game.heroes.active_hero.add_action(game, 'R', "(R)ing", self.__reward_action)
+        game.heroes.active_hero.add_action(game, 'R', "(R)ing", self.__reward_action, self.__reward_unavailable)
 
-    def __reward_action(self, game):
+    def __reward_unavailable(self, game):
         if self._used_ability:
-            game.log(f"{self.name} already used this turn")
-            return
+            return f"{self.name} already used this turn"
+        if len(game.heroes.active_hero._hand) < 2:
+            return f"Not enough cards in hand to use {self.name}"
+        return None
 
-        hero = game.heroes.active_hero
-        if len(hero._hand) < 2:
-            game.log(f"Not enough cards in hand to use {self.name}")
+    def __reward_action(self, game):
+        reason = self.__reward_unavailable(game)
+        if reason is not None:
+            game.log(reason)
             return
 
+        hero = game.heroes.active_hero
         choices = ['c'] + [str(i) for i in range(len(hero._hand))]
         first = game.input(f"Choose first card for {hero.name} to discard or (c)ancel: ", choices)
         if first == 'c':
@@ -144,6 +154,8 @@ ENCOUNTERS_BY_NAME['Ring'] = Ring
 
 
 class Locket(Horcrux):
+    __slots__ = ('_got_damage', '_got_heart', '_used_ability')
+
     def __init__(self):
         super().__init__(
             "Locket",
@@ -186,18 +198,22 @@ class Locket(Horcrux):
 
     def reward_effect(self, game):
         self._used_ability = False
-        game.heroes.active_hero.add_action(game, 'L', "(L)ocket", self.__reward_action)
+        game.heroes.active_hero.add_action(game, 'L', "(L)ocket", self.__reward_action, self.__reward_unavailable)
 
-    def __reward_action(self, game):
+    def __reward_unavailable(self, game):
         if self._used_ability:
-            game.log(f"{self.name} already used this turn")
-            return
+            return f"{self.name} already used this turn"
+        if len(game.heroes.active_hero._hand) < 1:
+            return f"Not enough cards in hand to use {self.name}"
+        return None
 
-        hero = game.heroes.active_hero
-        if len(hero._hand) < 1:
-            game.log(f"Not enough cards in hand to use {self.name}")
+    def __reward_action(self, game):
+        reason = self.__reward_unavailable(game)
+        if reason is not None:
+            game.log(reason)
             return
 
+        hero = game.heroes.active_hero
         choices = ['c'] + [str(i) for i in range(len(hero._hand))]
         choice = game.input(f"Choose card for {hero.name} to discard or (c)ancel: ", choices)
         if choice == 'c':
@@ -211,6 +227,8 @@ ENCOUNTERS_BY_NAME['Locket'] = Locket
 
 
 class Cup(Horcrux):
+    __slots__ = ('_got_heart', '_got_influence', '_used_ability')
+
     def __init__(self):
         super().__init__(
             "Cup",
@@ -249,18 +267,22 @@ class Cup(Horcrux):
 
     def reward_effect(self, game):
         self._used_ability = False
-        game.heroes.active_hero.add_action(game, 'C', "(C)up", self.__reward_action)
+        game.heroes.active_hero.add_action(game, 'C', "(C)up", self.__reward_action, self.__reward_unavailable)
 
-    def __reward_action(self, game):
+    def __reward_unavailable(self, game):
         if self._used_ability:
-            game.log(f"{self.name} already used this turn")
-            return
+            return f"{self.name} already used this turn"
+        if len(game.heroes.active_hero._hand) < 1:
+            return f"Not enough cards in hand to use {self.name}"
+        return None
 
-        hero = game.heroes.active_hero
-        if len(hero._hand) < 1:
-            game.log(f"Not enough cards in hand to use {self.name}")
+    def __reward_action(self, game):
+        reason = self.__reward_unavailable(game)
+        if reason is not None:
+            game.log(reason)
             return
 
+        hero = game.heroes.active_hero
         choices = ['c'] + [str(i) for i in range(len(hero._hand))]
         choice = game.input(f"Choose card for {hero.name} to discard or (c)ancel: ", choices)
         if choice == 'c':
@@ -274,6 +296,8 @@ ENCOUNTERS_BY_NAME['Cup'] = Cup
 
 
 class Diadem(Horcrux):
+    __slots__ = ('_got_card', '_got_damage', '_used_ability')
+
     def __init__(self):
         super().__init__(
             "Diadem",
@@ -309,27 +333,31 @@ class Diadem(Horcrux):
 
     def effect(self, game):
         hero = game.heroes.active_hero
-        allies = sum(1 for card in hero._hand if card.is_ally())
-        items = sum(1 for card in hero._hand if card.is_item())
-        spells = sum(1 for card in hero._hand if card.is_spell())
+        allies = hero._hand.count_allies()
+        items = hero._hand.count_items()
+        spells = hero._hand.count_spells()
         if allies >= 1 and items >= 1 and spells >= 1:
             game.log(f"{self.name}: {hero.name} has at least one ally, item, and spell; loses 2{constants.HEART}")
             hero.remove_hearts(game, 2)
 
     def reward_effect(self, game):
         self._used_ability = False
-        game.heroes.active_hero.add_action(game, 'D', "(D)iadem", self.__reward_action)
+        game.heroes.active_hero.add_action(game, 'D', "(D)iadem", self.__reward_action, self.__reward_unavailable)
 
-    def __reward_action(self, game):
+    def __reward_unavailable(self, game):
         if self._used_ability:
-            game.log(f"{self.name} already used this turn")
-            return
+            return f"{self.name} already used this turn"
+        if len(game.heroes.active_hero._hand) < 1:
+            return f"Not enough cards in hand to use {self.name}"
+        return None
 
-        hero = game.heroes.active_hero
-        if len(hero._hand) < 1:
-            game.log(f"Not enough cards in hand to use {self.name}")
+    def __reward_action(self, game):
+        reason = self.__reward_unavailable(game)
+        if reason is not None:
+            game.log(reason)
             return
 
+        hero = game.heroes.active_hero
         choices = ['c'] + [str(i) for i in range(len(hero._hand))]
         choice = game.input(f"Choose card for {hero.name} to discard or (c)ancel: ", choices)
         if choice == 'c':
@@ -343,6 +371,8 @@ ENCOUNTERS_BY_NAME['Diadem'] = Diadem
 
 
 class Nagini(Horcrux):
+    __slots__ = ('_got_card', '_got_damage', '_got_heart')
+
     def __init__(self):
         super().__init__(
             "Nagini",
@@ -390,11 +420,17 @@ class Nagini(Horcrux):
         game.heroes.active_hero.allow_healing(game)
 
     def reward_effect(self, game):
-        game.heroes.active_hero.add_action(game, 'N', "(N)agini", self.__reward_action)
+        game.heroes.active_hero.add_action(game, 'N', "(N)agini", self.__reward_action, self.__reward_unavailable)
 
-    def __reward_action(self, game):
+    def __reward_unavailable(self, game):
         if not game.locations.can_remove_control:
-            game.log(f"{constants.CONTROL} cannot be removed! {self.name} not discarded")
+            return f"{constants.CONTROL} cannot be removed! {self.name} not discarded"
+        return None
+
+    def __reward_action(self, game):
+        reason = self.__reward_unavailable(game)
+        if reason is not None:
+            game.log(reason)
             return
         game.log(f"{self.name} discarded to remove 3{constants.CONTROL}")
         game.heroes.active_hero._encounters.remove(self)
@@ -6,6 +6,8 @@ import constants
 
 
 class TheFirstTask(Encounter):
+    __slots__ = ('_damaged_foes', '_influence_spent', '_used_ability')
+
     def __init__(self):
         super().__init__(
             "The First Task",
@@ -78,6 +80,8 @@ ENCOUNTERS_BY_NAME['The First Task'] = TheFirstTask
 
 
 class TheSecondTask(Encounter):
+    __slots__ = ('_allies_acquired',)
+
     def __init__(self):
         super().__init__(
             "The Second Task",
@@ -106,7 +110,7 @@ class TheSecondTask(Encounter):
     def effect(self, game):
         self._allies_acquired = 0
         hero = game.heroes.active_hero
-        allies = sum(1 for card in hero._hand if card.is_ally())
+        allies = hero._hand.count_allies()
         if allies == 0:
             game.log(f"{self.name}: {game.heroes.active_hero.name} doesn't have an Ally, adding 1{constants.CONTROL}")
             game.locations.add_control(game)
@@ -125,6 +129,8 @@ ENCOUNTERS_BY_NAME['The Second Task'] = TheSecondTask
 
 
 class TheThirdTask(Encounter):
+    __slots__ = ('_got_heart',)
+
     def __init__(self):
         super().__init__(
             "The Third Task",
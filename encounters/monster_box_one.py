@@ -5,6 +5,8 @@ import constants
 
 
 class PeskipiksiPesternomi(Encounter):
+    __slots__ = ('_played_cards',)
+
     def __init__(self):
         super().__init__(
             "Peskipiksi Pesternomi",
@@ -50,6 +52,8 @@ ENCOUNTERS_BY_NAME['Peskipiksi Pesternomi'] = PeskipiksiPesternomi
 
 
 class StudentsOutOfBed(Encounter):
+    __slots__ = ('_got_card', '_got_heart')
+
     def __init__(self):
         super().__init__(
             "Students Out of Bed",
@@ -109,6 +113,8 @@ ENCOUNTERS_BY_NAME['Students Out of Bed'] = StudentsOutOfBed
 
 
 class ThirdFloorCorridor(Encounter):
+    __slots__ = ('_played_allies', '_played_items', '_played_spells')
+
     def __init__(self):
         super().__init__(
             "Third Floor Corridor",
@@ -5,6 +5,8 @@ import constants
 
 
 class ForbiddenForest(Encounter):
+    __slots__ = ('_got_card', '_got_heart', '_got_influence')
+
     def __init__(self):
         super().__init__(
             "Forbidden Forest",
@@ -46,7 +48,7 @@ class ForbiddenForest(Encounter):
             self.completed = True
 
     def effect(self, game):
-        creatures = sum(1 for card in game.villain_deck.current if card.is_creature)
+        creatures = len(game.villain_deck.all_creatures)
         if creatures >= 2:
             game.log(f"{self.name}: {creatures} creatures in play! {game.heroes.active_hero.name} loses 1{constants.HEART}")
             game.heroes.active_hero.remove_hearts(game)
@@ -58,6 +60,8 @@ ENCOUNTERS_BY_NAME['Forbidden Forest'] = ForbiddenForest
 
 
 class FilthyHalfBreed(Encounter):
+    __slots__ = ('_played_costs',)
+
     def __init__(self):
         super().__init__(
             "Filthy Half-Breed",
@@ -102,6 +106,8 @@ ENCOUNTERS_BY_NAME['Filthy Half-Breed'] = FilthyHalfBreed
 
 
 class Escape(Encounter):
+    __slots__ = ('_spells_played',)
+
     def __init__(self):
         super().__init__(
             "Escape!",
@@ -133,11 +139,17 @@ class Escape(Encounter):
             self.completed = True
 
     def reward_effect(self, game):
-        game.heroes.active_hero.add_action(game, 'E', "(E)scape", self.__reward_action)
+        game.heroes.active_hero.add_action(game, 'E', "(E)scape", self.__reward_action, self.__reward_unavailable)
 
-    def __reward_action(self, game):
+    def __reward_unavailable(self, game):
         if not game.locations.can_remove_control:
-            game.log(f"{constants.CONTROL} cannot be removed! {self.name} not discarded")
+            return f"{constants.CONTROL} cannot be removed! {self.name} not discarded"
+        return None
+
+    def __reward_action(self, game):
+        reason = self.__reward_unavailable(game)
+        if reason is not None:
+            game.log(reason)
             return
         game.log(f"{self.name} discarded; remove 2{constants.CONTROL}")
         game.locations.remove_control(game, 2)
@@ -5,6 +5,8 @@ import constants
 
 
 class UnregisteredAnimagus(Encounter):
+    __slots__ = ('_damage_assigned',)
+
     def __init__(self):
         super().__init__(
             "Unregistered Animagus",
@@ -48,6 +50,8 @@ ENCOUNTERS_BY_NAME['Unregistered Animagus'] = UnregisteredAnimagus
 
 
 class FullMoonRises(Encounter):
+    __slots__ = ('_foes_defeated',)
+
     def __init__(self):
         super().__init__(
             "Full Moon Rises",
@@ -101,6 +105,8 @@ ENCOUNTERS_BY_NAME['Full Moon Rises'] = FullMoonRises
 
 
 class DefensiveTraining(Encounter):
+    __slots__ = ('_got_damage',)
+
     def __init__(self):
         super().__init__(
             "Defensive Training",
@@ -0,0 +1,134 @@
+import threading
+
+import decisions
+import game
+
+
+class _Abandoned(BaseException):
+    # BaseException so rules code catching Exception can't swallow it
+    pass
+
+
+_ABANDON = object()
+
+
+class _Handoff(decisions.DecisionProvider):
+    """Parks the game's thread at every decision until the caller sends an answer."""
+
+    def __init__(self):
+        # Plain locks used as binary semaphores: each side releases the lock
+        # the other is waiting on. Much cheaper than threading.Semaphore.
+        self._to_caller = threading.Lock()
+        self._to_caller.acquire()
+        self._to_game = threading.Lock()
+        self._to_game.acquire()
+        self.decision = None
+        self.answer = None
+
+    def choose(self, game, decision):
+        self.decision = decision
+        self._to_caller.release()
+        self._to_game.acquire()
+        self.decision = None
+        if self.answer is _ABANDON:
+            raise _Abandoned()
+        return self.answer
+
+    def resume(self, answer):
+        self.answer = answer
+        self._to_game.release()
+        self._to_caller.acquire()
+
+
+class SteppedGame(object):
+    """A headless game that stops at every decision and waits to be told what to do.
+
+    This is a stepped, batched-decision API, not a single-threaded coroutine
+    engine: every unfinished game holds an OS thread of its own. The rules code
+    asks for decisions with blocking game.input() calls from deep inside card
+    effects, and suspending those without a thread would mean rewriting them
+    (and everything that calls them) as generators. Control is handed back and
+    forth explicitly and only one side ever runs at a time, so games
+    interleaved from one scheduler need no locking of game state and still play
+    out exactly as they would on their own.
+
+        stepped = SteppedGame(config, hero_specs, seed=1)
+        while not stepped.done:
+            stepped.send(answer_for(stepped.game, stepped.decision))
+    """
+
+    def __init__(self, config, hero_specs, seed=None, max_turns=None, log_events=False):
+        self._handoff = _Handoff()
+        self.game = game.Game(config, game.create_heroes(config, hero_specs), decision_provider=self._handoff, seed=seed)
+        self.game.events.enabled = log_events
+        self._max_turns = max_turns
+        self.done = False
+        self.won = None
+        self.error = None
+        self._thread = threading.Thread(target=self._play, daemon=True)
+        self._thread.start()
+        self._handoff._to_caller.acquire()
+
+    @property
+    def decision(self):
+        """The decision the game is waiting on, or None once it's over."""
+        return self._handoff.decision
+
+    @property
+    def outcome(self):
+        # Still playing, or abandoned by close()
+        if not self.done or (self.won is None and self.error is None):
+            return None
+        if self.error is not None:
+            return 'error'
+        if self.won:
+            return 'win'
+        if self._max_turns is not None and self.game.turns >= self._max_turns:
+            return 'timeout'
+        return 'loss'
+
+    def send(self, answer):
+        """Answer the pending decision and run the game up to its next one."""
+        if self.done:
+            raise ValueError("Programmer Error! Game is already over")
+        self._handoff.resume(answer)
+        return self.decision
+
+    def close(self):
+        """Give up on an unfinished game, letting its thread finish."""
+        if not self.done:
+            self._handoff.resume(_ABANDON)
+        self._thread.join()
+
+    def _play(self):
+        try:
+            self.won = self.game.play(self._max_turns)
+        except _Abandoned:
+            pass
+        except Exception as e:
+            self.error = e
+        finally:
+            self.done = True
+            self._handoff._to_caller.release()
+
+
+def run(stepped_games, choose):
+    """Play stepped games to the end, answering all their pending decisions in batches.
+
+    choose gets a list of (game, decision) pairs, one per unfinished game, and
+    returns the answers in the same order, so a policy that can evaluate many
+    positions at once sees them all together.
+    """
+    playing = [stepped for stepped in stepped_games if not stepped.done]
+    while playing:
+        answers = choose([(stepped.game, stepped.decision) for stepped in playing])
+        for stepped, answer in zip(playing, answers):
+            stepped.send(answer)
+        playing = [stepped for stepped in playing if not stepped.done]
+
+
+def batched(provider):
+    """Adapt a one-at-a-time decision provider to run's batched interface."""
+    def choose(pending):
+        return [provider.choose(game, decision) for game, decision in pending]
+    return choose
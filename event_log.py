@@ -0,0 +1,94 @@
+from collections import deque
+
+
+# Event kinds, for subscribers that only care about some of them
+MESSAGE = 'message'
+PROMPT = 'prompt'
+PHASE = 'phase'
+PLAY_CARD = 'play_card'
+DARK_ARTS = 'dark_arts'
+VILLAIN = 'villain'
+MARKET = 'market'
+BUY = 'buy'
+DRAW = 'draw'
+DISCARD = 'discard'
+HEARTS = 'hearts'
+STUN = 'stun'
+
+
+class Event(object):
+    """Something that happened in the game: a kind, a str.format template and its fields.
+
+    The text is only built when somebody asks for it, so headless games that
+    never look at their log never pay for formatting. Fields are formatted
+    when read, not when logged, so pass values that won't change afterwards
+    (numbers, names, cards) rather than live game objects.
+    """
+
+    def __init__(self, kind, template, fields):
+        self.kind = kind
+        self.template = template
+        self.fields = fields
+        self._text = None
+
+    @property
+    def text(self):
+        if self._text is None:
+            self._text = self.template.format(**self.fields) if self.fields else self.template
+        return self._text
+
+    def __str__(self):
+        return self.text
+
+    def __repr__(self):
+        return f"Event({self.kind!r}, {self.template!r}, {self.fields!r})"
+
+    def as_dict(self):
+        return {'kind': self.kind, 'text': self.text, 'fields': {name: str(value) for name, value in (self.fields or {}).items()}}
+
+
+class EventLog(object):
+    """The last `capacity` events of a game, with hooks for anyone who wants them as they happen.
+
+    Disabled logs drop events on the floor without building them, for
+    headless games and bot rollouts that nobody will read.
+    """
+
+    def __init__(self, capacity=1000, enabled=True):
+        self._events = deque(maxlen=capacity)
+        self._subscribers = []
+        self.enabled = enabled
+
+    def __len__(self):
+        return len(self._events)
+
+    def __iter__(self):
+        return iter(self._events)
+
+    def __getitem__(self, index):
+        return self._events[index]
+
+    @property
+    def capacity(self):
+        return self._events.maxlen
+
+    def subscribe(self, callback):
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        self._subscribers.remove(callback)
+
+    def emit(self, kind, template, fields=None):
+        if not self.enabled:
+            return None
+        event = Event(kind, template, fields)
+        self._events.append(event)
+        for callback in self._subscribers:
+            callback(event)
+        return event
+
+    def clear(self):
+        self._events.clear()
+
+    def export(self):
+        return [event.as_dict() for event in self._events]
@@ -2,186 +2,136 @@
 
 from datetime import datetime
 from pathlib import Path
-from yaml import safe_load
 
 import argparse
 import curses
 import random
 
+import configs
 import constants
 import dark_arts
+import decisions
+import display
+import effects
 import encounters
+import event_log
 import heroes
 import hogwarts
 import locations
+import mcts
 import proficiencies
+import profiling
+import state
+import traces
 import villains
 
-class DebugGame(Exception):
-    pass
-
-
 class Game(object):
-    def __init__(self, window, config, chosen_heroes):
-        self._window = window
-        self._window.noutrefresh()
+    def __init__(self, config, chosen_heroes, renderer=None, decision_provider=None, seed=None, profiler=None):
+        config = configs.definition(config)
+        self.rng = random.Random(seed)
+        self._renderer = renderer if renderer is not None else display.NullRenderer()
+        self._decision_provider = decision_provider if decision_provider is not None else decisions.KeyboardProvider(self._renderer)
+        if profiler is not None:
+            self.profiler = profiler
+            self.effect_source = effects.ProfiledEffectSources(profiler)
+        else:
+            self.profiler = profiling.NullProfiler()
+            self.effect_source = effects.EffectSources()
+        # Everything waiting on something to happen to a hero or the locations
+        self.listeners = effects.Listeners()
+        self.events = event_log.EventLog()
+        self._renderer.attach(self.events)
+        windows = self._renderer.layout(config, len(chosen_heroes))
         if config['encounters']:
-            locations_window = window.subwin(7, curses.COLS // 3, 0, 0)
-            enounters_window = window.subwin(7, curses.COLS // 3, 0, curses.COLS // 3)
-            dark_arts_window = window.subwin(7, curses.COLS // 3, 0, curses.COLS * 2 // 3)
-            self.encounters = encounters.EncountersDeck(enounters_window, config['encounters'])
+            self.encounters = encounters.EncountersDeck(windows.get('encounters'), config['encounters'])
         else:
-            locations_window = window.subwin(7, curses.COLS // 2, 0, 0)
-            dark_arts_window = window.subwin(7, curses.COLS // 2, 0, curses.COLS // 2)
             self.encounters = None
 
-        self.locations = locations.Locations(locations_window, config['locations'], len(chosen_heroes))
-        self.dark_arts_deck = dark_arts.DarkArtsDeck(dark_arts_window, config['dark_arts_deck'])
-
-        villains_window = window.subwin(15, curses.COLS // 2, 7, 0)
-        self.villain_deck = villains.VillainDeck(villains_window, config['villains_deck'], self.encounters)
-
-        hogwarts_window = window.subwin(15, curses.COLS // 2, 7, curses.COLS // 2)
-        self.hogwarts_deck = hogwarts.HogwartsDeck(hogwarts_window, config['hogwarts_deck'])
-
-        # self._heroes_height = 40 if len(chosen_heroes) > 2 else 20
-        self._heroes_height = (curses.LINES - 22) // 4 * 3
-        self._heroes_window = window.subwin(self._heroes_height, curses.COLS, 22, 0)
-        self.heroes = heroes.Heroes(self._heroes_window, chosen_heroes)
-
-        log_begin = 22 + self._heroes_height
-        self._log_window = window.subwin(curses.LINES - log_begin, curses.COLS, log_begin, 0)
-        self._init_log_window()
-        self._last_log_line = 0
-        self._log_pad = curses.newpad(1000, 1000)
-        self._log_pad.scrollok(True)
+        self.locations = locations.Locations(windows.get('locations'), config['locations'], len(chosen_heroes), self.listeners)
+        self.dark_arts_deck = dark_arts.DarkArtsDeck(windows.get('dark_arts'), config.dark_arts_cards(), self.rng)
+        self.villain_deck = villains.VillainDeck(windows.get('villains'), config['villains_deck'], self.encounters, self.rng)
+        self.hogwarts_deck = hogwarts.HogwartsDeck(windows.get('hogwarts'), config.hogwarts_cards(), self.rng)
+        self.heroes = heroes.Heroes(windows.get('heroes'), chosen_heroes, self.listeners)
 
         if self.encounters is not None:
-            self.encounters._current.on_reveal(self)
+            with self.effect_source(self.encounters._current):
+                self.encounters._current.on_reveal(self)
         self.villain_deck.reveal(self)
         self.hogwarts_deck.refill_market(self)
         self._active_hero = 0
+        self.turns = 0
         self.heroes.all_heroes.draw(self, 5, True)
 
         if self.heroes._harry:
             self.locations.add_control_callback(self, self.heroes._harry)
 
-    def _init_log_window(self):
-        self._log_window.box()
-        self._log_window.addstr(0, 1, "Log")
-        self._log_window.noutrefresh()
-        beg = self._log_window.getbegyx()
-        self._log_start_line = beg[0] + 1
-        self._log_start_col = beg[1] + 1
-        end = self._log_window.getmaxyx()
-        self._log_end_line = self._log_start_line + end[0] - 3
-        self._log_end_col = self._log_start_col + end[1] - 3
-        self._log_lines_to_show = self._log_end_line - self._log_start_line + 1
+    def snapshot(self):
+        return state.snapshot(self, skip=('_renderer', '_decision_provider', 'rng', 'events', 'profiler'), extra=self.rng.getstate())
+
+    def restore(self, snapshot):
+        state.restore(snapshot)
+        self.rng.setstate(snapshot.extra)
 
     def display_state(self, resize=False):
-        if resize:
-            curses.update_lines_cols()
-            self._log_window.resize(curses.LINES - 22 - self._heroes_height, curses.COLS)
-            self._init_log_window()
-            self._refresh_log()
-
-            self.hogwarts_deck._window.mvwin(7, curses.COLS // 2)
-            if self.encounters is None:
-                self.dark_arts_deck._window.mvwin(0, curses.COLS // 2)
-            else:
-                self.encounters._window.mvwin(0, curses.COLS // 3)
-                self.dark_arts_deck._window.mvwin(0, curses.COLS * 2 // 3)
-        if self.encounters is None:
-            self.locations.display_state(resize=resize, size=(7, curses.COLS // 2))
-            self.dark_arts_deck.display_state(resize=resize, size=(7, curses.COLS // 2))
-        else:
-            self.locations.display_state(resize=resize, size=(7, curses.COLS // 3))
-            self.encounters.display_state(resize=resize, size=(7, curses.COLS // 3))
-            self.dark_arts_deck.display_state(resize=resize, size=(7, curses.COLS // 3))
-        self.villain_deck.display_state(self, resize=resize, size=(15, curses.COLS // 2))
-        self.hogwarts_deck.display_state(resize=resize, size=(15, curses.COLS // 2))
-        self.heroes.display_state(self, resize=resize, size=(self._heroes_height, curses.COLS))
-        curses.doupdate()
-
-    def input(self, message, valid_choices=None):
+        self._renderer.display_state(self, resize)
+
+    def input(self, message, valid_choices=None, kind=decisions.DecisionKind.CHOICE, hero=None, legal=None):
         if isinstance(valid_choices, range):
             valid_choices = [str(i) for i in valid_choices]
         if valid_choices is None or len(valid_choices) == 0:
             raise ValueError("Programmer Error! no valid choices")
-        self.log(message, curses.A_BOLD | curses.color_pair(1))
+        if hero is None:
+            hero = self.heroes.active_hero
+        self.events.emit(event_log.PROMPT, message)
         self.display_state()
-        while True:
+        with self.profiler.frame("decision", kind.name):
+            return self._decision_provider.choose(self, decisions.Decision(kind, message, valid_choices, hero, legal))
+
+    def log(self, message, kind=event_log.MESSAGE, **fields):
+        self.events.emit(kind, message, fields)
+
+    def play(self, max_turns=None):
+        while max_turns is None or self.turns < max_turns:
             try:
-                key = self._window.getkey()
-                if key == "KEY_F(1)":
-                    raise DebugGame()
-                if key == "KEY_UP":
-                    self.scroll_log_up()
-                    continue
-                if key == "KEY_DOWN":
-                    self.scroll_log_down()
-                    continue
-                if key == " ":
-                    self.scroll_log_to_bottom()
-                    continue
-                if key == "\t":
-                    self.heroes.next_display_mode()
-                    self.display_state()
-                    continue
-                if key in valid_choices:
-                    break
-
-            except curses.error:
-                self.display_state(True)
-        self._log_pad.addstr(key)
-        return key
-
-    def log(self, message, attr=curses.A_NORMAL):
-        if not self._last_log_line == 0:
-            self._log_pad.addstr("\n")
-        self._log_pad.addstr(message, attr)
-        self._last_log_line = min(self._last_log_line + 1, 1000)
-        self._last_shown_log_line = self._last_log_line
-        self._refresh_log()
-
-    def scroll_log_up(self):
-        if max(self._last_shown_log_line - self._log_lines_to_show, 0) != 0:
-            self._last_shown_log_line -= 1
-        self._refresh_log()
-
-    def scroll_log_down(self):
-        self._last_shown_log_line = min(self._last_log_line, self._last_shown_log_line + 1)
-        self._refresh_log()
-
-    def scroll_log_to_bottom(self):
-        self._last_shown_log_line = self._last_log_line
-        self._refresh_log()
-        self.display_state()
+                self.play_turn()
+            except heroes.QuitGame:
+                return False
+
+            if len(self.villain_deck) == 0:
+                return True
 
-    def _refresh_log(self):
-        self._log_pad.refresh(max(self._last_shown_log_line - self._log_lines_to_show, 0),0, self._log_start_line,self._log_start_col, self._log_end_line,self._log_end_col)
+            if self.locations.is_controlled(self) and not self.locations.advance(self):
+                return False
+        return False
 
     def play_turn(self):
+        self._decision_provider.start_turn(self)
         self.display_state()
 
-        self.log("-----Turn start-----")
-        self.dark_arts_deck.play_turn(self)
+        self.log("-----Turn start-----", event_log.PHASE)
+        with self.profiler.frame("phase", "dark arts"):
+            self.dark_arts_deck.play_turn(self)
         if self.encounters is not None:
-            self.encounters.play_turn(self)
-        self.villain_deck.play_turn(self)
-        self.heroes.play_turn(self)
-
-        self.log("-----Cleanup phase-----")
-        self.heroes.all_heroes.recover_from_stun(self)
-        self.dark_arts_deck.end_turn(self)
-        if self.encounters is not None:
-            self.encounters.check_completion(self)
-        self.villain_deck.reveal(self)
-        self.heroes.active_hero.end_turn(self)
-        self.hogwarts_deck.refill_market(self)
-
-        self.log("-----Turn end-----")
+            with self.profiler.frame("phase", "encounters"):
+                self.encounters.play_turn(self)
+        with self.profiler.frame("phase", "villains"):
+            self.villain_deck.play_turn(self)
+        with self.profiler.frame("phase", "heroes"):
+            self.heroes.play_turn(self)
+
+        self.log("-----Cleanup phase-----", event_log.PHASE)
+        with self.profiler.frame("phase", "cleanup"):
+            self.heroes.all_heroes.recover_from_stun(self)
+            self.dark_arts_deck.end_turn(self)
+            if self.encounters is not None:
+                self.encounters.check_completion(self)
+            self.villain_deck.reveal(self)
+            self.heroes.active_hero.end_turn(self)
+            self.hogwarts_deck.refill_market(self)
+
+        self.log("-----Turn end-----", event_log.PHASE)
         self.heroes.next()
+        self.turns += 1
 
     def roll_gryffindor_die(self):
         faces = [constants.INFLUENCE, constants.INFLUENCE, constants.INFLUENCE, constants.HEART, constants.CARD, constants.DAMAGE]
@@ -209,13 +159,14 @@ class Game(object):
         self._roll_die(faces, house_die=False)
 
     def _roll_die(self, options, house_die=True):
-        die_result = random.choice(options)
-        if self.heroes.active_hero.can_reroll_die(house_die=house_die) and self.input(f"Rolled {die_result}, (a)ccept or (r)eroll?", "ar") == "r":
-            die_result = random.choice(options)
+        die_result = self.rng.choice(options)
+        if self.heroes.active_hero.can_reroll_die(house_die=house_die) and self.input(f"Rolled {die_result}, (a)ccept or (r)eroll?", "ar", kind=decisions.DecisionKind.ROLL_DIE) == "r":
+            die_result = self.rng.choice(options)
         if (self.encounters is not None
             and self.encounters.current.die_roll_applies(self, die_result)
-            and self.input(f"Rolled {die_result}, apply to {self.encounters.current.name}? (y/n): ", "yn") == "y"):
-            self.encounters.current.apply_die_roll(self, die_result)
+            and self.input(f"Rolled {die_result}, apply to {self.encounters.current.name}? (y/n): ", "yn", kind=decisions.DecisionKind.ROLL_DIE) == "y"):
+            with self.effect_source(self.encounters.current):
+                self.encounters.current.apply_die_roll(self, die_result)
             return
         if die_result == constants.DAMAGE:
             self.log(f"Rolled {constants.DAMAGE}, ALL heroes gain 1{constants.DAMAGE}")
@@ -241,7 +192,7 @@ class Game(object):
 
 
 # def main(stdscr, game_num, chosen_heroes):
-def main(stdscr, config, chosen_heroes):
+def main(stdscr, config, chosen_heroes, seed, bots=(), trace=None):
     # For active hero & location, and input prompts
     curses.init_pair(1, curses.COLOR_GREEN, curses.COLOR_BLACK)
     # For spells
@@ -251,25 +202,30 @@ def main(stdscr, config, chosen_heroes):
     # For items
     curses.init_pair(4, curses.COLOR_YELLOW, curses.COLOR_BLACK)
     # game = Game(stdscr, game_num, chosen_heroes)
-    game = Game(stdscr, config, chosen_heroes)
-    while True:
-        try:
-            game.play_turn()
-        except heroes.QuitGame:
-            return False
-
-        if len(game.villain_deck) == 0:
-            return True
-
-        if game.locations.is_controlled(game) and not game.locations.advance(game):
-            return False
+    renderer = display.CursesRenderer(stdscr)
+    decision_provider = decisions.KeyboardProvider(renderer)
+    bot = None
+    if bots:
+        human_heroes = [hero.name for hero in chosen_heroes if hero.name not in bots]
+        decision_provider = bot = mcts.MCTSProvider(seed=seed, human=decision_provider, human_heroes=human_heroes)
+    if trace is not None:
+        decision_provider = traces.RecordingProvider(decision_provider, trace)
+    try:
+        game = Game(config, chosen_heroes, renderer, decision_provider, seed)
+        return game.play()
+    finally:
+        if bot is not None:
+            bot.close()
 
 class ConfigFileAction(argparse.Action):
     def __call__(self, parser, namespace, value, option_string=None):
         config_file = Path(value)
         if not config_file.exists():
             parser.error(f"Config file {config_file} does not exist")
-        config = safe_load(config_file.read_text())
+        try:
+            config = configs.load(config_file)
+        except configs.ConfigError as e:
+            parser.error(f"{config_file}: {e}")
         setattr(namespace, self.dest, config)
 
 
@@ -278,7 +234,7 @@ class HeroArgAction(argparse.Action):
         if len(values) > 4:
             parser.error("Cannot play with more than 4 heroes")
         proficiencies_allowed = namespace.config['proficiencies'] if 'proficiencies' in namespace.config else False
-        chosen_heroes = []
+        hero_specs = []
         for hero_name in values:
             parts = hero_name.split(":")
             if not proficiencies_allowed:
@@ -293,15 +249,26 @@ class HeroArgAction(argparse.Action):
             if hero_name not in heroes.HEROES:
                 parser.error(f"Unknown hero: {hero_name}")
 
+            proficiency_name = None
             if len(parts) == 2:
                 proficiency_name = parts[1]
                 if proficiency_name not in proficiencies.PROFICIENCIES:
                     parser.error(f"Unknown proficiency: {proficiency_name}")
-                proficiency = proficiencies.PROFICIENCIES[proficiency_name]()
-            else:
-                proficiency = proficiencies.NullProficiency()
-            chosen_heroes.append(heroes.HEROES[hero_name](namespace.config['hero_abilities'], proficiency))
-        setattr(namespace, self.dest, chosen_heroes)
+            hero_specs.append((hero_name, proficiency_name))
+        setattr(namespace, self.dest, hero_specs)
+
+
+# Heroes hold per-game state, so every game needs fresh ones built from the
+# (name, proficiency name) specs parsed by HeroArgAction
+def create_heroes(config, hero_specs):
+    chosen_heroes = []
+    for hero_name, proficiency_name in hero_specs:
+        if proficiency_name is None:
+            proficiency = proficiencies.NullProficiency()
+        else:
+            proficiency = proficiencies.PROFICIENCIES[proficiency_name]()
+        chosen_heroes.append(heroes.HEROES[hero_name](config['hero_abilities'], proficiency))
+    return chosen_heroes
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description="Play Harry Potter: Hogwarts Battle")
@@ -311,7 +278,14 @@ if __name__ == '__main__':
                         Valid names are {', '.join(heroes.HEROES.keys())}. Valid
                         proficiencies are {', '.join(proficiencies.PROFICIENCIES.keys())}.""")
     parser.add_argument("--seed", type=int, default=None, help="Random seed to use")
+    parser.add_argument("--bot", metavar="NAME", action="append", default=[],
+                        help="Let the search bot play this hero (repeatable); you play the rest")
+    parser.add_argument("--record", metavar="TRACE", default=None,
+                        help="Write a trace of the game to replay later with replay.py (gzipped if it ends in .gz)")
     args = parser.parse_args()
+    for bot in args.bot:
+        if bot not in [hero_name for hero_name, _ in args.heroes]:
+            parser.error(f"Bot hero {bot} is not playing")
 
     print("Playing " + args.config['name'])
 
@@ -320,13 +294,27 @@ if __name__ == '__main__':
         timestamp = datetime.now()
         seed = timestamp.hour*10000 + timestamp.minute*100 + timestamp.second
     print("Seed:", seed)
-    random.seed(seed)
 
+    trace = None
+    if args.record is not None:
+        trace = traces.TraceWriter(args.record, args.config, args.heroes, seed)
     try:
-        if curses.wrapper(main, args.config, args.heroes):
+        if curses.wrapper(main, args.config, create_heroes(args.config, args.heroes), seed, args.bot, trace):
             print("You won!")
+            result = 'win'
         else:
             print("You lost!")
-    except DebugGame:
+            result = 'loss'
+        if trace is not None:
+            trace.finish(result)
+    except display.DebugGame:
         import pdb
         pdb.post_mortem()
+    except Exception as e:
+        if trace is not None:
+            trace.finish('error', repr(e))
+            print("Trace written to", args.record)
+        raise
+    finally:
+        if trace is not None:
+            trace.close()
@@ -2,11 +2,14 @@ from collections import namedtuple
 from enum import Enum, auto
 
 import curses
-import inspect
-import random
+import operator
 
 import constants
+import decisions
+import effects
+import event_log
 import hogwarts
+import state
 
 
 class QuitGame(Exception):
@@ -32,16 +35,25 @@ ALPHA_OPTIONS = ['a', 'b', 'd', 'e', 'f', 'g', 'j', 'k', 'l', 'm',
 
 
 class Heroes(object):
-    def __init__(self, window, chosen_heroes):
+    def __init__(self, window, chosen_heroes, listeners=None):
         self._window = window
         self._heroes = chosen_heroes
+        if listeners is not None:
+            for hero in self._heroes:
+                hero.join(listeners)
         self._hero_rows = 2 if len(self._heroes) > 2 else 1
         self._harry = next((hero for hero in self._heroes if hero.name == "Harry"), None)
         self._current = 0
+        # Heroes never join or leave a game, so these never go stale
+        self._all_heroes = HeroList(*self._heroes)
+        self._all_heroes_except = [HeroList(*[other for other in self._heroes if other != hero]) for hero in self._heroes]
 
         self._display_mode = 0
-        self._init_window()
-        self._pads = [curses.newpad(100,100) for _ in self._heroes]
+        if self._window is not None:
+            self._init_window()
+            self._pads = [curses.newpad(100,100) for _ in self._heroes]
+        # What each hero's pad last drew, to skip redrawing heroes that didn't change
+        self._displayed = [None for _ in self._heroes]
 
     def _init_window(self):
         self._window.box()
@@ -61,11 +73,17 @@ class Heroes(object):
         self._display_mode = (self._display_mode + 1) % len(DISPLAY_MODES)
 
     def display_state(self, game, resize=False, size=None):
+        if self._window is None:
+            return
         if resize:
             self._window.resize(*size)
             self._window.clear()
             self._init_window()
         for i, hero in enumerate(self._heroes):
+            key = (self._display_mode, i == self._current, hero.display_key(game))
+            if not resize and key == self._displayed[i]:
+                continue
+            self._displayed[i] = key
             attr = curses.A_BOLD | curses.color_pair(1) if i == self._current else curses.A_NORMAL
             hero.display_state(game, DISPLAY_MODES[self._display_mode], self._pads[i], i, attr)
             first_line = self._pad_start_line + (i//2)*(self._pad_lines//2)
@@ -106,7 +124,7 @@ class Heroes(object):
 
         choices = ['c'] if optional else []
         choices += [str(i) for i in range(len(self._heroes)) if self._heroes[i] != disallow]
-        choice = game.input(prompt, choices)
+        choice = game.input(prompt, choices, kind=decisions.DecisionKind.CHOOSE_HERO)
         if choice == "c":
             return None
         return self._heroes[int(choice)]
@@ -116,13 +134,15 @@ class Heroes(object):
             return self.all_heroes
 
         while True:
-            first = self._heroes[int(game.input(f"Choose first hero {prompt}: ", range(len(self._heroes))))]
+            legal = [str(i) for i in range(len(self._heroes)) if self._heroes[i] != disallow]
+            first = self._heroes[int(game.input(f"Choose first hero {prompt}: ", range(len(self._heroes)), kind=decisions.DecisionKind.CHOOSE_HERO, legal=legal))]
             if first == disallow:
                 game.log(disallow_msg.format(disallow.name))
                 continue
             break
         while True:
-            second = self._heroes[int(game.input(f"Choose second hero {prompt}: ", range(len(self._heroes))))]
+            legal = [str(i) for i in range(len(self._heroes)) if self._heroes[i] not in (disallow, first)]
+            second = self._heroes[int(game.input(f"Choose second hero {prompt}: ", range(len(self._heroes)), kind=decisions.DecisionKind.CHOOSE_HERO, legal=legal))]
             if second == disallow:
                 game.log(disallow_msg.format(disallow.name))
                 continue
@@ -134,11 +154,11 @@ class Heroes(object):
 
     @property
     def all_heroes(self):
-        return HeroList(*self._heroes)
+        return self._all_heroes
 
     @property
     def all_heroes_except_active(self):
-        return HeroList(*[hero for hero in self._heroes if hero != self.active_hero])
+        return self._all_heroes_except[self._current]
 
     def next(self):
         self._current = (self._current + 1) % len(self._heroes)
@@ -192,15 +212,93 @@ class Heroes(object):
             hero.remove_hearts_callback(game, callback)
 
 
-class HeroList(list):
-    def __init__(self, *args):
-        super().__init__(args)
+class HeroList(tuple):
+    __slots__ = ()
+
+    def __new__(cls, *heroes):
+        return super().__new__(cls, heroes)
 
-    def __getattr__(self, attr):
-        def f(game, *args, **kwargs):
-            for hero in self:
-                getattr(hero, attr)(game, *args, **kwargs)
-        return f
+    def add_hearts(self, game, amount=1, source=None):
+        if amount == 0:
+            return
+        quiet = len(self) > 1
+        if quiet and amount < 0:
+            game.log("{heroes} lose {amount} hearts!", event_log.HEARTS, heroes=_names(self), amount=-amount)
+        elif quiet:
+            game.log("{heroes} gain {amount} hearts!", event_log.HEARTS, heroes=_names(self), amount=amount)
+        for hero in self:
+            hero.add_hearts(game, amount, source, quiet)
+
+    def remove_hearts(self, game, amount=1):
+        self.add_hearts(game, -amount)
+
+    def add(self, game, damage=0, influence=0, hearts=0, cards=0):
+        for hero in self:
+            hero.add(game, damage, influence, hearts, cards)
+
+    def add_damage(self, game, amount=1):
+        for hero in self:
+            hero.add_damage(game, amount)
+
+    def add_influence(self, game, amount=1):
+        for hero in self:
+            hero.add_influence(game, amount)
+
+    def remove_all_damage(self, game):
+        for hero in self:
+            hero.remove_all_damage(game)
+
+    def remove_all_influence(self, game):
+        for hero in self:
+            hero.remove_all_influence(game)
+
+    def draw(self, game, count=1, end_of_turn=False):
+        for hero in self:
+            hero.draw(game, count, end_of_turn)
+
+    def choose_and_discard(self, game, count=1, with_callbacks=True):
+        for hero in self:
+            hero.choose_and_discard(game, count, with_callbacks)
+
+    def choose_and_banish(self, game, **kwargs):
+        for hero in self:
+            hero.choose_and_banish(game, **kwargs)
+
+    def add_detention(self, game, to_hand=False):
+        for hero in self:
+            hero.add_detention(game, to_hand)
+
+    def recover_from_stun(self, game):
+        for hero in self:
+            hero.recover_from_stun(game)
+
+    def disallow_gaining_tokens_out_of_turn(self, game):
+        for hero in self:
+            hero.disallow_gaining_tokens_out_of_turn(game)
+
+    def allow_gaining_tokens_out_of_turn(self, game):
+        for hero in self:
+            hero.allow_gaining_tokens_out_of_turn(game)
+
+    def disallow_gaining_tokens_from_allies(self, game):
+        for hero in self:
+            hero.disallow_gaining_tokens_from_allies(game)
+
+    def allow_gaining_tokens_from_allies(self, game):
+        for hero in self:
+            hero.allow_gaining_tokens_from_allies(game)
+
+    def add_extra_shuffle_effect(self, game, effect):
+        for hero in self:
+            hero.add_extra_shuffle_effect(game, effect)
+
+    def remove_extra_shuffle_effect(self, game, effect):
+        for hero in self:
+            hero.remove_extra_shuffle_effect(game, effect)
+
+    def add_hearts_callback(self, game, callback):
+        for hero in self:
+            hero.add_hearts_callback(game, callback)
 
     def effect(self, game, effect=None):
         if effect is None:
@@ -209,7 +307,161 @@ class HeroList(list):
             effect(game, hero)
 
 
+def _names(heroes):
+    return ", ".join(hero.name for hero in heroes)
+
+
+# Zone counts by card type, as indexes into Zone._kinds
+_ALLY, _ITEM, _SPELL, _OTHER = range(4)
+
+_kind_by_type = {}
+
+
+def _kind(card):
+    kind = _kind_by_type.get(type(card))
+    if kind is not None:
+        return kind
+    if card.is_ally():
+        kind = _ALLY
+    elif card.is_item():
+        kind = _ITEM
+    elif card.is_spell():
+        kind = _SPELL
+    else:
+        kind = _OTHER
+    _kind_by_type[type(card)] = kind
+    return kind
+
+
+class Zone(list):
+    """One of a hero's piles of cards (deck, hand, play area or discard).
+
+    Still a list, so cards move in and out with the usual list methods, but
+    it counts what it holds by name and by type as they do, so asking "is
+    there an X in hand" or "how many spells" doesn't look at every card.
+    """
+    __slots__ = ('_names', '_kinds')
+
+    def __init__(self, cards=()):
+        super().__init__(cards)
+        # Names stay in here at 0 once they've left, which is cheaper than
+        # taking them out and putting them back
+        self._names = {}
+        self._kinds = [0, 0, 0, 0]
+        for card in self:
+            self._counted(card, 1)
+
+    def _counted(self, card, change):
+        names = self._names
+        names[card.name] = names.get(card.name, 0) + change
+        self._kinds[_kind(card)] += change
+
+    def count_named(self, *names):
+        return sum(self._names.get(name, 0) for name in names)
+
+    def count_allies(self):
+        return self._kinds[_ALLY]
+
+    def count_items(self):
+        return self._kinds[_ITEM]
+
+    def count_spells(self):
+        return self._kinds[_SPELL]
+
+    def shuffle(self, rng):
+        # Same cards, so the counts don't change; shuffle a plain copy rather
+        # than going through __setitem__ for every swap
+        cards = list(self)
+        rng.shuffle(cards)
+        list.__setitem__(self, slice(None), cards)
+
+    def append(self, card):
+        list.append(self, card)
+        # _counted, by hand: cards move in and out of zones all the time
+        names = self._names
+        names[card.name] = names.get(card.name, 0) + 1
+        kind = _kind_by_type.get(type(card))
+        self._kinds[kind if kind is not None else _kind(card)] += 1
+
+    def extend(self, cards):
+        cards = list(cards)
+        super().extend(cards)
+        for card in cards:
+            self._counted(card, 1)
+
+    def __iadd__(self, cards):
+        self.extend(cards)
+        return self
+
+    def insert(self, index, card):
+        super().insert(index, card)
+        self._counted(card, 1)
+
+    def pop(self, index=-1):
+        card = list.pop(self, index)
+        self._names[card.name] -= 1
+        self._kinds[_kind_by_type[type(card)]] -= 1
+        return card
+
+    def remove(self, card):
+        super().remove(card)
+        self._counted(card, -1)
+
+    def clear(self):
+        super().clear()
+        self._names.clear()
+        self._kinds = [0, 0, 0, 0]
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            for card in self[index]:
+                self._counted(card, -1)
+            for card in value:
+                self._counted(card, 1)
+        else:
+            self._counted(self[index], -1)
+            self._counted(value, 1)
+        super().__setitem__(index, value)
+
+    def __delitem__(self, index):
+        for card in (self[index] if isinstance(index, slice) else [self[index]]):
+            self._counted(card, -1)
+        super().__delitem__(index)
+
+    def __copy__(self):
+        copied = Zone.__new__(Zone)
+        list.extend(copied, self)
+        copied._names = self._names.copy()
+        copied._kinds = self._kinds[:]
+        return copied
+
+    def __reduce__(self):
+        return (Zone, (list(self),))
+
+
+def _zone(slot):
+    """Hero attribute holding a Zone; anything else assigned to it is made into one."""
+    def set_zone(hero, cards):
+        setattr(hero, slot, cards if type(cards) is Zone else Zone(cards))
+    return property(operator.attrgetter(slot), set_zone)
+
+
 class Hero(object):
+    __slots__ = (
+        'name', '_ability', '_max_hearts', '_hearts', '_deck_zone', '_hand_zone', '_play_area_zone', '_discard_zone',
+        '_proficiency', '_damage_tokens', '_influence_tokens', '_cards_acquired', '_listeners',
+        '_drawing_disallowed', '_healing_disallowed',
+        '_gaining_out_of_turn_allowed', '_gaining_from_allies_allowed', '_can_put_allies_in_deck',
+        '_can_put_items_in_deck', '_can_put_spells_in_deck', '_only_draw_four_cards', '_encounters',
+        '_extra_actions'
+    )
+
+    _deck = _zone('_deck_zone')
+    _hand = _zone('_hand_zone')
+    _play_area = _zone('_play_area_zone')
+    _discard = _zone('_discard_zone')
+
     def __init__(self, name, ability, starting_deck, proficiency):
         self.name = name
         self._ability = ability
@@ -223,9 +475,9 @@ class Hero(object):
         self._damage_tokens = 0
         self._influence_tokens = 0
         self._cards_acquired = 0
-        self._acquire_callbacks = []
-        self._discard_callbacks = []
-        self._hearts_callbacks = []
+        # Callbacks and extra effects waiting on this hero, until the game
+        # shares its own between all the heroes (see join)
+        self._listeners = effects.Listeners()
         # Ref counters of reasons why drawing/healing is disallowed
         self._drawing_disallowed = 0
         self._healing_disallowed = 0
@@ -235,18 +487,17 @@ class Hero(object):
         self._can_put_items_in_deck = False
         self._can_put_spells_in_deck = False
         self._only_draw_four_cards = False
-        self._extra_villain_rewards = []
-        self._extra_creature_rewards = []
-        self._extra_card_effects = []
-        self._extra_shuffle_effects = []
-        self._extra_damage_effects = []
-        self._extra_influence_effects = []
         self._encounters = []
         self._extra_actions = {}
         self._proficiency.start_game(self)
 
+    def display_key(self, game):
+        return (state.fingerprint(self), state.fingerprint(self._proficiency),
+                tuple(state.fingerprint(encounter) for encounter in self._encounters),
+                self.healing_allowed, self.drawing_allowed, self.gaining_tokens_allowed(game))
+
     def display_state(self, game, mode, window, i, attr):
-        window.clear()
+        window.erase()
         window.addstr(f"{i}: {self.name}", attr)
         window.addstr(f" ({self._hearts}{constants.HEART} {self._damage_tokens}{constants.DAMAGE}", attr)
         window.addstr(f" {self._influence_tokens}{constants.INFLUENCE})", attr)
@@ -296,14 +547,15 @@ class Hero(object):
     def recover_from_stun(self, game):
         if not self.is_stunned:
             return
-        game.log(f"{self.name} recovers from stun!")
+        game.log("{hero} recovers from stun!", event_log.STUN, hero=self.name)
         self._hearts = self._max_hearts
 
-    def add_hearts(self, game, amount=1, source=None):
+    def add_hearts(self, game, amount=1, source=None, quiet=False):
         if amount == 0:
             return
+        requested = amount
         if self.is_stunned:
-            game.log(f"{self.name} is stunned and cannot gain/lose hearts!")
+            game.log("{hero} is stunned and cannot gain/lose hearts!", event_log.HEARTS, hero=self.name)
             return
         if amount > 0 and self._hearts == self._max_hearts:
             game.log(f"{self.name} is already at max hearts!")
@@ -311,13 +563,16 @@ class Hero(object):
         if amount > 0 and not self.healing_allowed:
             game.log(f"{self.name}: healing not allowed!")
             return
-        if amount < -1 and any(card.name == "Invisibility cloak" for card in self._hand):
-            game.log(f"Invisibility cloak prevents {-1 - amount}{constants.DAMAGE}!")
+        if amount < -1 and self._hand.count_named("Invisibility cloak"):
+            game.log("Invisibility cloak prevents {amount}{damage}!", event_log.HEARTS, amount=-1 - amount, damage=constants.DAMAGE)
             amount = -1
-        if amount < 0:
-            game.log(f"{self.name} loses {-amount} hearts!")
+        if quiet and amount == requested:
+            # HeroList already logged this for everybody
+            pass
+        elif amount < 0:
+            game.log("{hero} loses {amount} hearts!", event_log.HEARTS, hero=self.name, amount=-amount)
         else:
-            game.log(f"{self.name} gains {amount} hearts!")
+            game.log("{hero} gains {amount} hearts!", event_log.HEARTS, hero=self.name, amount=amount)
         hearts_start = self._hearts
         self._hearts += amount
         if self._hearts > self._max_hearts:
@@ -325,15 +580,14 @@ class Hero(object):
         if self._hearts < 0:
             self._hearts = 0
         if self.is_stunned:
-            game.log(f"{self.name} has been stunned!")
+            game.log("{hero} has been stunned!", event_log.STUN, hero=self.name)
             game.locations.add_control(game)
             self._damage_tokens = 0
             self._influence_tokens = 0
             self.choose_and_discard(game, len(self._hand) // 2)
         if hearts_start != self._hearts:
             hearts_gained = self._hearts - hearts_start
-            for callback in self._hearts_callbacks:
-                callback.hearts_callback(game, self, hearts_gained, source)
+            self._listeners.run(game, effects.HEARTS, self, self, hearts_gained, source)
 
     def remove_hearts(self, game, amount=1):
         self.add_hearts(game, -amount)
@@ -388,27 +642,25 @@ class Hero(object):
         if not end_of_turn and not self.drawing_allowed:
             game.log("Drawing not allowed!")
             return
-        game.log(f"{self.name} draws {count} cards")
+        game.log("{hero} draws {count} cards", event_log.DRAW, hero=self.name, count=count)
         for i in range(count):
             if len(self._deck) == 0:
                 if len(self._discard) == 0:
                     # We've already shuffled the discard into the deck, so if the
                     # deck is empty now, we're out of cards
                     break
-                for effect in self._extra_shuffle_effects:
-                    effect(game, self)
+                self._listeners.run(game, effects.SHUFFLE, self, self)
                 self._deck = self._discard
                 self._discard = []
-                random.shuffle(self._deck)
+                self._deck.shuffle(game.rng)
             self._hand.append(self._deck.pop())
 
     def reveal_top_card(self, game):
         if len(self._deck) == 0:
-            for effect in self._extra_shuffle_effects:
-                effect(game, self)
+            self._listeners.run(game, effects.SHUFFLE, self, self)
             self._deck = self._discard
             self._discard = []
-            random.shuffle(self._deck)
+            self._deck.shuffle(game.rng)
         if len(self._deck) == 0:
             return None
         return self._deck[-1]
@@ -425,12 +677,12 @@ class Hero(object):
 
     def _discard_card(self, game, card, with_callbacks=True):
         self._discard.append(card)
-        game.log(f"{self.name} discarded {card}")
-        card.discard_effect(game, self)
+        game.log("{hero} discarded {card}", event_log.DISCARD, hero=self.name, card=card)
+        with game.effect_source(card):
+            card.discard_effect(game, self)
         if not with_callbacks:
             return
-        for callback in self._discard_callbacks:
-            callback.discard_callback(game, self)
+        self._listeners.run(game, effects.DISCARD, self, self)
 
     def choose_and_discard(self, game, count=1, with_callbacks=True):
         discarded = []
@@ -438,7 +690,7 @@ class Hero(object):
             if len(self._hand) == 0:
                 game.log(f"{self.name} has no cards to discard!")
                 return
-            choice = int(game.input(f"Choose card for {self.name} to discard: ", range(len(self._hand))))
+            choice = int(game.input(f"Choose card for {self.name} to discard: ", range(len(self._hand)), kind=decisions.DecisionKind.DISCARD, hero=self))
             discarded.append(self.discard(game, choice, with_callbacks))
         return discarded
 
@@ -468,15 +720,13 @@ class Hero(object):
             game.log(f"{self.name} has no valid cards to banish!")
             return None
 
-        choice = game.input(prompt, choices)
+        choice = game.input(prompt, choices, kind=decisions.DecisionKind.BANISH, hero=self)
         if choice == cancel_with:
             return None
         try:
-            choice = self._hand[int(choice)]
-            self._hand.remove(choice)
+            choice = self._hand.pop(int(choice))
         except ValueError:
-            choice = discard_choices[choice]
-            self._discard.remove(choice)
+            choice = self.take_from_discard(choice)
         game.log(f"{self.name} banishes {choice}")
         return choice
 
@@ -489,26 +739,39 @@ class Hero(object):
             else:
                 game.log(f"Cards in {self.name}'s discard:")
                 for key, card in choices.items():
-                    game.log(f" {key}: {card}")
+                    game.log(" {key}: {card}", key=key, card=card)
         return choices
 
+    def take_from_discard(self, choice):
+        """Remove the card choices_in_discard offered under choice.
+
+        By position: copies of a card are usually the same object, so removing
+        by value could take an earlier copy and reorder the discard pile.
+        """
+        return self._discard.pop(ALPHA_OPTIONS.index(choice))
+
+    def join(self, listeners):
+        """Wait on listeners (the game's) from now on, bringing along what's already waiting."""
+        listeners.adopt(self._listeners)
+        self._listeners = listeners
+
     def add_acquire_callback(self, game, callback):
-        self._acquire_callbacks.append(callback)
+        self._listeners.add(effects.ACQUIRE, self, callback.acquire_callback)
 
     def remove_acquire_callback(self, game, callback):
-        self._acquire_callbacks.remove(callback)
+        self._listeners.remove(effects.ACQUIRE, self, callback.acquire_callback)
 
     def add_discard_callback(self, game, callback):
-        self._discard_callbacks.append(callback)
+        self._listeners.add(effects.DISCARD, self, callback.discard_callback)
 
     def remove_discard_callback(self, game, callback):
-        self._discard_callbacks.remove(callback)
+        self._listeners.remove(effects.DISCARD, self, callback.discard_callback)
 
     def add_hearts_callback(self, game, callback):
-        self._hearts_callbacks.append(callback)
+        self._listeners.add(effects.HEARTS, self, callback.hearts_callback)
 
     def remove_hearts_callback(self, game, callback):
-        self._hearts_callbacks.remove(callback)
+        self._listeners.remove(effects.HEARTS, self, callback.hearts_callback)
 
     def can_put_allies_in_deck(self, game):
         self._can_put_allies_in_deck = True
@@ -533,8 +796,7 @@ class Hero(object):
             self._deck.append(card)
         else:
             self._discard.append(card)
-        for callback in self._acquire_callbacks:
-            callback.acquire_callback(game, self, card)
+        self._listeners.run(game, effects.ACQUIRE, self, self, card)
 
     def buy_card(self, game):
         if self._influence_tokens == 0:
@@ -544,7 +806,8 @@ class Hero(object):
             game.log("No cards to buy!")
             return
         choices = ['c', 't', 'r'] + [str(i) for i in range(len(game.hogwarts_deck._market))]
-        choice = game.input("Choose card to buy ('c' to cancel): ", choices)
+        legal = ['c'] + self.buy_choices(game)
+        choice = game.input("Choose card to buy ('c' to cancel): ", choices, kind=decisions.DecisionKind.BUY, hero=self, legal=legal)
         if choice == "c":
             return
         from_market = True
@@ -556,9 +819,12 @@ class Hero(object):
             from_market = False
         else:
             choice = game.hogwarts_deck[int(choice)]
-        game.log(f"Buying {choice.name} ({choice.cost}{constants.INFLUENCE}; {choice.description})")
+        game.log("Buying {card} ({cost}{influence}; {description})", event_log.BUY, card=choice.name, cost=choice.cost, influence=constants.INFLUENCE, description=choice.description)
         cost = choice.cost
         cost += self._proficiency.cost_modifier(game, choice)
+        if cost != choice.cost:
+            # cost_modifier is also asked when listing legal buys, so it can't log itself
+            game.log(f"{self._proficiency.name}: {choice.name} costs {cost}{constants.INFLUENCE}")
         if self._influence_tokens < cost:
             game.log(f"Not enough {constants.INFLUENCE}!")
             return
@@ -569,30 +835,37 @@ class Hero(object):
             card = choice
         top_of_deck = False
         if (card.is_ally() and self._can_put_allies_in_deck) or (card.is_item() and self._can_put_items_in_deck) or (card.is_spell() and self._can_put_spells_in_deck):
-            if game.input(f"Put {card} on top of deck? (y/n): ", "yn") == "y":
+            if game.input(f"Put {card} on top of deck? (y/n): ", "yn", kind=decisions.DecisionKind.CONFIRM, hero=self) == "y":
                 top_of_deck = True
         self._acquire(game, card, top_of_deck)
 
+    def buy_choices(self, game):
+        if self._influence_tokens == 0 or len(game.hogwarts_deck._market) == 0:
+            return []
+        market = game.hogwarts_deck
+        cards = [(str(i), market[i]) for i in range(len(market._market))]
+        cards += [('t', hogwarts.Tergeo()), ('r', hogwarts.Reparo())]
+        return [key for key, card in cards if card.cost + self._proficiency.cost_modifier(game, card) <= self._influence_tokens]
+
     def add_extra_card_effect(self, game, effect):
-        self._extra_card_effects.append(effect)
+        self._listeners.add(effects.PLAY_CARD, self, effect, turn=True)
 
     def add_extra_shuffle_effect(self, game, effect):
-        self._extra_shuffle_effects.append(effect)
+        self._listeners.add(effects.SHUFFLE, self, effect)
 
     def remove_extra_shuffle_effect(self, game, effect):
-        self._extra_shuffle_effects.remove(effect)
+        self._listeners.remove(effects.SHUFFLE, self, effect)
 
     def add_extra_damage_effect(self, game, effect):
-        self._extra_damage_effects.append(effect)
+        self._listeners.add(effects.ASSIGN_DAMAGE, self, effect, turn=True)
 
     def add_extra_influence_effect(self, game, effect):
-        self._extra_influence_effects.append(effect)
+        self._listeners.add(effects.ASSIGN_INFLUENCE, self, effect, turn=True)
 
     def play_card(self, game, which):
         card = self._hand.pop(which)
         card.play(game)
-        for effect in self._extra_card_effects:
-            effect(game, card)
+        self._listeners.run(game, effects.PLAY_CARD, self, card)
         self._play_area.append(card)
 
     def choose_and_play(self, game):
@@ -600,7 +873,7 @@ class Hero(object):
             game.log(f"{self.name} has no cards to play!")
             return
         choices = ['a', 'c'] + [str(i) for i in range(len(self._hand))]
-        choice = game.input("Choose card to play ('a' for all, 'c' to cancel): ", choices)
+        choice = game.input("Choose card to play ('a' for all, 'c' to cancel): ", choices, kind=decisions.DecisionKind.PLAY_CARD, hero=self)
         if choice == "c":
             return
         if choice == "a":
@@ -616,26 +889,11 @@ class Hero(object):
             self.play_card(game, int(choice))
 
     def source_is_ally(self, game):
-        call_stack = inspect.stack()
-        for frame in call_stack[1:]:
-            if frame.function == "add_damage" or frame.function == "add_influence":
-                continue
-            if frame.function == "remove_damage" or frame.function == "remove_influence":
-                continue
-            if frame.function == "add":
-                continue
-            if frame.function == "f":
-                continue
-            if 'self' not in frame.frame.f_locals:
-                continue
-            f_self = frame.frame.f_locals['self']
-            if f_self == game:
-                continue
-            try:
-                return f_self.is_ally()
-            except AttributeError:
-                return False
-        return False
+        source = game.effect_source.current
+        try:
+            return source.is_ally()
+        except AttributeError:
+            return False
 
     def add_damage(self, game, amount=1):
         if amount > 0 and not self.gaining_tokens_allowed(game):
@@ -663,11 +921,12 @@ class Hero(object):
         if len(game.villain_deck.choices) == 0:
             game.log(f"No villains to assign {constants.DAMAGE} to!")
             return None
-        if sum(1 for v in game.villain_deck.all if v.can_take_damage(game)) == 0:
+        if not game.villain_deck.can_assign_damage(game):
             game.log(f"No villains to assign {constants.DAMAGE} to!")
             return None
         choices = ['c'] + game.villain_deck.choices
-        choice = game.input(f"Choose villain to assign {constants.DAMAGE} to ('c' to cancel): ", choices)
+        legal = ['c'] + game.villain_deck.damage_choices(game)
+        choice = game.input(f"Choose villain to assign {constants.DAMAGE} to ('c' to cancel): ", choices, kind=decisions.DecisionKind.ASSIGN_DAMAGE, hero=self, legal=legal)
         if choice == 'c':
             return None
         if choice == 'v' and not game.villain_deck.voldemort_vulnerable(game):
@@ -680,17 +939,14 @@ class Hero(object):
         self.remove_damage(game)
         defeated = villain.add_damage(game)
         if defeated and villain.is_villain:
-            for reward in self._extra_villain_rewards:
-                reward(game)
+            self._listeners.run(game, effects.DEFEAT_VILLAIN, self)
             # Extra rewards only apply once
-            self._extra_villain_rewards = []
+            self._listeners.clear(effects.DEFEAT_VILLAIN, self)
         if defeated and villain.is_creature:
-            for reward in self._extra_creature_rewards:
-                reward(game)
+            self._listeners.run(game, effects.DEFEAT_CREATURE, self)
             # Extra rewards only apply once
-            self._extra_creature_rewards = []
-        for effect in self._extra_damage_effects:
-            effect(game, villain, 1)
+            self._listeners.clear(effects.DEFEAT_CREATURE, self)
+        self._listeners.run(game, effects.ASSIGN_DAMAGE, self, villain, 1)
         return villain
 
     def assign_influence(self, game):
@@ -700,11 +956,12 @@ class Hero(object):
         if len(game.villain_deck.choices) == 0:
             game.log(f"No villains to assign {constants.INFLUENCE} to!")
             return None
-        if sum(1 for v in game.villain_deck.all if v.can_take_influence(game)) == 0:
+        if not game.villain_deck.can_assign_influence(game):
             game.log(f"No villains to assign {constants.INFLUENCE} to!")
             return None
         choices = ['c'] + game.villain_deck.choices
-        choice = game.input(f"Choose villain to assign {constants.INFLUENCE} to ('c' to cancel): ", choices)
+        legal = ['c'] + game.villain_deck.influence_choices(game)
+        choice = game.input(f"Choose villain to assign {constants.INFLUENCE} to ('c' to cancel): ", choices, kind=decisions.DecisionKind.ASSIGN_INFLUENCE, hero=self, legal=legal)
         if choice == 'c':
             return None
         if choice == 'v' and not game.villain_deck.voldemort_vulnerable(game):
@@ -717,17 +974,14 @@ class Hero(object):
         self.remove_influence(game)
         defeated = villain.add_influence(game)
         if defeated and villain.is_villain:
-            for reward in self._extra_villain_rewards:
-                reward(game)
+            self._listeners.run(game, effects.DEFEAT_VILLAIN, self)
             # Extra rewards only apply once
-            self._extra_villain_rewards = []
+            self._listeners.clear(effects.DEFEAT_VILLAIN, self)
         if defeated and villain.is_creature:
-            for reward in self._extra_creature_rewards:
-                reward(game)
+            self._listeners.run(game, effects.DEFEAT_CREATURE, self)
             # Extra rewards only apply once
-            self._extra_creature_rewards = []
-        for effect in self._extra_influence_effects:
-            effect(game, villain, 1)
+            self._listeners.clear(effects.DEFEAT_CREATURE, self)
+        self._listeners.run(game, effects.ASSIGN_INFLUENCE, self, villain, 1)
         return villain
 
     def add_influence(self, game, amount=1):
@@ -767,37 +1021,40 @@ class Hero(object):
             self._discard.append(hogwarts.Detention())
 
     def add_extra_villain_reward(self, game, reward):
-        self._extra_villain_rewards.append(reward)
+        self._listeners.add(effects.DEFEAT_VILLAIN, self, reward, turn=True)
 
     def add_extra_creature_reward(self, game, reward):
-        self._extra_creature_rewards.append(reward)
+        self._listeners.add(effects.DEFEAT_CREATURE, self, reward, turn=True)
 
     def add_encounter(self, game, encounter):
         self._encounters.append(encounter)
 
-    def add_action(self, game, key, description, action):
-        self._extra_actions[key] = (description, action)
+    def add_action(self, game, key, description, action, unavailable=None):
+        # unavailable(game) says why the action would be refused right now, or None
+        self._extra_actions[key] = (description, action, unavailable)
 
     def remove_action(self, game, key):
         del self._extra_actions[key]
 
     def play_turn(self, game):
-        game.log(f"-----{self.name}'s turn-----")
-        self._proficiency.start_turn(game)
+        game.log("-----{hero}'s turn-----", event_log.PHASE, hero=self.name)
+        with game.effect_source(self._proficiency):
+            self._proficiency.start_turn(game)
         for encounter in self._encounters:
-            encounter.reward_effect(game)
+            with game.effect_source(encounter):
+                encounter.reward_effect(game)
         if game.locations.current.action is not None:
             self.add_action(game, *game.locations.current.action)
         while True:
             game.display_state()
             actions = ["p", "a", "b", "e", "q", "i"]
             prompt = f"Select (p)lay card, (a)ssign {constants.DAMAGE}, (i) assign {constants.INFLUENCE}, (b)uy card"
-            for key, (description, _) in self._extra_actions.items():
+            for key, (description, _, _) in self._extra_actions.items():
                 actions.append(key)
                 prompt += f", {description}"
             prompt += ", (e)nd turn, or (q)uit: "
 
-            action = game.input(prompt, actions)
+            action = game.input(prompt, actions, kind=decisions.DecisionKind.ACTION, hero=self, legal=self.legal_actions(game, actions))
             if action == "p":
                 self.choose_and_play(game)
                 continue
@@ -817,26 +1074,46 @@ class Hero(object):
             if action == "q":
                 raise QuitGame()
             if action in self._extra_actions:
-                self._extra_actions[action][1](game)
+                extra_action = self._extra_actions[action][1]
+                with game.effect_source(effects.owner(extra_action)):
+                    extra_action(game)
                 continue
             raise ValueError("Programmer Error! Invalid choice!")
 
+    def legal_actions(self, game, actions):
+        legal = []
+        for action in actions:
+            if action == "p" and len(self._hand) == 0:
+                continue
+            if action == "a" and (self._damage_tokens == 0 or not game.villain_deck.can_assign_damage(game)):
+                continue
+            if action == "i" and (self._influence_tokens == 0 or not game.villain_deck.can_assign_influence(game)):
+                continue
+            if action == "b" and len(self.buy_choices(game)) == 0:
+                continue
+            if action in self._extra_actions:
+                unavailable = self._extra_actions[action][2]
+                if unavailable is not None and unavailable(game) is not None:
+                    continue
+            legal.append(action)
+        return legal
+
     def confirm_end_turn(self, game):
         if (len(self._hand) > 0 and
-                game.input(f"{self.name} still has {len(self._hand)} cards in hand, end turn anyway? (y/n): ", "yn") != "y"):
+                game.input(f"{self.name} still has {len(self._hand)} cards in hand, end turn anyway? (y/n): ", "yn", kind=decisions.DecisionKind.CONFIRM, hero=self) != "y"):
             return False
         if (self._damage_tokens > 0 and
-                any(v.can_take_damage(game) for v in game.villain_deck.all) and
-                game.input(f"{self.name} still has {self._damage_tokens}{constants.DAMAGE}, end turn anyway? (y/n): ", "yn") != "y"):
+                game.villain_deck.can_assign_damage(game) and
+                game.input(f"{self.name} still has {self._damage_tokens}{constants.DAMAGE}, end turn anyway? (y/n): ", "yn", kind=decisions.DecisionKind.CONFIRM, hero=self) != "y"):
             return False
         if (self._influence_tokens > 0 and
-                (any(c[0].cost <= self._influence_tokens for c in game.hogwarts_deck._market.values())
-                    or any(v.can_take_influence(game) for v in game.villain_deck.all)) and
-                game.input(f"{self.name} still has {self._influence_tokens}{constants.INFLUENCE}, end turn anyway? (y/n): ", "yn") != "y"):
+                (game.hogwarts_deck.affordable(self._influence_tokens)
+                    or game.villain_deck.can_assign_influence(game)) and
+                game.input(f"{self.name} still has {self._influence_tokens}{constants.INFLUENCE}, end turn anyway? (y/n): ", "yn", kind=decisions.DecisionKind.CONFIRM, hero=self) != "y"):
             return False
         if self._cards_acquired == 0 and len(game.hogwarts_deck._market) >= 0:
             choices = ['a', 'c'] + [str(i) for i in range(len(game.hogwarts_deck._market))]
-            choice = game.input(f"{self.name} didn't acquire any cards, choose market slot to empty, (a)ll, or (c)ancel: ", choices)
+            choice = game.input(f"{self.name} didn't acquire any cards, choose market slot to empty, (a)ll, or (c)ancel: ", choices, kind=decisions.DecisionKind.RECYCLE, hero=self)
             if choice == "c":
                 pass
             elif choice == "a":
@@ -858,11 +1135,7 @@ class Hero(object):
         self._can_put_allies_in_deck = False
         self._can_put_items_in_deck = False
         self._can_put_spells_in_deck = False
-        self._extra_villain_rewards = []
-        self._extra_creature_rewards = []
-        self._extra_card_effects = []
-        self._extra_damage_effects = []
-        self._extra_influence_effects = []
+        self._listeners.end_turn(self)
         self._extra_actions = {}
         if self._only_draw_four_cards and self._hearts <= 4:
             self.draw(game, 4, True)
@@ -873,6 +1146,8 @@ class Hero(object):
 
 
 class Alohomora(hogwarts.Spell):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Alohomora", f"Gain 1{constants.INFLUENCE}", 0)
 
@@ -881,6 +1156,8 @@ class Alohomora(hogwarts.Spell):
 
 
 class StarterAlly(hogwarts.Ally):
+    __slots__ = ()
+
     def __init__(self, name):
         super().__init__(name, f"Gain 1{constants.DAMAGE} or 2{constants.HEART}", 0)
 
@@ -902,6 +1179,8 @@ class StarterAlly(hogwarts.Ally):
 
 
 class StarterBroom(hogwarts.Item):
+    __slots__ = ()
+
     def __init__(self, name):
         super().__init__(name, f"Gain 1{constants.DAMAGE}; if you defeat a Villain, gain 1{constants.INFLUENCE}", 0)
 
@@ -5,6 +5,8 @@ from .base import Hero, Alohomora, StarterAlly, StarterBroom
 
 
 class BatBogeyHex(hogwarts.Item):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Bat Bogey Hex", f"Gain 1{constants.DAMAGE}, or ALL heroes gain 1{constants.HEART}", 0)
 
@@ -21,6 +23,8 @@ class BatBogeyHex(hogwarts.Item):
 
 
 class Ginny(Hero):
+    __slots__ = ('_used_ability', '_villains_damaged')
+
     def __init__(self, ability, proficiency):
         super().__init__("Ginny", ability, [
             Alohomora(),
@@ -5,6 +5,8 @@ from .base import Hero, Alohomora, StarterAlly, StarterBroom
 
 
 class InvisibilityCloak(hogwarts.Item):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Invisibility cloak", f"Gain 1{constants.INFLUENCE}; if in hand, take only 1{constants.DAMAGE} from each Villain or Dark Arts", 0)
 
@@ -13,6 +15,8 @@ class InvisibilityCloak(hogwarts.Item):
 
 
 class Harry(Hero):
+    __slots__ = ('_used_ability',)
+
     def __init__(self, ability, proficiency):
         super().__init__("Harry", ability, [
             Alohomora(),
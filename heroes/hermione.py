@@ -5,6 +5,8 @@ from .base import Hero, Alohomora, StarterAlly
 
 
 class TimeTurner(hogwarts.Item):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Time-Turner", f"Gain 1{constants.INFLUENCE}, may put acquired Spells on top of deck", 0)
 
@@ -14,6 +16,8 @@ class TimeTurner(hogwarts.Item):
 
 
 class TalesOfBeedleTheBard(hogwarts.Item):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("The Tales of Beedle the Bard", f"Gain 2{constants.INFLUENCE}, or ALL heroes gain 1{constants.INFLUENCE}", 0)
 
@@ -31,6 +35,8 @@ class TalesOfBeedleTheBard(hogwarts.Item):
 
 
 class Hermione(Hero):
+    __slots__ = ('_spells_played', '_used_ability')
+
     def __init__(self, ability, proficiency):
         super().__init__("Hermione", ability, [
             Alohomora(),
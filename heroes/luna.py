@@ -5,6 +5,8 @@ from .base import Hero, Alohomora, StarterAlly
 
 
 class Spectrespecs(hogwarts.Item):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Spectrespecs", f"Gain 1{constants.INFLUENCE}; you may reveal the top Dark Arts and choose to discard it", 0)
 
@@ -18,6 +20,8 @@ class Spectrespecs(hogwarts.Item):
 
 
 class LionHat(hogwarts.Item):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Lion Hat", f"Gain 1{constants.INFLUENCE}; if another hero has broom or quidditch gear, gain 1{constants.DAMAGE}", 0)
 
@@ -25,7 +29,7 @@ class LionHat(hogwarts.Item):
         broom_cards = ["Quidditch Gear", "Cleansweep 11", "Firebolt", "Nimbus 2000", "Nimbus 2001"]
         game.heroes.active_hero.add_influence(game)
         for hero in game.heroes:
-            if hero == game.heroes.active_hero:
+            if hero == game.heroes.active_hero or not hero._hand.count_named(*broom_cards):
                 continue
             for card in hero._hand:
                 if card.name in broom_cards:
@@ -35,6 +39,8 @@ class LionHat(hogwarts.Item):
 
 
 class Luna(Hero):
+    __slots__ = ('_used_ability',)
+
     def __init__(self, ability, proficiency):
         super().__init__("Luna", ability, [
             Alohomora(),
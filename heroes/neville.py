@@ -5,6 +5,8 @@ from .base import Hero, Alohomora, StarterAlly
 
 
 class Remembrall(hogwarts.Item):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Remembrall", f"Gain 1{constants.INFLUENCE}; if discarded, gain 2{constants.INFLUENCE}", 0)
 
@@ -16,6 +18,8 @@ class Remembrall(hogwarts.Item):
 
 
 class Mandrake(hogwarts.Item):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Mandrake", f"Gain 1{constants.DAMAGE}, or one hero gains 2{constants.HEART}", 0)
 
@@ -39,6 +43,8 @@ class Mandrake(hogwarts.Item):
 
 
 class Neville(Hero):
+    __slots__ = ('_healed_heroes',)
+
     def __init__(self, ability, proficiency):
         super().__init__("Neville", ability, [
             Alohomora(),
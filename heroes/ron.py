@@ -5,6 +5,8 @@ from .base import Hero, Alohomora, StarterAlly, StarterBroom
 
 
 class EveryFlavourBeans(hogwarts.Item):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Every Flavour Beans", f"Gain 1{constants.INFLUENCE}; for each Ally played, gain 1{constants.DAMAGE}", 0)
 
@@ -23,6 +25,8 @@ class EveryFlavourBeans(hogwarts.Item):
 
 
 class Ron(Hero):
+    __slots__ = ('_damage_assigned', '_used_ability')
+
     def __init__(self, ability, proficiency):
         super().__init__("Ron", ability, [
             Alohomora(),
@@ -0,0 +1,91 @@
+# Generated by registry.py from the modules in this package; don't edit by hand.
+# After adding, renaming or removing a card, run: python3 registry.py
+
+CARDS_BY_NAME = {
+    "Accio": "accio",
+    "Advanced Potion-Making": "advanced_potion_making",
+    "Albus Dumbledore": "albus_dumbledore",
+    "Argus Filch & Mrs Norris": "argus_filch",
+    "Arresto Momentum": "hogwarts",
+    "Arthur Weasley": "arthur_weasley",
+    "Bezoar": "bezoar",
+    "Buckbeak": "buckbeak",
+    "Butterbeer": "butterbeer",
+    "Cedric Diggory": "cedric_diggory",
+    "Cho Chang": "cho_chang",
+    "Chocolate Frog": "chocolate_frog",
+    "Confundus": "confundus",
+    "Crystal Ball": "crystal_ball",
+    "Deluminator": "deluminator",
+    "Depulso": "depulso",
+    "Descendo": "descendo",
+    "Detention!": "detention",
+    "Dobby": "dobby",
+    "Dragon's Blood": "dragons_blood",
+    "Elder Wand": "elder_wand",
+    "Erumpent Horn": "erumpent_horn",
+    "Essence of Dittany": "essence_of_dittany",
+    "Expecto Patronum": "expecto_patronum",
+    "Expelliarmus": "expelliarmus",
+    "Fang": "fang",
+    "Fawkes": "fawkes",
+    "Felix Felicis": "felix_felicis",
+    "Filius Flitwick": "filius_flitwick",
+    "Finite": "finite",
+    "Finite Incantatem": "finite_incantatem",
+    "Fleur Delacour": "fleur_delacour",
+    "Fred Weasley": "fred_weasley",
+    "George Weasley": "george_weasley",
+    "Gilderoy Lockhart": "gilderoy_lockhart",
+    "Gillyweed": "gillyweed",
+    "Ginny Weasley": "ginny_weasley",
+    "Golden Egg": "golden_egg",
+    "Golden Snitch": "golden_snitch",
+    "Griphook": "griphook",
+    "Harp": "harp",
+    "Hogwarts: A History": "hogwarts_a_history",
+    "Horace Slughorn": "horace_slughorn",
+    "Igor Karkaroff": "igor_karkaroff",
+    "Immobulus": "immobulus",
+    "Incendio": "incendio",
+    "Kingsley Shacklebolt": "kingsley_shacklebolt",
+    "Kreacher": "kreacher",
+    "Lacewing Flies": "lacewing_flies",
+    "Locomotor": "hogwarts",
+    "Lumos": "lumos",
+    "Luna Lovegood": "luna_lovegood",
+    "Mad-eye Moody": "mad_eye_moody",
+    "Madame Maxime": "madame_maxime",
+    "Marauder's Map": "marauders_map",
+    "Minerva McGonagall": "minerva_mcgonagall",
+    "Molly Weasley": "molly_weasley",
+    "Monster Book of Monsters": "monster_book_of_monsters",
+    "Nimbus 2001": "nimbus_2001",
+    "Nox": "nox",
+    "Nymphadora Tonks": "nymphadora_tonks",
+    "O.W.L.S.": "owls",
+    "Old Sock": "old_sock",
+    "Oliver Wood": "oliver_wood",
+    "Pensieve": "pensieve",
+    "Petrificus Totalus": "petrificus_totalus",
+    "Polyjuice Potion": "polyjuice_potion",
+    "Pomona Sprout": "pomona_sprout",
+    "Priori Incantatem": "priori_incantatem",
+    "Protego": "protego",
+    "Quidditch Gear": "quidditch_gear",
+    "Remus Lupin": "remus_lupin",
+    "Reparo": "reparo",
+    "Rubeus Hagrid": "rubeus_hagrid",
+    "Scourgify": "hogwarts",
+    "Severus Snape": "severus_snape",
+    "Sirius Black": "sirius_black",
+    "Sorting Hat": "sorting_hat",
+    "Stupefy": "stupefy",
+    "Sword of Gryffindor": "sword_of_gryffindor",
+    "Sybill Trelawney": "sybill_trelawney",
+    "Tergeo": "tergeo",
+    "Thestral": "thestral",
+    "Triwizard Cup": "triwizard_cup",
+    "Viktor Krum": "viktor_krum",
+    "Wingardium Leviosa": "wingardium_leviosa",
+}
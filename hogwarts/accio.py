@@ -3,6 +3,8 @@ import constants
 
 
 class Accio(Spell):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Accio", f"Gain 2{constants.INFLUENCE} or take Item from discard", 4)
 
@@ -20,7 +22,7 @@ class Accio(Spell):
             hero.add_influence(game, 2)
             return
         item = items[choice]
-        hero._discard.remove(item)
+        hero.take_from_discard(choice)
         hero._hand.append(item)
 
 CARDS_BY_NAME['Accio'] = Accio
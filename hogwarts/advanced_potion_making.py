@@ -3,6 +3,8 @@ import constants
 
 
 class AdvancedPotionMaking(Item):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Advanced Potion-Making", f"ALL heroes gain 2{constants.HEART}; each hero at max gains 1{constants.DAMAGE} and draws a card", 6)
 
@@ -3,6 +3,8 @@ import constants
 
 
 class AlbusDumbledore(Ally):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Albus Dumbledore", f"ALL heroes gain 1{constants.DAMAGE}, 1{constants.INFLUENCE}, 1{constants.HEART}, and draw a card", 8)
 
@@ -3,6 +3,8 @@ import constants
 
 
 class ArthurWeasley(Ally):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Arthur Weasley", f"ALL heroes gain 2{constants.INFLUENCE}", 6)
 
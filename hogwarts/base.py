@@ -1,26 +1,38 @@
-from collections import defaultdict
+from collections import defaultdict, deque
 from functools import reduce
 
 import curses
 import itertools
 import operator
-import random
 
 import constants
+import event_log
+import registry
+import state
 
+from ._registry import CARDS_BY_NAME as _CARD_MODULES
 
-CARDS_BY_NAME = {}
+
+CARDS_BY_NAME = registry.Registry(__package__, _CARD_MODULES)
 
 
 class HogwartsDeck(object):
-    def __init__(self, window, chosen_cards):
+    def __init__(self, window, cards, rng):
         self._window = window
-        self._init_window()
-        self._pad = curses.newpad(100, 100)
-        self._deck = [CARDS_BY_NAME[card_name]() for card_name in chosen_cards]
+        if self._window is not None:
+            self._init_window()
+            self._pad = curses.newpad(100, 100)
+        # What the panel last drew, to skip redrawing when nothing changed
+        self._displayed = None
+        rng.shuffle(cards)
+        # Drawn from the right, recycled cards go in on the left
+        self._deck = deque(cards)
         self._max = 6
-        random.shuffle(self._deck)
         self._market = defaultdict(list)
+        # Market slot names in display order, and the cost of each slot's
+        # card, kept up to date by _slots_changed
+        self._slots = []
+        self._cheapest = None
 
     def _init_window(self):
         self._window.box()
@@ -34,11 +46,17 @@ class HogwartsDeck(object):
         self._pad_end_col = self._pad_start_col + end[1] - 3
 
     def display_state(self, resize=False, size=None):
+        if self._window is None:
+            return
         if resize:
             self._window.resize(*size)
             self._window.clear()
             self._init_window()
-        self._pad.clear()
+        key = tuple((name, len(cards)) for name, cards in self._market.items())
+        if not resize and key == self._displayed:
+            return
+        self._displayed = key
+        self._pad.erase()
         for i, name in enumerate(self._market):
             card = self._market[name][0]
             count = len(self._market[name])
@@ -50,24 +68,32 @@ class HogwartsDeck(object):
             if len(self._deck) == 0:
                 break
             card = self._deck.pop()
-            game.log(f"Adding {card.name} to market")
+            game.log("Adding {card} to market", event_log.MARKET, card=card.name)
             self._market[card.name].append(card)
+        self._slots_changed()
 
     def empty_market(self, game):
-        for card in itertools.chain.from_iterable(self._market.values()):
-            self._deck.insert(0, card)
+        self._deck.extendleft(itertools.chain.from_iterable(self._market.values()))
         self._market.clear()
+        self._slots_changed()
 
     def empty_market_slot(self, game, slot):
-        for card in self._market[slot]:
-            self._deck.insert(0, card)
+        self._deck.extendleft(self._market[slot])
         del self._market[slot]
+        self._slots_changed()
+
+    def _slots_changed(self):
+        self._slots = list(self._market)
+        self._cheapest = min((cards[0].cost for cards in self._market.values()), default=None)
+
+    def affordable(self, influence):
+        """Whether influence buys anything in the market, at printed cost."""
+        return self._cheapest is not None and self._cheapest <= influence
 
     def __getitem__(self, pos):
-        if pos not in range(len(self._market)):
+        if not 0 <= pos < len(self._slots):
             raise ValueError("Programmer Error! Invalid position!")
-        name = list(self._market.keys())[pos]
-        return self._market[name][0]
+        return self._market[self._slots[pos]][0]
 
     def remove(self, name):
         if name not in self._market:
@@ -75,16 +101,47 @@ class HogwartsDeck(object):
         card = self._market[name].pop()
         if len(self._market[name]) == 0:
             del self._market[name]
+            self._slots_changed()
         return card
 
 
-class _HogwartsCard(object):
+class _Shared(type):
+    """Cards hand out one shared, read-only object per class (and constructor
+    arguments) rather than one per copy, since almost all of them never change
+    once made. Classes whose cards keep state of their own (anything outside
+    the definition slots, or no __slots__ at all) get a fresh object each time.
+    """
+
+    def __init__(cls, name, bases, namespace):
+        super().__init__(name, bases, namespace)
+        cls._shared = {}
+        cls._per_copy = any('__slots__' not in klass.__dict__ or not state.DEFINITION_FIELDS.issuperset(klass.__slots__)
+                            for klass in cls.__mro__[:-1])
+
+    def __call__(cls, *args):
+        if cls._per_copy:
+            return super().__call__(*args)
+        try:
+            return cls._shared[args]
+        except KeyError:
+            card = cls._shared[args] = super().__call__(*args)
+            return card
+
+
+class _HogwartsCard(object, metaclass=_Shared):
+    __slots__ = ('name', 'description', 'cost', 'rolls_house_die')
+
     def __init__(self, name, description, cost, rolls_house_die=False):
         self.name = name
         self.description = description
         self.cost = cost
         self.rolls_house_die = rolls_house_die
 
+    def __setattr__(self, name, value):
+        if name in state.DEFINITION_FIELDS and hasattr(self, name):
+            raise AttributeError(f"Programmer Error! Card definitions are read-only, can't change {self.name}'s {name}")
+        object.__setattr__(self, name, value)
+
     def display_state(self, window, i, count):
         window.addstr(f"{i}: ", curses.A_BOLD)
         self.display_name(window, curses.A_BOLD)
@@ -99,8 +156,9 @@ class _HogwartsCard(object):
         return f"{self.name} ({self.cost}{constants.INFLUENCE}): {self.description}"
 
     def play(self, game):
-        game.log(f"Playing {self}")
-        self._effect(game)
+        game.log("Playing {card}", event_log.PLAY_CARD, card=self)
+        with game.effect_source(self):
+            self._effect(game)
 
     def _effect(self, game):
         raise NotImplementedError("Programmer Error! {self.name} effect not implemented!")
@@ -127,6 +185,8 @@ class _HogwartsCard(object):
 
 
 class Ally(_HogwartsCard):
+    __slots__ = ()
+
     def is_ally(self):
         return True
 
@@ -136,6 +196,8 @@ class Ally(_HogwartsCard):
 
 
 class Item(_HogwartsCard):
+    __slots__ = ()
+
     def is_item(self):
         return True
 
@@ -145,6 +207,8 @@ class Item(_HogwartsCard):
 
 
 class Spell(_HogwartsCard):
+    __slots__ = ()
+
     def is_spell(self):
         return True
 
@@ -154,6 +218,8 @@ class Spell(_HogwartsCard):
 
 
 class _WeasleyTwin(Ally):
+    __slots__ = ()
+
     def _effect(self, game):
         game.heroes.active_hero.add_damage(game)
         game.roll_gryffindor_die()
@@ -3,6 +3,8 @@ import constants
 
 
 class Bezoar(Item):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Bezoar", f"One hero gains 3{constants.HEART}; draw a card", 4)
 
@@ -3,6 +3,8 @@ import constants
 
 
 class Butterbeer(Item):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Butterbeer", f"Two heroes gain 1{constants.INFLUENCE} and 1{constants.HEART}", 3)
 
@@ -3,6 +3,8 @@ import constants
 
 
 class CedricDiggory(Ally):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Cedric Diggory", f"Gain 1{constants.DAMAGE}; roll the Hufflepuff die", 4, rolls_house_die=True)
 
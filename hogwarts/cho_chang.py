@@ -3,6 +3,8 @@ import constants
 
 
 class ChoChang(Ally):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Cho Chang", "Draw three cards, discard two; roll the Ravenclaw die", 4, rolls_house_die=True)
 
@@ -3,6 +3,8 @@ import constants
 
 
 class ChocolateFrog(Item):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Chocolate Frog", f"One hero gains 1{constants.INFLUENCE} and 1{constants.HEART}; if discarded, gain 1{constants.INFLUENCE} and 1{constants.HEART}", 2)
 
@@ -3,8 +3,11 @@ import constants
 
 
 class Confundus(Spell):
+    __slots__ = ('_used_ability',)
+
     def __init__(self):
         super().__init__("Confundus", f"Gain 1{constants.DAMAGE}; if you damage each Villian, remove 1{constants.CONTROL}", 3)
+        self._used_ability = False
 
     def _effect(self, game):
         game.heroes.active_hero.add_damage(game)
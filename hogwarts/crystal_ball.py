@@ -3,6 +3,8 @@ import constants
 
 
 class CrystalBall(Item):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Crystal Ball", "Draw two cards; discard one card", 3)
 
@@ -3,6 +3,8 @@ import constants
 
 
 class Deluminator(Item):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Deluminator", f"Remove 2{constants.CONTROL}", 6)
 
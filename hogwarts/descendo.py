@@ -3,6 +3,8 @@ import constants
 
 
 class Descendo(Spell):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Descendo", f"Gain 2{constants.DAMAGE}", 5)
 
@@ -3,6 +3,8 @@ import constants
 
 
 class Detention(Item):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Detention!", f"If you discard this, lose 2{constants.HEART}", 0)
 
@@ -3,6 +3,8 @@ import constants
 
 
 class Dobby(Ally):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Dobby", f"Remove 1{constants.CONTROL} and draw a card", 4)
 
@@ -3,6 +3,8 @@ import constants
 
 
 class DragonsBlood(Item):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             "Dragon's Blood",
@@ -12,6 +14,6 @@ class DragonsBlood(Item):
     def _effect(self, game):
         game.heroes.all_heroes.add_hearts(game, 3)
         for creature in game.villain_deck.all_creatures:
-            creature._max_influence_per_turn += 1
+            creature.allow_extra_influence(game)
 
 CARDS_BY_NAME["Dragon's Blood"] = DragonsBlood
@@ -3,6 +3,8 @@ import constants
 
 
 class ElderWand(Item):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Elder Wand", f"For each Spell played gain 1{constants.DAMAGE} and 1{constants.HEART}", 7)
 
@@ -3,6 +3,8 @@ import constants
 
 
 class ErumpentHorn(Item):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             "Erumpent Horn",
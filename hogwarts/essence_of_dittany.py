@@ -3,6 +3,8 @@ import constants
 
 
 class EssenceOfDittany(Item):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Essence of Dittany", f"Any hero gains 2{constants.HEART}", 2)
 
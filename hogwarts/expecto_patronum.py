@@ -3,6 +3,8 @@ import constants
 
 
 class ExpectoPatronum(Spell):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Expecto Patronum", f"Gain 1{constants.DAMAGE}; remove 1{constants.CONTROL}", 5)
 
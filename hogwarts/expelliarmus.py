@@ -3,6 +3,8 @@ import constants
 
 
 class Expelliarmus(Spell):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Expelliarmus", f"Gain 2{constants.DAMAGE} and draw a card", 6)
 
@@ -3,6 +3,8 @@ import constants
 
 
 class Fang(Ally):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             "Fang",
@@ -3,6 +3,8 @@ import constants
 
 
 class Fawkes(Ally):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Fawkes", f"Gain 2{constants.DAMAGE} or ALL heroes gain 2{constants.HEART}", 5)
 
@@ -3,6 +3,8 @@ import constants
 
 
 class FelixFelicis(Item):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             "Felix Felicis",
@@ -3,6 +3,8 @@ import constants
 
 
 class FiliusFlitwick(Ally):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Filius Flitwick", f"Gain 1{constants.INFLUENCE} and draw a card; roll the Ravenclaw die", 6, rolls_house_die=True)
 
@@ -3,6 +3,8 @@ import constants
 
 
 class Finite(Spell):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Finite", f"Remove 1{constants.CONTROL}", 3)
 
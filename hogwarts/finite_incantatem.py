@@ -3,6 +3,8 @@ import constants
 
 
 class FiniteIncantatem(Spell):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             "Finite Incantatem",
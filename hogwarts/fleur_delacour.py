@@ -3,6 +3,8 @@ import constants
 
 
 class FleurDelacour(Ally):
+    __slots__ = ('_used_ability',)
+
     def __init__(self):
         super().__init__("Fleur Delacour", f"Gain 2{constants.INFLUENCE}; if you play another ally, gain 2{constants.HEART}", 4)
         self._used_ability = False
@@ -4,6 +4,8 @@ import constants
 
 
 class FredWeasley(_WeasleyTwin):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Fred Weasley", f"Gain 1{constants.DAMAGE}; if another hero has a Weasley, ALL heroes gain 1{constants.INFLUENCE}; roll the Gryffindor die", 4, rolls_house_die=True)
 
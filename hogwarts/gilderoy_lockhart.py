@@ -3,6 +3,8 @@ import constants
 
 
 class GilderyLockhart(Ally):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Gilderoy Lockhart", f"Draw a card, then discard a card; if discarded, draw a card", 2)
 
@@ -3,6 +3,8 @@ import constants
 
 
 class Gillyweed(Item):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             "Gillyweed",
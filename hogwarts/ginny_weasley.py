@@ -3,6 +3,8 @@ import constants
 
 
 class GinnyWeasley(Ally):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Ginny Weasley", f"Gain 1{constants.DAMAGE} and 1{constants.INFLUENCE}", 4)
 
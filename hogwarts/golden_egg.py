@@ -3,6 +3,8 @@ import constants
 
 
 class GoldenEgg(Item):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             "Golden Egg",
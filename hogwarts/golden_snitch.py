@@ -3,6 +3,8 @@ import constants
 
 
 class GoldenSnitch(Item):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Golden Snitch", f"Gain 2{constants.INFLUENCE} and draw a card", 5)
 
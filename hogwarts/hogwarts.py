@@ -5,6 +5,8 @@ import constants
 
 
 class Scourgify(Spell):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             "Scourgify",
@@ -19,6 +21,8 @@ CARDS_BY_NAME['Scourgify'] = Scourgify
 
 
 class Locomotor(Spell):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             "Locomotor",
@@ -44,13 +48,15 @@ class Locomotor(Spell):
             game, prompt=f"Choose hero to give {card.name} to, or (c)ancel: ", optional=True, disallow=hero)
         if target is None:
             return
-        hero._discard.remove(card)
+        hero.take_from_discard(choice)
         target._hand.append(card)
 
 CARDS_BY_NAME['Locomotor'] = Locomotor
 
 
 class ArrestoMomentum(Spell):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             "Arresto Momentum",
@@ -3,6 +3,8 @@ import constants
 
 
 class HogwartsAHistory(Item):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Hogwarts: A History", "Roll any house die", 4, rolls_house_die=True)
 
@@ -3,6 +3,8 @@ import constants
 
 
 class HoraceSlughorn(Ally):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Horace Slughorn", f"ALL heroes gain 1{constants.INFLUENCE} or 1{constants.HEART}; roll the Slytherin die", 6, rolls_house_die=True)
 
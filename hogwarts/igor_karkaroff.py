@@ -3,6 +3,8 @@ import constants
 
 
 class IgorKarkaroff(Ally):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             "Igor Karkaroff",
@@ -3,6 +3,8 @@ import constants
 
 
 class Immobulus(Spell):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             "Immobulus",
@@ -3,6 +3,8 @@ import constants
 
 
 class Incendio(Spell):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Incendio", f"Gain 1{constants.DAMAGE} and draw a card", 4)
 
@@ -3,6 +3,8 @@ import constants
 
 
 class KingsleyShacklebolt(Ally):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Kingsley Shacklebolt", f"Gain 2{constants.DAMAGE} and 1{constants.HEART}; remove 1{constants.CONTROL}", 7)
 
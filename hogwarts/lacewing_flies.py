@@ -3,6 +3,8 @@ import constants
 
 
 class LacewingFlies(Item):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             "Lacewing Flies",
@@ -3,6 +3,8 @@ import constants
 
 
 class Lumos(Spell):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Lumos", "ALL heroes draw a card", 4)
 
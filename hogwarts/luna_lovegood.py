@@ -3,6 +3,8 @@ import constants
 
 
 class LunaLovegood(Ally):
+    __slots__ = ('_used_ability',)
+
     def __init__(self):
         super().__init__("Luna Lovegood", f"Gain 1{constants.INFLUENCE}; if you play an item, gain 1{constants.DAMAGE}; roll the Ravenclaw die", 5, rolls_house_die=True)
         self._used_ability = False
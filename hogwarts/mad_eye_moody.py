@@ -3,6 +3,8 @@ import constants
 
 
 class MadEyeMoody(Ally):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Mad-eye Moody", f"Gain 2{constants.INFLUENCE}, remove 1{constants.CONTROL}", 6)
 
@@ -3,6 +3,8 @@ import constants
 
 
 class MaraudersMap(Item):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Marauder's Map", "Draw two cards; if discarded, ALL heroes draw a card", 5)
 
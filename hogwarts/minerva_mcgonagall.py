@@ -3,6 +3,8 @@ import constants
 
 
 class MinervaMcGonagall(Ally):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Minerva McGonagall", f"Gain 1{constants.INFLUENCE} and 1{constants.DAMAGE}; roll the Gryffindor die", 6, rolls_house_die=True)
 
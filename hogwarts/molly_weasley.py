@@ -3,6 +3,8 @@ import constants
 
 
 class MollyWeasley(Ally):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Molly Weasley", f"ALL heroes gain 1{constants.INFLUENCE} and 2{constants.HEART}", 6)
 
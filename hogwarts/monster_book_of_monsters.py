@@ -3,6 +3,8 @@ import constants
 
 
 class MonsterBookOfMonster(Item):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             "Monster Book of Monsters",
@@ -3,6 +3,8 @@ import constants
 
 
 class Nimbus2001(Item):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Nimbus 2001", f"Gain 2{constants.DAMAGE}; if you defeat a Villain, gain 2{constants.INFLUENCE}", 5)
 
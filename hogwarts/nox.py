@@ -3,6 +3,8 @@ import constants
 
 
 class Nox(Spell):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             "Nox",
@@ -3,6 +3,8 @@ import constants
 
 
 class NymphadoraTonks(Ally):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Nymphadora Tonks", f"Gain 3{constants.INFLUENCE} or 2{constants.DAMAGE}, or remove 1{constants.CONTROL}", 5)
 
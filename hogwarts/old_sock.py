@@ -3,6 +3,8 @@ import constants
 
 
 class OldSock(Item):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             "Old Sock",
@@ -3,6 +3,8 @@ import constants
 
 
 class OliverWood(Ally):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Oliver Wood", f"Gain 1{constants.DAMAGE}, if you defeat a Villain one hero gains 2{constants.HEART}", 3)
 
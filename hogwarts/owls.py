@@ -3,6 +3,8 @@ import constants
 
 
 class Owls(Item):
+    __slots__ = ('_used_ability', '_spells_played')
+
     def __init__(self):
         super().__init__("O.W.L.S.", f"Gain 2{constants.INFLUENCE}; if you play 2 spells, gain 1{constants.DAMAGE} and 1{constants.HEART}", 4)
         self._used_ability = False
@@ -11,7 +13,7 @@ class Owls(Item):
     def _effect(self, game):
         self._used_ability = False
         game.heroes.active_hero.add_influence(game, 2)
-        self._spells_played = sum([1 for card in game.heroes.active_hero._play_area if card.is_spell()])
+        self._spells_played = game.heroes.active_hero._play_area.count_spells()
         if self._spells_played >= 2:
             game.log(f"Already played {self._spells_played} spells, gaining 1{constants.DAMAGE} and 1{constants.HEART}")
             game.heroes.active_hero.add(game, damage=1, hearts=1)
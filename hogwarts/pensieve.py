@@ -3,6 +3,8 @@ import constants
 
 
 class Pensieve(Item):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Pensieve", f"Two heroes gain 1{constants.INFLUENCE} and draw a card", 5)
 
@@ -3,6 +3,8 @@ import constants
 
 
 class PetrificusTotalus(Spell):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Petrificus Totalus", f"Gain 1{constants.DAMAGE}; stun a Villain", 6)
 
@@ -3,6 +3,8 @@ import constants
 
 
 class PolyjuicePotion(Item):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Polyjuice Potion", "Choose a played Ally and gain its effect", 3)
 
@@ -13,7 +15,8 @@ class PolyjuicePotion(Item):
             return
         if len(played_allies) == 1:
             game.log(f"Only one ally played, copying {played_allies[0].name}")
-            played_allies[0]._effect(game)
+            with game.effect_source(played_allies[0]):
+                played_allies[0]._effect(game)
             return
         while True:
             choice = int(game.input("Choose played ally to polyjuice: ", range(len(game.heroes.active_hero._play_area))))
@@ -22,7 +25,8 @@ class PolyjuicePotion(Item):
                 game.log("{card.name} is not an ally!")
                 continue
             game.log(f"Copying {card.name}")
-            card._effect(game)
+            with game.effect_source(card):
+                card._effect(game)
             break
 
 CARDS_BY_NAME['Polyjuice Potion'] = PolyjuicePotion
@@ -3,6 +3,8 @@ import constants
 
 
 class PomonaSprout(Ally):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Pomona Sprout", f"Gain 1{constants.INFLUENCE}; anyone gains 2{constants.HEART}; roll the Hufflepuff die", 6, rolls_house_die=True)
 
@@ -3,6 +3,8 @@ import constants
 
 
 class PrioriIncantatem(Spell):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             "Priori Incantatem",
@@ -16,7 +18,8 @@ class PrioriIncantatem(Spell):
             return
         if len(played_spells) == 1:
             game.log(f"Only one spell played, copying {played_spells[0].name}")
-            played_spells[0]._effect(game)
+            with game.effect_source(played_spells[0]):
+                played_spells[0]._effect(game)
             return
         while True:
             choice = int(game.input("Choose played spell to polyjuice: ", range(len(game.heroes.active_hero._play_area))))
@@ -25,7 +28,8 @@ class PrioriIncantatem(Spell):
                 game.log("{card.name} is not an spell!")
                 continue
             game.log(f"Copying {card.name}")
-            card._effect(game)
+            with game.effect_source(card):
+                card._effect(game)
             break
 
 CARDS_BY_NAME['Priori Incantatem'] = PrioriIncantatem
@@ -3,6 +3,8 @@ import constants
 
 
 class Protego(Spell):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Protego", f"Gain 1{constants.DAMAGE} and 1{constants.HEART}; if discarded, gain 1{constants.DAMAGE} and 1{constants.HEART}", 5)
 
@@ -3,6 +3,8 @@ import constants
 
 
 class QuidditchGear(Item):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Quidditch Gear", f"Gain 1{constants.DAMAGE} and 1{constants.HEART}", 3)
 
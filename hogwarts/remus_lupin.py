@@ -3,6 +3,8 @@ import constants
 
 
 class RemusLupin(Ally):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Remus Lupin", f"Gain 1{constants.DAMAGE}, any hero gains 3{constants.HEART}", 4)
 
@@ -3,6 +3,8 @@ import constants
 
 
 class Reparo(Spell):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Reparo", f"Gain 2{constants.INFLUENCE} or draw a card", 3)
 
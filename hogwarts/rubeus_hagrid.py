@@ -3,6 +3,8 @@ import constants
 
 
 class RubeusHagrid(Ally):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Rubeus Hagrid", f"Gain 1{constants.DAMAGE}; ALL heroes gain 1{constants.HEART}", 4)
 
@@ -3,6 +3,8 @@ import constants
 
 
 class SeverusSnape(Ally):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Severus Snape", f"Gain 1{constants.DAMAGE} and 2{constants.HEART}; roll the Slytherin die", 6, rolls_house_die=True)
 
@@ -3,6 +3,8 @@ import constants
 
 
 class SiriusBlack(Ally):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Sirius Black", f"Gain 2{constants.DAMAGE} and 1{constants.INFLUENCE}", 6)
 
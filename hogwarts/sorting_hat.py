@@ -3,6 +3,8 @@ import constants
 
 
 class SortingHat(Item):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Sorting Hat", f"Gain 2{constants.INFLUENCE}, may put acquired Allies on top of deck", 4)
 
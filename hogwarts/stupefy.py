@@ -3,6 +3,8 @@ import constants
 
 
 class Stupefy(Spell):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Stupefy", f"Gain 1{constants.DAMAGE}; remove 1{constants.CONTROL}; draw a card", 6)
 
@@ -3,6 +3,8 @@ import constants
 
 
 class SwordOfGryffindor(Item):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Sword of Gryffindor", f"Gain 2{constants.DAMAGE}; Roll the Gryffindor die twice", 7, rolls_house_die=True)
 
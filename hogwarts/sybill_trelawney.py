@@ -3,6 +3,8 @@ import constants
 
 
 class SybillTrelawney(Ally):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             "Sybill Trelawney",
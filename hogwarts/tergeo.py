@@ -3,6 +3,8 @@ import constants
 
 
 class Tergeo(Spell):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             "Tergeo",
@@ -3,6 +3,8 @@ import constants
 
 
 class TriwizardCup(Item):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Triwizard Cup", f"Gain 1{constants.DAMAGE}, 1{constants.INFLUENCE}, and 1{constants.HEART}", 5)
 
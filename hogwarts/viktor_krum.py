@@ -3,6 +3,8 @@ import constants
 
 
 class ViktorKrum(Ally):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("Viktor Krum", f"Gain 2{constants.DAMAGE}, if you defeat a Villain gain 1{constants.INFLUENCE} and 1{constants.HEART}", 5)
 
@@ -1,17 +1,23 @@
 import curses
 
 import constants
+import decisions
+import effects
+import state
 
 class Locations(object):
     # def __init__(self, window, game_num):
-    def __init__(self, window, game_locations, num_heroes):
+    def __init__(self, window, game_locations, num_heroes, listeners=None):
         self._window = window
-        self._init_window()
-        self._pad = curses.newpad(100, 100)
+        if self._window is not None:
+            self._init_window()
+            self._pad = curses.newpad(100, 100)
+        # What the panel last drew, to skip redrawing when nothing changed
+        self._displayed = None
 
         self._locations = [LOCATIONS_BY_NAME[l](num_heroes) for l in game_locations]
         self._current = 0
-        self._control_callbacks = []
+        self._listeners = listeners if listeners is not None else effects.Listeners()
         # simple ref counter of reasons why control cannot be removed
         self._control_remove_disallowed = 0
 
@@ -37,11 +43,17 @@ class Locations(object):
         return self._current < len(self._locations)
 
     def display_state(self, resize=False, size=None):
+        if self._window is None:
+            return
         if resize:
             self._window.resize(*size)
             self._window.clear()
             self._init_window()
-        self._pad.clear()
+        key = (self._current, tuple(state.fingerprint(location) for location in self._locations))
+        if not resize and key == self._displayed:
+            return
+        self._displayed = key
+        self._pad.erase()
         for i, location in enumerate(self._locations):
             attr = curses.A_BOLD | curses.color_pair(1) if i == self._current else curses.A_NORMAL
             self._pad.addstr(f"{location}\n", attr)
@@ -50,10 +62,10 @@ class Locations(object):
         self._pad.noutrefresh(0,0, self._pad_start_line,self._pad_start_col, self._pad_end_line,self._pad_end_col)
 
     def add_control_callback(self, game, callback):
-        self._control_callbacks.append(callback)
+        self._listeners.add(effects.CONTROL, self, callback.control_callback)
 
     def remove_control_callback(self, game, callback):
-        self._control_callbacks.remove(callback)
+        self._listeners.remove(effects.CONTROL, self, callback.control_callback)
 
     @property
     def can_remove_control(self):
@@ -69,7 +81,9 @@ class Locations(object):
         if amount < 0 and not self.can_remove_control:
             game.log(f"{constants.CONTROL} cannot be removed!")
             return
-        self.current._add_control(game, amount, self._control_callbacks)
+        control_added = self.current._add_control(game, amount)
+        if control_added != 0:
+            self._listeners.run(game, effects.CONTROL, self, control_added)
 
     def remove_control(self, game, amount=1):
         self.add_control(game, -amount)
@@ -79,6 +93,8 @@ class Locations(object):
 
 
 class Location(object):
+    __slots__ = ('name', 'unique_name', 'dark_arts_count', '_control_max', 'desc', 'action', '_control')
+
     def __init__(self, name, dark_arts_count, control_max, desc="", action=None, unique_name=None):
         self.name = name
         self.unique_name = unique_name if unique_name is not None else name
@@ -94,12 +110,13 @@ class Location(object):
 
     def _reveal(self, game):
         game.log(f"Moving to location {self.name}! {self.desc}")
-        self._reveal_effect(game)
+        with game.effect_source(self):
+            self._reveal_effect(game)
 
     def _reveal_effect(self, game):
         pass
 
-    def _add_control(self, game, amount, callbacks):
+    def _add_control(self, game, amount):
         control_start = self._control
         self._control += amount
         action = "added" if amount > 0 else "removed"
@@ -109,10 +126,7 @@ class Location(object):
         if self._control < 0:
             self._control = 0
             game.log(f"{self.name} is empty of {constants.CONTROL}! Only {action} {abs(self._control - control_start)}{constants.CONTROL}")
-        control_added = self._control - control_start
-        if self._control != control_start:
-            for callback in callbacks:
-                callback.control_callback(game, control_added)
+        return self._control - control_start
 
     def _is_controlled(self):
         return self._control == self._control_max
@@ -122,6 +136,8 @@ LOCATIONS_BY_NAME = {}
 
 
 class DiagonAlley(Location):
+    __slots__ = ()
+
     def __init__(self, _):
         super().__init__("Diagon Alley", 1, 4)
 
@@ -129,6 +145,8 @@ LOCATIONS_BY_NAME["Diagon Alley"] = DiagonAlley
 
 
 class MirrorOfErised(Location):
+    __slots__ = ()
+
     def __init__(self, _):
         super().__init__("Mirror of Erised", 1, 4)
 
@@ -136,6 +154,8 @@ LOCATIONS_BY_NAME["Mirror of Erised"] = MirrorOfErised
 
 
 class ForbiddenForest(Location):
+    __slots__ = ()
+
     def __init__(self, _):
         super().__init__("Forbidden Forest", 1, 4)
 
@@ -143,6 +163,8 @@ LOCATIONS_BY_NAME["Forbidden Forest"] = ForbiddenForest
 
 
 class QuidditchPitch(Location):
+    __slots__ = ()
+
     def __init__(self, _):
         super().__init__("Quidditch Pitch", 1, 4)
 
@@ -150,6 +172,8 @@ LOCATIONS_BY_NAME["Quidditch Pitch"] = QuidditchPitch
 
 
 class ChamberOfSecrets(Location):
+    __slots__ = ()
+
     def __init__(self, _):
         super().__init__("Chamber of Secrets", 2, 5)
 
@@ -157,6 +181,8 @@ LOCATIONS_BY_NAME["Chamber of Secrets"] = ChamberOfSecrets
 
 
 class HogwartsExpress(Location):
+    __slots__ = ()
+
     def __init__(self, _):
         super().__init__("Hogwarts Express", 1, 5)
 
@@ -164,6 +190,8 @@ LOCATIONS_BY_NAME["Hogwarts Express"] = HogwartsExpress
 
 
 class HogsmeadeVillage(Location):
+    __slots__ = ()
+
     def __init__(self, _):
         super().__init__("Hogsmeade Village", 2, 6)
 
@@ -171,6 +199,8 @@ LOCATIONS_BY_NAME["Hogsmeade Village"] = HogsmeadeVillage
 
 
 class ShriekingShack(Location):
+    __slots__ = ()
+
     def __init__(self, _):
         super().__init__("Shrieking Shack", 2, 6)
 
@@ -178,6 +208,8 @@ LOCATIONS_BY_NAME["Shrieking Shack"] = ShriekingShack
 
 
 class QuidditchWorldCup(Location):
+    __slots__ = ()
+
     def __init__(self, _):
         super().__init__("Quidditch World Cup", 1, 6)
 
@@ -185,6 +217,8 @@ LOCATIONS_BY_NAME["Quidditch World Cup"] = QuidditchWorldCup
 
 
 class TriwizardTournament(Location):
+    __slots__ = ()
+
     def __init__(self, _):
         super().__init__("Triwizard Tournament", 2, 6)
 
@@ -192,6 +226,8 @@ LOCATIONS_BY_NAME["Triwizard Tournament"] = TriwizardTournament
 
 
 class Graveyard(Location):
+    __slots__ = ()
+
     def __init__(self, _):
         super().__init__("Graveyard", 2, 7, "ALL heroes discard an ally")
 
@@ -199,12 +235,12 @@ class Graveyard(Location):
         game.heroes.all_heroes.effect(game, self.__per_hero)
 
     def __per_hero(self, game, hero):
-        allies = sum(1 for card in hero._hand if card.is_ally())
+        allies = hero._hand.count_allies()
         if allies == 0:
             game.log(f"{hero.name} has no allies to discard, safe!")
             return
         while True:
-            choice = int(game.input(f"Choose an ally for {hero.name} to discard: ", range(len(hero._hand))))
+            choice = int(game.input(f"Choose an ally for {hero.name} to discard: ", range(len(hero._hand)), kind=decisions.DecisionKind.DISCARD, hero=hero))
             card = hero._hand[choice]
             if not card.is_ally():
                 game.log(f"{card.name} is not an ally!")
@@ -216,6 +252,8 @@ LOCATIONS_BY_NAME["Graveyard"] = Graveyard
 
 
 class Azkaban(Location):
+    __slots__ = ()
+
     def __init__(self, _):
         super().__init__("Azkaban", 1, 7)
 
@@ -223,6 +261,8 @@ LOCATIONS_BY_NAME["Azkaban"] = Azkaban
 
 
 class HallOfProphecy(Location):
+    __slots__ = ()
+
     def __init__(self, _):
         super().__init__("Hall of Prophecy", 2, 7)
 
@@ -230,6 +270,8 @@ LOCATIONS_BY_NAME["Hall of Prophecy"] = HallOfProphecy
 
 
 class MinistryOfMagic(Location):
+    __slots__ = ()
+
     def __init__(self, _):
         super().__init__("Ministry of Magic", 2, 7, "ALL heroes discard a spell")
 
@@ -237,12 +279,12 @@ class MinistryOfMagic(Location):
         game.heroes.all_heroes.effect(game, self.__per_hero)
 
     def __per_hero(self, game, hero):
-        spells = sum(1 for card in hero._hand if card.is_spell())
+        spells = hero._hand.count_spells()
         if spells == 0:
             game.log(f"{hero.name} has no spells to discard, safe!")
             return
         while True:
-            choice = int(game.input(f"Choose a spell for {hero.name} to discard: ", range(len(hero._hand))))
+            choice = int(game.input(f"Choose a spell for {hero.name} to discard: ", range(len(hero._hand)), kind=decisions.DecisionKind.DISCARD, hero=hero))
             card = hero._hand[choice]
             if not card.is_spell():
                 game.log(f"{card.name} is not a spell!")
@@ -254,6 +296,8 @@ LOCATIONS_BY_NAME["Ministry of Magic"] = MinistryOfMagic
 
 
 class KnockturnAlley(Location):
+    __slots__ = ()
+
     def __init__(self, _):
         super().__init__("Knockturn Alley", 1, 7)
 
@@ -261,6 +305,8 @@ LOCATIONS_BY_NAME["Knockturn Alley"] = KnockturnAlley
 
 
 class TheBurrow(Location):
+    __slots__ = ()
+
     def __init__(self, _):
         super().__init__("The Burrow", 2, 7)
 
@@ -268,6 +314,8 @@ LOCATIONS_BY_NAME["The Burrow"] = TheBurrow
 
 
 class AstronomyTower(Location):
+    __slots__ = ()
+
     def __init__(self, _):
         super().__init__("Astronomy Tower", 3, 8, "ALL heroes discard an item")
 
@@ -275,12 +323,12 @@ class AstronomyTower(Location):
         game.heroes.all_heroes.effect(game, self.__per_hero)
 
     def __per_hero(self, game, hero):
-        items = sum(1 for card in hero._hand if card.is_item())
+        items = hero._hand.count_items()
         if items == 0:
             game.log(f"{hero.name} has no items to discard, safe!")
             return
         while True:
-            choice = int(game.input(f"Choose an item for {hero.name} to discard: ", range(len(hero._hand))))
+            choice = int(game.input(f"Choose an item for {hero.name} to discard: ", range(len(hero._hand)), kind=decisions.DecisionKind.DISCARD, hero=hero))
             card = hero._hand[choice]
             if not card.is_item():
                 game.log(f"{card.name} is not an item!")
@@ -292,6 +340,8 @@ LOCATIONS_BY_NAME["Astronomy Tower"] = AstronomyTower
 
 
 class GodricsHollow(Location):
+    __slots__ = ()
+
     def __init__(self, _):
         super().__init__("Godric's Hollow", 1, 6)
 
@@ -299,6 +349,8 @@ LOCATIONS_BY_NAME["Godric's Hollow"] = GodricsHollow
 
 
 class Gringotts(Location):
+    __slots__ = ()
+
     def __init__(self, _):
         super().__init__("Gringotts", 2, 6)
 
@@ -306,6 +358,8 @@ LOCATIONS_BY_NAME["Gringotts"] = Gringotts
 
 
 class RoomOfRequirement(Location):
+    __slots__ = ()
+
     def __init__(self, _):
         super().__init__("Room of Requirement", 2, 7)
 
@@ -313,15 +367,23 @@ LOCATIONS_BY_NAME["Room of Requirement"] = RoomOfRequirement
 
 
 class HogwartsCastle(Location):
+    __slots__ = ()
+
     def __init__(self, _):
-        super().__init__("Hogwarts Castle", 3, 8, f"ALL heroes lose 2{constants.HEART}, may spend 5{constants.DAMAGE} to remove 1{constants.CONTROL}", ('H', "(H)ogwarts Castle", self._action))
+        super().__init__("Hogwarts Castle", 3, 8, f"ALL heroes lose 2{constants.HEART}, may spend 5{constants.DAMAGE} to remove 1{constants.CONTROL}", ('H', "(H)ogwarts Castle", self._action, self._unavailable))
 
     def _reveal_effect(self, game):
         game.heroes.all_heroes.remove_hearts(game, 2)
 
-    def _action(self, game):
+    def _unavailable(self, game):
         if game.heroes.active_hero._damage_tokens < 5:
-            game.log(f"Not enough {constants.DAMAGE} to use Hogwarts Castle")
+            return f"Not enough {constants.DAMAGE} to use Hogwarts Castle"
+        return None
+
+    def _action(self, game):
+        reason = self._unavailable(game)
+        if reason is not None:
+            game.log(reason)
             return
         game.heroes.active_hero.remove_damage(game, 5)
         game.locations.remove_control(game)
@@ -330,6 +392,8 @@ LOCATIONS_BY_NAME["Hogwarts Castle"] = HogwartsCastle
 
 
 class CastleGates(Location):
+    __slots__ = ()
+
     def __init__(self, _):
         super().__init__("Castle Gates", 1, 5)
 
@@ -337,6 +401,8 @@ LOCATIONS_BY_NAME["Castle Gates"] = CastleGates
 
 
 class HagridsHut(Location):
+    __slots__ = ()
+
     def __init__(self, _):
         super().__init__("Hagrid's Hut", 2, 6)
 
@@ -344,6 +410,8 @@ LOCATIONS_BY_NAME["Hagrid's Hut"] = HagridsHut
 
 
 class GreatHallM1(Location):
+    __slots__ = ()
+
     def __init__(self, _):
         super().__init__("Great Hall", 3, 7, unique_name="Great Hall (m1)")
 
@@ -351,6 +419,8 @@ LOCATIONS_BY_NAME["Great Hall (m1)"] = GreatHallM1
 
 
 class DADAClassroom(Location):
+    __slots__ = ()
+
     def __init__(self, _):
         super().__init__("D.A.D.A. Classroom", 1, 6)
 
@@ -358,6 +428,8 @@ LOCATIONS_BY_NAME["D.A.D.A. Classroom"] = DADAClassroom
 
 
 class CastleHallways(Location):
+    __slots__ = ()
+
     def __init__(self, _):
         super().__init__("Castle Hallways", 2, 6)
 
@@ -365,6 +437,8 @@ LOCATIONS_BY_NAME["Castle Hallways"] = CastleHallways
 
 
 class WhompingWillow(Location):
+    __slots__ = ()
+
     def __init__(self, _):
         super().__init__("Whomping Willow", 3, 7)
 
@@ -372,6 +446,8 @@ LOCATIONS_BY_NAME["Whomping Willow"] = WhompingWillow
 
 
 class UnicornHollow(Location):
+    __slots__ = ()
+
     def __init__(self, _):
         super().__init__("Unicorn Hollow", 1, 5)
 
@@ -379,6 +455,8 @@ LOCATIONS_BY_NAME["Unicorn Hollow"] = UnicornHollow
 
 
 class AragogsLair(Location):
+    __slots__ = ()
+
     def __init__(self, _):
         super().__init__("Aragog's Lair", 2, 6)
 
@@ -386,6 +464,8 @@ LOCATIONS_BY_NAME["Aragog's Lair"] = AragogsLair
 
 
 class GiantClearing(Location):
+    __slots__ = ()
+
     def __init__(self, _):
         super().__init__("Giant Clearing", 3, 7)
 
@@ -393,6 +473,8 @@ LOCATIONS_BY_NAME["Giant Clearing"] = GiantClearing
 
 
 class SelectionOfChampions(Location):
+    __slots__ = ()
+
     def __init__(self, _):
         super().__init__("Selection of Champions", 1, 5)
 
@@ -400,6 +482,8 @@ LOCATIONS_BY_NAME["Selection of Champions"] = SelectionOfChampions
 
 
 class DragonArena(Location):
+    __slots__ = ()
+
     def __init__(self, _):
         super().__init__("Dragon Arena", 2, 6)
 
@@ -407,6 +491,8 @@ LOCATIONS_BY_NAME["Dragon Arena"] = DragonArena
 
 
 class MermaidVillage(Location):
+    __slots__ = ()
+
     def __init__(self, _):
         super().__init__("Mermaid Village", 2, 6)
 
@@ -414,6 +500,8 @@ LOCATIONS_BY_NAME["Mermaid Village"] = MermaidVillage
 
 
 class TriwizardMaze(Location):
+    __slots__ = ()
+
     def __init__(self, _):
         super().__init__("Triwizard Maze", 3, 7, f"Remove 1{constants.DAMAGE} and 1{constants.INFLUENCE} from ALL Creatures")
 
@@ -425,6 +513,8 @@ LOCATIONS_BY_NAME["Triwizard Maze"] = TriwizardMaze
 
 
 class TheBlackLake(Location):
+    __slots__ = ()
+
     def __init__(self, _):
         super().__init__("The Black Lake", 1, 5)
 
@@ -432,6 +522,8 @@ LOCATIONS_BY_NAME["The Black Lake"] = TheBlackLake
 
 
 class TheHospitalWing(Location):
+    __slots__ = ()
+
     def __init__(self, num_heroes):
         super().__init__("The Hospital Wing", 2, 6 if num_heroes < 4 else 7)
 
@@ -439,6 +531,8 @@ LOCATIONS_BY_NAME["The Hospital Wing"] = TheHospitalWing
 
 
 class TheHogwartsLibrary(Location):
+    __slots__ = ()
+
     def __init__(self, _):
         super().__init__("The Hogwarts Library", 3, 7)
 
@@ -446,6 +540,8 @@ LOCATIONS_BY_NAME["The Hogwarts Library"] = TheHogwartsLibrary
 
 
 class MinistryOfMagicAtrium(Location):
+    __slots__ = ()
+
     def __init__(self, num_heroes):
         super().__init__("Ministry of Magic Atrium", 1, 5 if num_heroes < 4 else 6)
 
@@ -453,6 +549,8 @@ LOCATIONS_BY_NAME["Ministry of Magic Atrium"] = MinistryOfMagicAtrium
 
 
 class MinistryCourtroom(Location):
+    __slots__ = ()
+
     def __init__(self, num_heroes):
         super().__init__("Ministry Courtroom", 2, 6 if num_heroes < 4 else 7)
 
@@ -460,6 +558,8 @@ LOCATIONS_BY_NAME["Ministry Courtroom"] = MinistryCourtroom
 
 
 class MinistryLift(Location):
+    __slots__ = ()
+
     def __init__(self, _):
         super().__init__("Ministry Lift", 3, 7)
 
@@ -467,6 +567,8 @@ LOCATIONS_BY_NAME["Ministry Lift"] = MinistryLift
 
 
 class MalfoyManor(Location):
+    __slots__ = ()
+
     def __init__(self, _):
         super().__init__("Malfoy Manor", 1, 5)
 
@@ -474,6 +576,8 @@ LOCATIONS_BY_NAME["Malfoy Manor"] = MalfoyManor
 
 
 class Cave(Location):
+    __slots__ = ()
+
     def __init__(self, num_heroes):
         super().__init__("Cave", 2, 5 if num_heroes < 4 else 6)
 
@@ -481,6 +585,8 @@ LOCATIONS_BY_NAME["Cave"] = Cave
 
 
 class AtopTheTower(Location):
+    __slots__ = ()
+
     def __init__(self, num_heroes):
         super().__init__("Atop the Tower", 3, 6 if num_heroes < 4 else 7)
 
@@ -488,6 +594,8 @@ LOCATIONS_BY_NAME["Atop the Tower"] = AtopTheTower
 
 
 class GreatHallP4(Location):
+    __slots__ = ()
+
     def __init__(self, num_heroes):
         super().__init__("Great Hall", 1, 6 if num_heroes < 4 else 7, unique_name="Great Hall (p4)")
 
@@ -495,6 +603,8 @@ LOCATIONS_BY_NAME["Great Hall (p4)"] = GreatHallP4
 
 
 class ForestClearing(Location):
+    __slots__ = ()
+
     def __init__(self, num_heroes):
         super().__init__("Forest Clearing", 2, 6 if num_heroes < 4 else 7)
 
@@ -502,6 +612,8 @@ LOCATIONS_BY_NAME["Forest Clearing"] = ForestClearing
 
 
 class CastleCourtyard(Location):
+    __slots__ = ()
+
     def __init__(self, num_heroes):
         super().__init__("Castle Courtyard", 3, 7 if num_heroes < 4 else 8)
 
@@ -0,0 +1,350 @@
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+import math
+import random
+import time
+
+import decisions
+import display
+import game
+
+
+class MCTSProvider(decisions.DecisionProvider):
+    """Bot that answers each decision with a Monte Carlo tree search over the next few turns.
+
+    Decisions happen in the middle of card effects, so the engine can't be
+    resumed from one directly. Instead the provider snapshots the game at the
+    start of every turn and remembers the answers given since; each rollout
+    restores that snapshot and replays those answers to get back to the
+    decision, then follows the tree (UCB1) and finishes with a fast default
+    policy for `horizon` turns. The tree below the chosen answer is kept for
+    the next decision in the same turn. Rollouts sample their own shuffles and
+    Dark Arts, so the same answers can lead to different decisions; each node
+    remembers the decision it was first reached at, and a rollout that gets
+    somewhere else leaves the tree there.
+
+    Each decision stops after `rollouts` rollouts or `time_budget` seconds,
+    whichever comes first. With `workers`, decisions are searched in parallel
+    by worker processes that rebuild the game from `game_spec` (config, hero
+    specs, seed) and this game's answers so far, and their root statistics
+    are merged.
+
+    Decisions for heroes named in `human_heroes` are passed on to `human`
+    instead, so a person can play alongside the bot; their answers are
+    recorded like the bot's so rollouts can replay them.
+
+    Rollouts that crash score as losses so one rules bug doesn't stop the
+    search, but every crash is counted in `rollout_errors` and logged to the
+    game. Call close() when done, to shut down the worker processes.
+    """
+
+    def __init__(self, rollouts=32, time_budget=None, horizon=2, exploration=1.4, seed=None,
+                 workers=0, game_spec=None, default_policy=decisions.GreedyProvider,
+                 delegate=frozenset({decisions.DecisionKind.PLAY_CARD, decisions.DecisionKind.CONFIRM}),
+                 margin=0.02, human=None, human_heroes=()):
+        if workers > 0 and game_spec is None:
+            raise ValueError("Programmer Error! Searching in workers needs the game spec to rebuild the game")
+        self._rollouts = rollouts
+        self._time_budget = time_budget
+        self._horizon = horizon
+        self._exploration = exploration
+        self._random = random.Random(seed)
+        self._workers = workers
+        self._game_spec = game_spec
+        self._default_policy = default_policy
+        # Decisions the default policy is trusted with, without searching
+        self._delegate = delegate
+        self._margin = margin
+        self._policy = default_policy(seed=self._random.random())
+        self._executor = None
+        self._human = human
+        self._human_heroes = set(human_heroes)
+
+        self._turn_start = None
+        self._turn_answers = []
+        self._retries = _Retries()
+        # Search tree below the next decision, kept from earlier searches this turn
+        self._tree = _Node()
+        # Every answer given this game, so workers can replay to the same decision
+        self._history = []
+        # Worker mode: replay these answers, search the next decision, then stop
+        self._replay = None
+        # Rollouts that crashed, by error
+        self.rollout_errors = Counter()
+
+    def start_turn(self, game):
+        self._turn_start = game.snapshot()
+        self._turn_answers = []
+        self._retries = _Retries()
+        self._tree = _Node()
+
+    def choose(self, game, decision):
+        choices = self._retries.filter(game, decision, candidates(game, decision))
+        if self._replay is not None and len(self._history) < len(self._replay):
+            answer = self._replay[len(self._history)]
+        elif self._human is not None and decision.hero is not None and decision.hero.name in self._human_heroes:
+            answer = self._human.choose(game, decision)
+        elif decision.kind in self._delegate:
+            answer = self._policy.choose(game, decision)
+        elif self._replay is not None:
+            raise _SearchDone(self._search(game, decision, choices))
+        elif len(choices) == 1:
+            answer = choices[0]
+        else:
+            # Stick with the default policy unless the search finds something clearly better
+            preferred = self._policy.choose(game, decision)
+            crashed = sum(self.rollout_errors.values())
+            if self._workers > 0:
+                stats = self._search_parallel(choices)
+            else:
+                stats = self._search(game, decision, choices)
+            crashed = sum(self.rollout_errors.values()) - crashed
+            if crashed > 0:
+                game.log(f"MCTS: {crashed} rollouts crashed, e.g. {self.rollout_errors.most_common(1)[0][0]}")
+            answer = _best(stats, choices, preferred, self._margin)
+        self._retries.answered(answer)
+        self._turn_answers.append(answer)
+        self._history.append(answer)
+        # The next decision's subtree, checked against that decision when it's searched
+        self._tree = self._tree.children.get(answer) or _Node()
+        return answer
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _search(self, game, decision, choices):
+        if len(choices) == 1:
+            return {choices[0]: (1, 0.0)}
+        if self._turn_start is None:
+            return {self._policy.choose(game, decision): (1, 0.0)}
+
+        root = self._tree
+        if root.key is not None and root.key != _key(decision, choices):
+            # Rollouts below the last answer got to some other decision first
+            root = self._tree = _Node()
+        baseline = _Baseline(game)
+        now = game.snapshot()
+        renderer, provider, logging = game._renderer, game._decision_provider, game.events.enabled
+        game._renderer = display.NullRenderer()
+        game.events.enabled = False
+        deadline = None if self._time_budget is None else time.monotonic() + self._time_budget
+        try:
+            while root.visits < self._rollouts:
+                if deadline is not None and time.monotonic() > deadline:
+                    break
+                game.restore(self._turn_start)
+                rollout = _Rollout(root, self._turn_answers, self._exploration, self._delegate,
+                                   self._default_policy(seed=self._random.random()), self._random)
+                game._decision_provider = rollout
+                try:
+                    won = game.play(game.turns + self._horizon)
+                except Exception as e:
+                    # Rules bugs shouldn't take the search down with them, so avoid
+                    # that line, but keep count so they don't go unnoticed
+                    self.rollout_errors[repr(e)] += 1
+                    won = False
+                rollout.backpropagate(1.0 if won else baseline.evaluate(game))
+        finally:
+            game.restore(now)
+            game._renderer = renderer
+            game._decision_provider = provider
+            game.events.enabled = logging
+        return {choice: (child.visits, child.value) for choice, child in root.children.items() if choice in choices}
+
+    def _search_parallel(self, choices):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self._workers)
+        config, hero_specs, seed = self._game_spec
+        rollouts = max(len(choices), self._rollouts // self._workers)
+        futures = [self._executor.submit(_worker_search, config, hero_specs, seed, list(self._history),
+                                         rollouts, self._time_budget, self._horizon, self._exploration,
+                                         self._random.random())
+                   for _ in range(self._workers)]
+        merged = {}
+        for future in futures:
+            stats, errors = future.result()
+            self.rollout_errors.update(errors)
+            for choice, (visits, value) in stats.items():
+                total_visits, total_value = merged.get(choice, (0, 0.0))
+                merged[choice] = (total_visits + visits, total_value + value)
+        return merged
+
+
+def candidates(game, decision):
+    """The legal choices worth searching: no quitting, and nothing that just cancels back to the menu."""
+    if decision.kind == decisions.DecisionKind.ACTION:
+        # Bots never quit, and cards in hand are never worth more unplayed
+        return [choice for choice in decision.legal
+                if choice != 'q' and (choice != 'e' or len(decision.hero._hand) == 0)]
+    if decision.kind in (decisions.DecisionKind.ASSIGN_DAMAGE, decisions.DecisionKind.ASSIGN_INFLUENCE, decisions.DecisionKind.BUY):
+        choices = [choice for choice in decision.legal if choice != 'c']
+        return choices if choices else ['c']
+    return list(decision.legal)
+
+
+def _best(stats, choices, preferred, margin):
+    means = {choice: value / visits for choice, (visits, value) in stats.items() if visits > 0 and choice in choices}
+    if not means:
+        return preferred if preferred in choices else choices[0]
+    best = max(means, key=means.get)
+    if preferred in means and means[preferred] + margin >= means[best]:
+        return preferred
+    return best
+
+
+class _Retries(object):
+    """Answers already given this turn to the same decision with the game in the same state.
+
+    Card effects re-prompt after an answer they reject ("not a spell!") and
+    cancelling goes back to the menu, both without changing anything, so an
+    answer that got back to the same place is dropped or the search would
+    loop forever.
+    """
+
+    def __init__(self):
+        self._tried = defaultdict(set)
+        self._last = None
+
+    def filter(self, game, decision, choices):
+        self._last = _fingerprint(game, decision)
+        tried = self._tried[self._last]
+        remaining = [choice for choice in choices if choice not in tried]
+        return remaining if remaining else choices
+
+    def answered(self, answer):
+        self._tried[self._last].add(answer)
+
+
+def _fingerprint(game, decision):
+    hero = decision.hero
+    return (decision.kind, decision.prompt, tuple(decision.choices),
+            tuple(card.name for card in hero._hand), len(hero._discard),
+            hero._damage_tokens, hero._influence_tokens, hero._hearts,
+            game.locations.current._control, tuple((foe._damage, foe._influence) for foe in game.villain_deck.all))
+
+
+def _key(decision, choices):
+    """What a tree node is for: answers are only comparable between the same decisions."""
+    return (decision.kind, decision.prompt, tuple(choices))
+
+
+class _SearchDone(Exception):
+    def __init__(self, stats):
+        super().__init__()
+        self.stats = stats
+
+
+def _worker_search(config, hero_specs, seed, history, rollouts, time_budget, horizon, exploration, search_seed):
+    provider = MCTSProvider(rollouts, time_budget, horizon, exploration, search_seed)
+    provider._replay = history
+    g = game.Game(config, game.create_heroes(config, hero_specs), decision_provider=provider, seed=seed)
+    g.events.enabled = False
+    try:
+        g.play()
+    except _SearchDone as done:
+        return done.stats, provider.rollout_errors
+    raise ValueError("Programmer Error! Replayed game ended before reaching the decision to search")
+
+
+class _Node(object):
+    def __init__(self):
+        self.visits = 0
+        self.value = 0.0
+        # The decision rollouts reached here, once one has (see _key)
+        self.key = None
+        self.children = {}
+
+
+class _Rollout(decisions.DecisionProvider):
+    """Answers decisions for one rollout: replay, then walk the tree, then the default policy."""
+
+    def __init__(self, root, prefix, exploration, delegate, policy, rng):
+        self._prefix = prefix
+        self._replayed = 0
+        self._exploration = exploration
+        self._delegate = delegate
+        self._policy = policy
+        self._random = rng
+        self._retries = _Retries()
+        self._node = root
+        self._path = [root]
+        self._in_tree = True
+
+    def choose(self, game, decision):
+        if not self._in_tree:
+            return self._policy.choose(game, decision)
+        choices = self._retries.filter(game, decision, candidates(game, decision))
+        if self._replayed < len(self._prefix):
+            choice = self._prefix[self._replayed]
+            self._replayed += 1
+            self._retries.answered(choice)
+            return choice
+        node = self._node
+        key = _key(decision, choices)
+        if node.key is None:
+            node.key = key
+        elif node.key != key:
+            # Rollouts sample their own futures, so the same answers can lead
+            # to a different decision; its answers don't belong under this node
+            self._in_tree = False
+            return self._policy.choose(game, decision)
+        if node is self._path[0] and len(self._path) == 1:
+            # Back at the searched decision: the bot can't know how decks will
+            # shuffle or what Dark Arts come next, so each rollout samples a future
+            game.rng.seed(self._random.random())
+        if decision.kind in self._delegate:
+            choice = self._policy.choose(game, decision)
+        else:
+            choice = self._select(choices)
+        self._retries.answered(choice)
+        child = node.children.setdefault(choice, _Node())
+        if child.visits == 0:
+            # Expand one new node per rollout, then hand over to the default policy
+            self._in_tree = False
+        self._node = child
+        self._path.append(child)
+        return choice
+
+    def _select(self, choices):
+        children = self._node.children
+        untried = [choice for choice in choices if choice not in children]
+        if untried:
+            return self._random.choice(untried)
+        log_visits = math.log(max(self._node.visits, 1))
+        return max(choices, key=lambda choice: children[choice].value / children[choice].visits
+                   + self._exploration * math.sqrt(log_visits / children[choice].visits))
+
+    def backpropagate(self, value):
+        for node in self._path:
+            node.visits += 1
+            node.value += value
+
+
+class _Baseline(object):
+    """Scores unfinished rollouts by progress since the searched decision, in (0, 1)."""
+
+    def __init__(self, game):
+        self._villains = len(game.villain_deck)
+        self._locations = game.locations._current
+        self._cards = _card_value(game)
+
+    def evaluate(self, game):
+        locations = game.locations
+        if locations._current >= len(locations._locations):
+            return 0.0
+        score = 0.5
+        score += 0.15 * (self._villains - len(game.villain_deck))
+        score -= 0.15 * (locations._current - self._locations)
+        score -= 0.1 * locations.current._control / locations.current._control_max
+        score += 0.05 * sum(foe._damage / foe._hearts for foe in game.villain_deck.all if foe._hearts > 0)
+        score += 0.1 * (sum(hero._hearts / hero._max_hearts for hero in game.heroes) / len(game.heroes) - 0.5)
+        score += 0.01 * (_card_value(game) - self._cards)
+        return min(max(score, 0.01), 0.99)
+
+
+def _card_value(game):
+    return sum(card.cost for hero in game.heroes
+               for cards in (hero._deck, hero._hand, hero._play_area, hero._discard) for card in cards)
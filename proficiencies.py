@@ -1,8 +1,7 @@
 from collections import Counter
 
-import random
-
 import constants
+import decisions
 import hogwarts
 
 class Proficiency(object):
@@ -47,17 +46,21 @@ class FlyingLessons(Proficiency):
         super().__init__("Flying Lessons", f"1/turn: pay 5{constants.INFLUENCE} to remove 1{constants.CONTROL}")
 
     def start_turn(self, game):
-        game.heroes.active_hero.add_action(game, 'f', "(f)lying lessons", self._use_ability)
+        game.heroes.active_hero.add_action(game, 'f', "(f)lying lessons", self._use_ability, self._unavailable)
 
-    def _use_ability(self, game):
+    def _unavailable(self, game):
         if self._used_ability:
-            game.log("Flying Lessons already used this turn")
-            return
+            return "Flying Lessons already used this turn"
         if game.locations.current._control == 0:
-            game.log(f"No {constants.CONTROL} to remove with Flying Lessons")
-            return
+            return f"No {constants.CONTROL} to remove with Flying Lessons"
         if game.heroes.active_hero._influence_tokens < 5:
-            game.log(f"Not enough {constants.INFLUENCE} to use Flying Lessons")
+            return f"Not enough {constants.INFLUENCE} to use Flying Lessons"
+        return None
+
+    def _use_ability(self, game):
+        reason = self._unavailable(game)
+        if reason is not None:
+            game.log(reason)
             return
         game.log(f"Flying Lessons used to remove 1{constants.CONTROL}")
         game.heroes.active_hero.remove_influence(game, 5)
@@ -70,22 +73,25 @@ class Charms(Proficiency):
         super().__init__("Charms", f"1/turn: discard 2 spells; ALL heroes gain 1{constants.INFLUENCE} and draw a card")
 
     def start_turn(self, game):
-        game.heroes.active_hero.add_action(game, 'c', "(c)harms", self._use_ability)
+        game.heroes.active_hero.add_action(game, 'c', "(c)harms", self._use_ability, self._unavailable)
 
-    def _use_ability(self, game):
+    def _unavailable(self, game):
         if self._used_ability:
-            game.log("Charms already used this turn")
-            return
+            return "Charms already used this turn"
+        if game.heroes.active_hero._hand.count_spells() < 2:
+            return "Not enough spells in hand to use Charms"
+        return None
 
-        hero = game.heroes.active_hero
-        spells = sum(1 for card in hero._hand if card.is_spell())
-        if spells < 2:
-            game.log("Not enough spells in hand to use Charms")
+    def _use_ability(self, game):
+        reason = self._unavailable(game)
+        if reason is not None:
+            game.log(reason)
             return
 
+        hero = game.heroes.active_hero
         choices = ['c'] + [str(i) for i in range(len(hero._hand))]
         while True:
-            first = game.input(f"Choose first spell for {hero.name} to discard or (c)ancel: ", choices)
+            first = game.input(f"Choose first spell for {hero.name} to discard or (c)ancel: ", choices, kind=decisions.DecisionKind.DISCARD)
             if first == 'c':
                 return
             first = int(first)
@@ -95,7 +101,7 @@ class Charms(Proficiency):
                 continue
             break
         while True:
-            second = game.input(f"Choose second spell for {hero.name} to discard or (c)ancel: ", choices)
+            second = game.input(f"Choose second spell for {hero.name} to discard or (c)ancel: ", choices, kind=decisions.DecisionKind.DISCARD)
             if second == 'c':
                 return
             second = int(second)
@@ -121,26 +127,31 @@ class Transfiguration(Proficiency):
         super().__init__("Transfiguration", f"1/turn: discard an item to take card with cost 5{constants.INFLUENCE} or less from deck")
 
     def start_turn(self, game):
-        game.heroes.active_hero.add_action(game, 't', "(t)ransfiguration", self._use_ability)
+        game.heroes.active_hero.add_action(game, 't', "(t)ransfiguration", self._use_ability, self._unavailable)
 
-    def _use_ability(self, game):
+    def _unavailable(self, game):
         if self._used_ability:
-            game.log("Transfiguration already used this turn")
+            return "Transfiguration already used this turn"
+        hero = game.heroes.active_hero
+        if hero._hand.count_items() == 0:
+            return "No items for Transfiguration"
+        if not any(card.cost <= 5 for card in hero._deck):
+            return "No cards in deck available for Transfiguration"
+        return None
+
+    def _use_ability(self, game):
+        reason = self._unavailable(game)
+        if reason is not None:
+            game.log(reason)
             return
 
         hero = game.heroes.active_hero
-        items = sum(1 for card in hero._hand if card.is_item())
-        if items == 0:
-            game.log("No items for Transfiguration")
-            return
-        available_cards = [card for card in hero._deck if card.cost <= 5]
-        if len(available_cards) == 0:
-            game.log("No cards in deck available for Transfiguration")
-            return
+        # By position, since copies of a card are usually the same object
+        available_cards = [i for i, card in enumerate(hero._deck) if card.cost <= 5]
 
         while True:
             choices = ['c'] + [str(i) for i in range(len(hero._hand))]
-            choice = game.input(f"Choose an item for {hero.name} to discard or (c)ancel: ", choices)
+            choice = game.input(f"Choose an item for {hero.name} to discard or (c)ancel: ", choices, kind=decisions.DecisionKind.DISCARD)
             if choice == 'c':
                 return
             choice = int(choice)
@@ -151,13 +162,12 @@ class Transfiguration(Proficiency):
             hero.discard(game, choice)
             break
         game.log(f"Cards in {hero.name}'s deck:")
-        for i, card in enumerate(available_cards):
-            game.log(f" {i}: {card}")
+        for i, position in enumerate(available_cards):
+            game.log(f" {i}: {hero._deck[position]}")
         choice = int(game.input(f"Choose a card to take from the deck: ", range(len(available_cards))))
-        card = available_cards[choice]
-        hero._deck.remove(card)
+        card = hero._deck.pop(available_cards[choice])
         hero._hand.append(card)
-        random.shuffle(hero._deck)
+        hero._deck.shuffle(game.rng)
         self._used_ability = True
 
 
@@ -204,7 +214,6 @@ class Arithmancy(Proficiency):
     def cost_modifier(self, game, card):
         if not card.rolls_house_die:
             return 0
-        game.log(f"{self.name}: {card.name} costs 1{constants.INFLUENCE} less")
         return -1
 
     @property
@@ -219,13 +228,6 @@ class Potions(Proficiency):
         self._played_item = False
         self._played_spell = False
 
-    def dump_state(self):
-        return super().dump_state() | {
-            "played_ally": self._played_ally,
-            "played_item": self._played_item,
-            "played_spell": self._played_spell,
-        }
-
     def start_turn(self, game):
         self._played_ally = False
         self._played_item = False
@@ -0,0 +1,164 @@
+from contextlib import nullcontext
+
+import json
+import sys
+import time
+
+
+# What sources are called in the profile, by the package their class is from
+SOURCE_KINDS = {
+    'hogwarts': 'card',
+    'dark_arts': 'dark arts',
+    'villains': 'villain',
+    'encounters': 'encounter',
+    'heroes': 'hero',
+    'proficiencies': 'proficiency',
+    'locations': 'location',
+}
+
+
+_kinds_by_type = {}
+
+
+def _kind(cls):
+    try:
+        return _kinds_by_type[cls]
+    except KeyError:
+        # Go by the base class, so heroes' starting cards count as cards
+        kind = cls.__name__
+        for klass in reversed(cls.__mro__):
+            package = klass.__module__.split('.')[0]
+            if package in SOURCE_KINDS:
+                kind = SOURCE_KINDS[package]
+                break
+        _kinds_by_type[cls] = kind
+        return kind
+
+
+def describe(source):
+    """(kind, name) of an effect source, e.g. ('card', 'Lumos') or ('villain', 'Draco Malfoy')."""
+    kind = _kind(type(source))
+    name = getattr(source, 'name', None)
+    if name is None:
+        name = getattr(source, '__qualname__', type(source).__name__)
+    return kind, name
+
+
+class NullProfiler(object):
+    """Profiler for games nobody is timing: every frame is a shared no-op."""
+
+    _NOTHING = nullcontext()
+
+    def frame(self, kind, name):
+        return self._NOTHING
+
+
+class Profiler(object):
+    """Wall time and call counts of what runs during games, kept per call stack.
+
+    A frame is a kind and a name: game phases ("phase", "villains"), decisions
+    ("decision", "ACTION"), effect sources named by describe() ("card",
+    "Lumos"), and callbacks named by their trigger and owner ("acquire",
+    "Hermione"). Each frame counts its own time (without the frames under it)
+    and its total time; a frame inside itself (bot rollouts inside a decision)
+    only counts towards its total once.
+    """
+
+    def __init__(self, clock=time.perf_counter):
+        self._clock = clock
+        # {(frame, ...): [calls, seconds, own seconds]}, frames as "kind:name"
+        self._stacks = {}
+        # Frames open right now, and [start, seconds spent in frames under it] for each
+        self._path = []
+        self._open = []
+
+    def frame(self, kind, name):
+        self.enter(kind, name)
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.exit()
+
+    def enter(self, kind, name):
+        self._path.append(f"{kind}:{name}")
+        self._open.append([self._clock(), 0.0])
+
+    def enter_source(self, source, trigger=None):
+        kind, name = describe(source)
+        if trigger is not None:
+            kind = trigger
+        self.enter(kind, name)
+
+    def exit(self):
+        start, children = self._open.pop()
+        seconds = self._clock() - start
+        key = tuple(self._path)
+        self._path.pop()
+        if self._open:
+            self._open[-1][1] += seconds
+        stats = self._stacks.get(key)
+        if stats is None:
+            stats = self._stacks[key] = [0, 0.0, 0.0]
+        stats[0] += 1
+        stats[1] += seconds
+        stats[2] += seconds - children
+
+    def merge(self, other):
+        """Add in what another profiler recorded, e.g. one from a worker process."""
+        for key, (calls, seconds, own) in other._stacks.items():
+            stats = self._stacks.get(key)
+            if stats is None:
+                stats = self._stacks[key] = [0, 0.0, 0.0]
+            stats[0] += calls
+            stats[1] += seconds
+            stats[2] += own
+
+    def totals(self):
+        """{kind: {name: {'calls', 'seconds', 'own_seconds'}}}, over every stack a frame was in."""
+        totals = {}
+        for key, (calls, seconds, own) in self._stacks.items():
+            frame = key[-1]
+            kind, name = frame.split(':', 1)
+            entry = totals.setdefault(kind, {}).setdefault(name, {'calls': 0, 'seconds': 0.0, 'own_seconds': 0.0})
+            entry['calls'] += calls
+            entry['own_seconds'] += own
+            if frame not in key[:-1]:
+                entry['seconds'] += seconds
+        return totals
+
+    def as_dict(self):
+        totals = self.totals()
+        for kind, names in totals.items():
+            totals[kind] = dict(sorted(names.items(), key=lambda item: item[1]['own_seconds'], reverse=True))
+        return {
+            'seconds': sum(seconds for key, (_, seconds, _) in self._stacks.items() if len(key) == 1),
+            'frames': totals,
+        }
+
+    def write_json(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.as_dict(), f, indent=2)
+
+    def collapsed(self):
+        """Own time per stack in microseconds, in the folded format flamegraph.pl and speedscope read."""
+        lines = []
+        for key, (_, _, own) in sorted(self._stacks.items()):
+            micros = round(own * 1e6)
+            if micros > 0:
+                lines.append(f"{';'.join(frame.replace(';', ',') for frame in key)} {micros}")
+        return lines
+
+    def write_collapsed(self, path):
+        with open(path, 'w') as f:
+            for line in self.collapsed():
+                f.write(line + "\n")
+
+    def report(self, out=sys.stdout, top=10):
+        print("Most time spent (own seconds, calls):", file=out)
+        for kind, names in sorted(self.totals().items()):
+            ranked = sorted(names.items(), key=lambda item: item[1]['own_seconds'], reverse=True)
+            print(f"  {kind}: " + ", ".join(f"{name} {stats['own_seconds']:.3f}s/{stats['calls']}"
+                                            for name, stats in ranked[:top]), file=out)
@@ -0,0 +1,121 @@
+#!/opt/homebrew/bin/python3
+
+from collections.abc import MutableMapping
+from importlib import import_module
+from pathlib import Path
+
+import argparse
+import json
+import sys
+
+
+# Packages whose modules each register a few classes by name, and the
+# registries they fill in
+PACKAGES = {
+    'hogwarts': ['CARDS_BY_NAME'],
+    'dark_arts': ['CARDS_BY_NAME'],
+    'villains': ['VILLAINS_BY_NAME', 'VOLDEMORTS_BY_NAME'],
+    'encounters': ['ENCOUNTERS_BY_NAME'],
+}
+
+HEADER = """\
+# Generated by registry.py from the modules in this package; don't edit by hand.
+# After adding, renaming or removing a card, run: python3 registry.py
+"""
+
+
+class Registry(MutableMapping):
+    """Classes by name, imported from their modules the first time they're looked up.
+
+    modules maps every name to the module in package that registers it (see
+    the package's _registry.py), so a game only imports the cards it uses.
+    Iterating the names imports nothing; values() and items() import everything.
+    """
+
+    def __init__(self, package, modules):
+        self._package = package
+        self._modules = modules
+        self._loaded = {}
+
+    def __getitem__(self, name):
+        try:
+            return self._loaded[name]
+        except KeyError:
+            pass
+        import_module(f".{self._modules[name]}", self._package)
+        try:
+            return self._loaded[name]
+        except KeyError:
+            raise ValueError(f"Programmer Error! {self._package}.{self._modules[name]} doesn't register {name}, run registry.py")
+
+    def __setitem__(self, name, cls):
+        self._loaded[name] = cls
+
+    def __delitem__(self, name):
+        del self._loaded[name]
+
+    def __contains__(self, name):
+        return name in self._modules or name in self._loaded
+
+    def __iter__(self):
+        yield from self._modules
+        for name in self._loaded:
+            if name not in self._modules:
+                yield name
+
+    def __len__(self):
+        return len(self._modules) + sum(1 for name in self._loaded if name not in self._modules)
+
+    def load_all(self):
+        for name in self._modules:
+            self[name]
+
+
+def scan(package_name):
+    """Import every module in a package, returning {registry: {name: module}} as the modules fill them in."""
+    package = import_module(package_name)
+    for f in sorted(Path(package.__file__).parent.glob("*.py")):
+        if f.stem.startswith("_") or f.stem == "base":
+            continue
+        import_module(f".{f.stem}", package_name)
+    found = {}
+    for registry_name in PACKAGES[package_name]:
+        registry = getattr(package, registry_name)
+        found[registry_name] = {name: registry._loaded[name].__module__.rsplit('.', 1)[1]
+                                for name in sorted(registry._loaded)}
+    return found
+
+
+def generate(package_name):
+    """Source of the package's _registry.py."""
+    lines = [HEADER]
+    for registry_name, modules in scan(package_name).items():
+        lines.append(f"{registry_name} = {{")
+        for name, module in modules.items():
+            lines.append(f"    {json.dumps(name, ensure_ascii=False)}: {json.dumps(module)},")
+        lines.append("}")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def registry_path(package_name):
+    return Path(__file__).parent / package_name / "_registry.py"
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Regenerate the static card registries (each package's _registry.py)")
+    parser.add_argument("--check", action="store_true", help="Only check they're up to date, exiting 1 if not")
+    args = parser.parse_args()
+
+    stale = []
+    for package_name in PACKAGES:
+        path = registry_path(package_name)
+        source = generate(package_name)
+        if path.exists() and path.read_text() == source:
+            continue
+        stale.append(path)
+        if not args.check:
+            path.write_text(source)
+    for path in stale:
+        print(f"{path} {'is out of date' if args.check else 'updated'}")
+    sys.exit(1 if args.check and stale else 0)
@@ -0,0 +1,96 @@
+#!/opt/homebrew/bin/python3
+
+from concurrent.futures import ProcessPoolExecutor
+
+import argparse
+import sys
+import traceback
+
+import game
+import traces
+
+
+def new_game(trace):
+    return game.Game(trace.config, game.create_heroes(trace.config, trace.hero_specs),
+                     decision_provider=traces.ReplayProvider(trace.answers), seed=trace.seed)
+
+
+def replay(trace, log_events=False):
+    """Play a trace again headlessly, returning the outcome and the game it left behind."""
+    g = new_game(trace)
+    g.events.enabled = log_events
+    error = None
+    try:
+        if g.play(trace.max_turns):
+            result = 'win'
+        elif trace.max_turns is not None and g.turns >= trace.max_turns:
+            result = 'timeout'
+        else:
+            result = 'loss'
+    except traces.TraceExhausted:
+        result, error = None, None
+    except Exception as e:
+        result, error = 'error', repr(e)
+    return result, error, g
+
+
+def check(path, log_lines=0):
+    """Replay the trace at path and compare with how it went when it was recorded."""
+    trace = traces.load(path)
+    result, error, g = replay(trace, log_events=log_lines > 0)
+    report = {'path': str(path), 'recorded': trace.result, 'replayed': result, 'turns': g.turns,
+              'matches': result == trace.result and error == trace.error}
+    if error is not None:
+        report['error'] = error
+    if log_lines > 0 and not report['matches']:
+        report['log'] = [event.text for event in list(g.events)[-log_lines:]]
+    return report
+
+
+def debug(path):
+    trace = traces.load(path)
+    g = new_game(trace)
+    try:
+        won = g.play(trace.max_turns)
+    except traces.TraceExhausted:
+        print(f"{path}: replayed to the end of the trace without crashing")
+    except Exception:
+        traceback.print_exc()
+        import pdb
+        pdb.post_mortem()
+    else:
+        print(f"{path}: replayed to a {'win' if won else 'loss'} without crashing")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Replay recorded games of Harry Potter: Hogwarts Battle headlessly")
+    parser.add_argument("traces", metavar="TRACE", nargs="+", help="Trace files written by game.py --record or simulate.py --record")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes to spread traces over")
+    parser.add_argument("--log", metavar="N", type=int, default=0, help="Show the last N log lines of games that don't match")
+    parser.add_argument("--debug", action="store_true", help="Open the debugger where the (single) trace crashes")
+    args = parser.parse_args()
+
+    if args.debug:
+        if len(args.traces) != 1:
+            parser.error("--debug replays exactly one trace")
+        debug(args.traces[0])
+        sys.exit(0)
+
+    if args.workers <= 1:
+        reports = (check(path, args.log) for path in args.traces)
+    else:
+        executor = ProcessPoolExecutor(max_workers=args.workers)
+        reports = executor.map(check, args.traces, [args.log] * len(args.traces), chunksize=16)
+
+    mismatches = 0
+    for report in reports:
+        if report['matches']:
+            continue
+        mismatches += 1
+        print(f"{report['path']}: recorded {report['recorded']}, replayed {report['replayed']} after {report['turns']} turns")
+        if 'error' in report:
+            print(f"  {report['error']}")
+        for line in report.get('log', []):
+            print(f"  | {line}")
+    print(f"Replayed {len(args.traces)} traces, {mismatches} changed")
+    sys.exit(1 if mismatches else 0)
@@ -0,0 +1,180 @@
+#!/opt/homebrew/bin/python3
+
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import argparse
+import json
+import statistics
+import sys
+
+import configs
+import decisions
+import game
+import mcts
+import profiling
+import traces
+
+POLICIES = {
+    'greedy': decisions.GreedyProvider,
+    'random': decisions.RandomProvider,
+    'mcts': mcts.MCTSProvider,
+}
+
+
+def play_one(config, hero_specs, policy, seed, max_turns, record_dir=None, profiler=None):
+    chosen_heroes = game.create_heroes(config, hero_specs)
+    provider = bot = POLICIES[policy](seed=seed)
+    trace = None
+    if record_dir is not None:
+        trace = traces.TraceWriter(Path(record_dir) / f"seed-{seed}.jsonl.gz", config, hero_specs, seed, max_turns, flush=False)
+        provider = traces.RecordingProvider(provider, trace)
+    g = game.Game(config, chosen_heroes, decision_provider=provider, seed=seed, profiler=profiler)
+    # Nobody reads a simulated game's log
+    g.events.enabled = False
+    try:
+        won = g.play(max_turns)
+    except Exception as e:
+        result = {'seed': seed, 'outcome': 'error', 'turns': g.turns, 'error': repr(e)}
+    else:
+        if won:
+            outcome = 'win'
+        elif g.turns >= max_turns:
+            outcome = 'timeout'
+        else:
+            outcome = 'loss'
+        result = {'seed': seed, 'outcome': outcome, 'turns': g.turns, 'locations_lost': g.locations._current}
+    if isinstance(bot, mcts.MCTSProvider):
+        bot.close()
+        result['rollout_errors'] = dict(bot.rollout_errors)
+    if trace is not None:
+        trace.finish(result['outcome'], result.get('error'))
+        trace.close()
+    return result
+
+
+def play_batch(config, hero_specs, policy, seeds, max_turns, record_dir=None, profiler=None):
+    return [play_one(config, hero_specs, policy, seed, max_turns, record_dir, profiler) for seed in seeds]
+
+
+def play_profiled_batch(config, hero_specs, policy, seeds, max_turns, record_dir=None):
+    # Worker processes time their own games, for simulate to add up
+    profiler = profiling.Profiler()
+    return play_batch(config, hero_specs, policy, seeds, max_turns, record_dir, profiler), profiler
+
+
+class Summary(object):
+    def __init__(self):
+        self.games = 0
+        self.outcomes = Counter()
+        self.turns_to_win = []
+        self.locations_lost = Counter()
+        self.errors = []
+        # Bot rollouts that crashed, by error (mcts only)
+        self.rollout_errors = Counter()
+
+    def add(self, result):
+        self.games += 1
+        self.outcomes[result['outcome']] += 1
+        if result['outcome'] == 'win':
+            self.turns_to_win.append(result['turns'])
+        if result['outcome'] == 'error':
+            self.errors.append((result['seed'], result['error']))
+        else:
+            self.locations_lost[result['locations_lost']] += 1
+        self.rollout_errors.update(result.get('rollout_errors', {}))
+
+    def as_dict(self):
+        return {
+            'games': self.games,
+            'outcomes': dict(self.outcomes),
+            'win_rate': self.outcomes['win'] / self.games if self.games else 0,
+            'turns_to_win': Counter(self.turns_to_win),
+            'locations_lost': dict(self.locations_lost),
+            'errors': self.errors,
+            'rollout_errors': dict(self.rollout_errors),
+        }
+
+    def report(self, out=sys.stdout):
+        print(f"Games: {self.games}", file=out)
+        for outcome in ('win', 'loss', 'timeout', 'error'):
+            count = self.outcomes[outcome]
+            print(f"  {outcome}: {count} ({count / max(self.games, 1):.1%})", file=out)
+        if self.turns_to_win:
+            print(f"Turns to win: mean {statistics.mean(self.turns_to_win):.1f}, "
+                  f"median {statistics.median(self.turns_to_win)}, "
+                  f"min {min(self.turns_to_win)}, max {max(self.turns_to_win)}", file=out)
+        print("Locations lost:", file=out)
+        for lost, count in sorted(self.locations_lost.items()):
+            print(f"  {lost}: {count} ({count / max(self.games, 1):.1%})", file=out)
+        for seed, error in self.errors[:10]:
+            print(f"Seed {seed} crashed: {error}", file=out)
+        for error, count in self.rollout_errors.most_common(10):
+            print(f"Bot rollouts crashed {count} times: {error}", file=out)
+
+
+def simulate(config, hero_specs, policy='greedy', games=1000, workers=1, first_seed=0, max_turns=200, batch_size=100, on_result=None, record_dir=None, profiler=None):
+    summary = Summary()
+    # Checked and indexed once here rather than by every game
+    config = configs.definition(config)
+    if record_dir is not None:
+        Path(record_dir).mkdir(parents=True, exist_ok=True)
+    seeds = range(first_seed, first_seed + games)
+    batches = [seeds[i:i + batch_size] for i in range(0, games, batch_size)]
+    if workers <= 1:
+        results = (play_batch(config, hero_specs, policy, batch, max_turns, record_dir, profiler) for batch in batches)
+        for batch in results:
+            for result in batch:
+                summary.add(result)
+                if on_result is not None:
+                    on_result(result)
+        return summary
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        play = play_batch if profiler is None else play_profiled_batch
+        futures = [executor.submit(play, config, hero_specs, policy, batch, max_turns, record_dir) for batch in batches]
+        for future in as_completed(futures):
+            batch = future.result()
+            if profiler is not None:
+                batch, batch_profiler = batch
+                profiler.merge(batch_profiler)
+            for result in batch:
+                summary.add(result)
+                if on_result is not None:
+                    on_result(result)
+    return summary
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Simulate many headless games of Harry Potter: Hogwarts Battle with a bot")
+    parser.add_argument("config", metavar="FILE", action=game.ConfigFileAction, help="Game configuration file")
+    parser.add_argument("heroes", metavar="HERO", nargs="+", action=game.HeroArgAction,
+                        help="Heroes to play, as for game.py")
+    parser.add_argument("--games", type=int, default=1000, help="Number of games to play")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes to spread games over")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the first game; game N uses seed+N")
+    parser.add_argument("--policy", choices=POLICIES.keys(), default='greedy', help="Bot making every decision")
+    parser.add_argument("--max-turns", type=int, default=200, help="Give up on games longer than this")
+    parser.add_argument("--batch-size", type=int, default=100, help="Games per worker task")
+    parser.add_argument("--record", metavar="DIR", default=None, help="Write a trace of every game to DIR for replay.py")
+    parser.add_argument("--json", metavar="FILE", default=None, help="Also write the summary as JSON")
+    parser.add_argument("--profile", metavar="FILE", default=None,
+                        help="Time phases, cards, villains and callbacks, and write the totals to FILE as JSON")
+    parser.add_argument("--flamegraph", metavar="FILE", default=None,
+                        help="Time the games and write collapsed stacks to FILE, for flamegraph.pl or speedscope")
+    args = parser.parse_args()
+
+    profiler = profiling.Profiler() if args.profile is not None or args.flamegraph is not None else None
+    print(f"Simulating {args.games} games of {args.config['name']}")
+    summary = simulate(args.config, args.heroes, args.policy, args.games, args.workers,
+                       args.seed, args.max_turns, args.batch_size, record_dir=args.record, profiler=profiler)
+    summary.report()
+    if args.json is not None:
+        with open(args.json, 'w') as f:
+            json.dump(summary.as_dict(), f, indent=2)
+    if profiler is not None:
+        profiler.report()
+    if args.profile is not None:
+        profiler.write_json(args.profile)
+    if args.flamegraph is not None:
+        profiler.write_collapsed(args.flamegraph)
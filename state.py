@@ -0,0 +1,182 @@
+from collections import Counter, defaultdict, deque
+from enum import Enum
+from types import MethodType
+
+import copy
+
+
+# Modules whose objects make up a game's state. Anything else reachable from
+# the game (curses windows, renderers, decision providers, functions) is
+# left alone.
+GAME_MODULES = {'dark_arts', 'effects', 'encounters', 'game', 'heroes', 'hogwarts', 'locations', 'proficiencies', 'villains'}
+
+# Objects with nothing but these fields never change after construction (most
+# Hogwarts and Dark Arts cards), so snapshots share them instead of copying.
+# Hogwarts cards go further and share one object between all their copies.
+DEFINITION_FIELDS = {'name', 'description', 'cost', 'rolls_house_die'}
+
+
+class Snapshot(object):
+    def __init__(self, root, skip, objects, extra):
+        self._root = root
+        self._skip = skip
+        # [(obj, {field: value})] for every stateful object reachable from the root
+        self._objects = objects
+        self.extra = extra
+
+    def __len__(self):
+        return len(self._objects)
+
+
+def snapshot(root, skip=(), extra=None):
+    objects = []
+    seen = {id(root)}
+    pending = [root]
+    while pending:
+        obj = pending.pop()
+        if _is_definition(obj):
+            continue
+        fields = {}
+        for name, value in _fields(obj):
+            if obj is root and name in skip:
+                continue
+            fields[name] = _copy(value, seen, pending)
+        objects.append((obj, fields))
+    return Snapshot(root, skip, objects, extra)
+
+
+def restore(snapshot):
+    for obj, fields in snapshot._objects:
+        if hasattr(obj, '__dict__'):
+            kept = {name: getattr(obj, name) for name in snapshot._skip} if obj is snapshot._root else {}
+            obj.__dict__.clear()
+            obj.__dict__.update(kept)
+        for name, value in fields.items():
+            if value is _UNSET:
+                # Slots set later on (not in __init__) go back to unset, like a cleared __dict__
+                if hasattr(obj, name):
+                    object.__delattr__(obj, name)
+                continue
+            object.__setattr__(obj, name, _copy(value))
+
+
+def fingerprint(obj):
+    """Cheap key that changes whenever obj's own state does.
+
+    Atomic fields compare by value, lists and dicts by what they hold, and
+    anything else by identity. Used by the display panels to skip redrawing
+    when nothing they show has changed: zones are mutated in place all over
+    the card modules, so there's no one place to mark a panel dirty.
+    """
+    key = []
+    for _, value in _fields(obj):
+        cls = type(value)
+        if cls in _ATOMIC:
+            key.append(value)
+        elif isinstance(value, (list, tuple, deque, set)):
+            key.append(tuple(item if type(item) in _ATOMIC else id(item) for item in value))
+        elif isinstance(value, dict):
+            key.append(tuple((name, len(item) if isinstance(item, list) else id(item)) for name, item in value.items()))
+        else:
+            key.append(id(value))
+    return tuple(key)
+
+
+def _fields(obj):
+    slots = _slots(type(obj))
+    if not slots:
+        return vars(obj).items()
+    fields = [(name, getattr(obj, name, _UNSET)) for name in slots]
+    if hasattr(obj, '__dict__'):
+        fields.extend(vars(obj).items())
+    return fields
+
+
+# Stands in for slots that haven't been set yet
+_UNSET = object()
+
+
+_slots_by_type = {}
+
+
+def _slots(cls):
+    try:
+        return _slots_by_type[cls]
+    except KeyError:
+        slots = [name for klass in cls.__mro__ for name in klass.__dict__.get('__slots__', ())
+                 if name != '__dict__' and name != '__weakref__']
+        _slots_by_type[cls] = slots
+        return slots
+
+
+def _is_definition(obj):
+    if not DEFINITION_FIELDS.issuperset(_slots(type(obj))):
+        return False
+    return not hasattr(obj, '__dict__') or DEFINITION_FIELDS.issuperset(vars(obj))
+
+
+_is_game_type = {}
+
+
+def _is_game_object(value):
+    cls = type(value)
+    try:
+        return _is_game_type[cls]
+    except KeyError:
+        result = cls.__module__.split('.')[0] in GAME_MODULES and not issubclass(cls, (Enum, type))
+        _is_game_type[cls] = result
+        return result
+
+
+def _visit(value, seen, pending):
+    if type(value) is MethodType:
+        value = value.__self__
+    if _is_game_object(value) and id(value) not in seen:
+        seen.add(id(value))
+        pending.append(value)
+
+
+_ATOMIC = {int, str, bool, float, type(None)}
+
+
+def _copy(value, seen=None, pending=None):
+    """Copy containers (recursively) but not the game objects inside them.
+
+    While snapshotting, game objects found along the way are queued on pending.
+    """
+    cls = type(value)
+    if cls in _ATOMIC:
+        return value
+    if cls is list:
+        return [_copy(item, seen, pending) for item in value]
+    if isinstance(value, Counter):
+        return Counter(value)
+    if isinstance(value, defaultdict):
+        copied = defaultdict(value.default_factory)
+        for key, item in value.items():
+            copied[key] = _copy(item, seen, pending)
+        return copied
+    if isinstance(value, dict):
+        return {_copy(key, seen, pending): _copy(item, seen, pending) for key, item in value.items()}
+    if isinstance(value, list):
+        # List subclasses (hero zones) hold game objects and copy whatever
+        # else they keep themselves, in __copy__
+        if pending is not None:
+            for item in value:
+                _visit(item, seen, pending)
+        return copy.copy(value)
+    if isinstance(value, set):
+        if pending is not None:
+            for item in value:
+                _visit(item, seen, pending)
+        return set(value)
+    if isinstance(value, tuple):
+        if pending is not None:
+            for item in value:
+                _visit(item, seen, pending)
+        return value
+    if isinstance(value, deque):
+        return deque((_copy(item, seen, pending) for item in value), value.maxlen)
+    if pending is not None:
+        _visit(value, seen, pending)
+    return value
@@ -6,8 +6,31 @@ without requiring the full game infrastructure. These fakes are designed to supp
 the most common testing scenarios while remaining simple and maintainable.
 """
 
+from pathlib import Path
+from yaml import safe_load
+
 import random
 
+import game
+from effects import EffectSources
+
+
+CONFIG_DIR = Path(__file__).parent.parent.parent / "config"
+# Enough heroes (with proficiencies) for tests that play real games
+HEROES = [("Harry", "Potions"), ("Ron", "Charms")]
+
+
+def load_config(name):
+    """A config from config/, by file name without the .yaml."""
+    return safe_load((CONFIG_DIR / f"{name}.yaml").read_text())
+
+
+def new_game(config, hero_specs=HEROES, **kwargs):
+    """A real headless Game; config is a loaded config or the name of one in config/."""
+    if isinstance(config, str):
+        config = load_config(config)
+    return game.Game(config, game.create_heroes(config, hero_specs), **kwargs)
+
 
 class DummyCard:
     """
@@ -266,7 +289,7 @@ class FakeHero:
                     effect(game, self)
                 self._deck = self._discard
                 self._discard = []
-                random.shuffle(self._deck)
+                game.rng.shuffle(self._deck)
 
             if self._deck:
                 self._hand.append(self._deck.pop())
@@ -429,9 +452,11 @@ class FakeGame:
     - log(): Stores messages for inspection
     - input(): Returns pre-programmed responses
     - heroes, locations: Access to game state
+    - effect_source: Stack of effect sources, like the real Game's
+    - rng: Per-game random.Random for shuffles and die rolls
     """
 
-    def __init__(self, heroes=None, inputs=None, num_heroes=1):
+    def __init__(self, heroes=None, inputs=None, num_heroes=1, seed=None):
         """
         Create a fake game for testing.
 
@@ -439,6 +464,7 @@ class FakeGame:
             heroes: List of FakeHero objects (creates default if None)
             inputs: List of input responses to return in sequence
             num_heroes: Number of heroes to create if heroes is None
+            seed: Seed for the game's random number generator
         """
         if heroes is None:
             heroes = [FakeHero(f"Hero {i+1}") for i in range(num_heroes)]
@@ -448,12 +474,14 @@ class FakeGame:
         self._log_messages = []
         self._inputs = inputs if inputs else []
         self._input_index = 0
+        self.effect_source = EffectSources()
+        self.rng = random.Random(seed)
 
-    def log(self, message, attr=None):
+    def log(self, message, kind=None, **fields):
         """Log a message (stores for test inspection)."""
-        self._log_messages.append(message)
+        self._log_messages.append(message.format(**fields) if fields else message)
 
-    def input(self, prompt, valid_choices=None):
+    def input(self, prompt, valid_choices=None, kind=None, hero=None, legal=None):
         """
         Return a pre-programmed input response.
 
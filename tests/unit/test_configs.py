@@ -0,0 +1,109 @@
+"""
+Test compiling game configs and caching the compiled definitions.
+"""
+
+import unittest
+import sys
+import os
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from pathlib import Path
+from yaml import safe_load
+
+import json
+import pickle
+import tempfile
+
+import configs
+import game
+from tests.unit.fakes import CONFIG_DIR, load_config
+
+
+class TestCompile(unittest.TestCase):
+    """Test configs.compile."""
+
+    def test_every_config_compiles(self):
+        """The shipped configs only name things that exist, and index back to themselves."""
+        for path in sorted(CONFIG_DIR.glob("*.yaml")):
+            with self.subTest(config=path.name):
+                config = safe_load(path.read_text())
+                definition = configs.compile(config)
+                self.assertEqual(dict(definition), config)
+                self.assertEqual([definition.hogwarts_names[i] for i in definition.hogwarts_ids], config['hogwarts_deck'])
+                self.assertEqual(sum(definition.hogwarts_counts.values()), len(config['hogwarts_deck']))
+                self.assertEqual([definition.dark_arts_names[i] for i in definition.dark_arts_ids], config['dark_arts_deck'])
+
+    def test_unknown_names_rejected(self):
+        """Misspelled cards are caught when the config is loaded, not mid-game."""
+        config = load_config("game_one")
+        config['hogwarts_deck'].append("Wingardium Levioooosa")
+        with self.assertRaisesRegex(configs.ConfigError, "Levioooosa"):
+            configs.compile(config)
+
+    def test_counts(self):
+        """Decks are also kept as name: count multisets."""
+        definition = configs.compile(load_config("game_one"))
+        self.assertEqual(definition.hogwarts_counts["Reparo"], 6)
+        self.assertEqual(definition.dark_arts_counts["Petrification"], 2)
+
+    def test_definition_survives_pickle_and_json(self):
+        """Definitions still go to worker processes and into traces as plain configs."""
+        definition = configs.compile(load_config("game_seven"))
+        definition.hogwarts_cards()
+        copied = pickle.loads(pickle.dumps(definition))
+        self.assertEqual(copied.hogwarts_counts, definition.hogwarts_counts)
+        self.assertEqual(json.loads(json.dumps(definition)), dict(definition))
+
+    def test_games_match_raw_config(self):
+        """A game built from a definition is the one built from the raw config."""
+        config = load_config("game_four")
+        specs = [("Harry", None), ("Ron", None)]
+        from_raw = game.Game(config, game.create_heroes(config, specs), seed=3)
+        definition = configs.compile(config)
+        from_definition = game.Game(definition, game.create_heroes(definition, specs), seed=3)
+        self.assertEqual([card.name for card in from_raw.hogwarts_deck._deck],
+                         [card.name for card in from_definition.hogwarts_deck._deck])
+        self.assertEqual([card.name for card in from_raw.dark_arts_deck._deck],
+                         [card.name for card in from_definition.dark_arts_deck._deck])
+
+
+class TestLoad(unittest.TestCase):
+    """Test configs.load and its on-disk cache."""
+
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.cache_dir.cleanup)
+
+    def test_second_load_uses_cache(self):
+        """The first load writes the compiled definition, later ones read it back."""
+        path = CONFIG_DIR / "monster_box_four.yaml"
+        first = configs.load(path, self.cache_dir.name)
+        cached = list(Path(self.cache_dir.name).glob("*.json"))
+        self.assertEqual(len(cached), 1)
+        second = configs.load(path, self.cache_dir.name)
+        self.assertIsInstance(second, configs.GameDefinition)
+        self.assertEqual(dict(second), dict(first))
+        self.assertEqual(second.hogwarts_ids, first.hogwarts_ids)
+
+    def test_corrupt_cache_ignored(self):
+        """A damaged cache entry is compiled again and replaced."""
+        path = CONFIG_DIR / "game_two.yaml"
+        expected = configs.load(path, self.cache_dir.name)
+        cache_file, = Path(self.cache_dir.name).glob("*.json")
+        cache_file.write_text("{not json")
+        self.assertEqual(dict(configs.load(path, self.cache_dir.name)), dict(expected))
+        self.assertEqual(json.loads(cache_file.read_text())['version'], configs.COMPILED_VERSION)
+
+    def test_edited_config_not_served_stale(self):
+        """Changing the file changes the cache key."""
+        edited = Path(self.cache_dir.name) / "edited.yaml"
+        edited.write_text((CONFIG_DIR / "game_one.yaml").read_text())
+        configs.load(edited, self.cache_dir.name)
+        edited.write_text((CONFIG_DIR / "game_one.yaml").read_text().replace('name: "Game 1"', 'name: "Game 1b"'))
+        self.assertEqual(configs.load(edited, self.cache_dir.name)['name'], "Game 1b")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+"""
+Test effect-source tracking on real heroes.
+
+Heroes ask game.effect_source which card, foe or encounter is resolving to
+decide whether a token gain comes from an Ally (see Mermaid, which stops
+heroes gaining tokens from Allies).
+"""
+
+import unittest
+import sys
+import os
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+import heroes
+import proficiencies
+from heroes.base import Alohomora, StarterAlly
+from hogwarts.polyjuice_potion import PolyjuicePotion
+from tests.unit.fakes import FakeGame
+
+
+class TestEffectSources(unittest.TestCase):
+    """Test ally detection through explicit effect sources."""
+
+    def setUp(self):
+        self.hero = heroes.HEROES['Harry'](1, proficiencies.NullProficiency())
+        self.game = FakeGame(heroes=[self.hero])
+
+    def test_no_source_outside_effects(self):
+        """Nothing is resolving between effects."""
+        self.assertIsNone(self.game.effect_source.current)
+        self.assertFalse(self.hero.source_is_ally(self.game))
+
+    def test_source_is_popped_after_effect(self):
+        """Playing a card pushes it only while its effect resolves."""
+        Alohomora().play(self.game)
+        self.assertIsNone(self.game.effect_source.current)
+
+    def test_ally_tokens_blocked(self):
+        """Allies can't give tokens while gaining from allies is disallowed."""
+        self.hero.disallow_gaining_tokens_from_allies(self.game)
+        # Full hearts, so the starter ally gives damage without asking
+        StarterAlly("Hedwig").play(self.game)
+        self.assertEqual(self.hero._damage_tokens, 0)
+
+    def test_spell_tokens_allowed(self):
+        """Non-ally cards still give tokens while allies are blocked."""
+        self.hero.disallow_gaining_tokens_from_allies(self.game)
+        Alohomora().play(self.game)
+        self.assertEqual(self.hero._influence_tokens, 1)
+
+    def test_copied_ally_counts_as_ally(self):
+        """Polyjuice copies an ally's effect, and the ally is the source."""
+        self.hero._play_area = [StarterAlly("Hedwig")]
+        self.hero.disallow_gaining_tokens_from_allies(self.game)
+        PolyjuicePotion().play(self.game)
+        self.assertEqual(self.hero._damage_tokens, 0)
+
+        self.hero.allow_gaining_tokens_from_allies(self.game)
+        PolyjuicePotion().play(self.game)
+        self.assertEqual(self.hero._damage_tokens, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+"""
+Test the compact board encoding round-tripping through real games.
+"""
+
+import unittest
+import sys
+import os
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from pathlib import Path
+
+import subprocess
+
+import decisions
+import encoding
+import villains
+from tests.unit.fakes import load_config, new_game
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+HEROES = [("Harry", "Potions"), ("Ron", "Charms"), ("Hermione", "Arithmancy")]
+
+
+def board(g):
+    """The encoded parts of a game, in a form that's readable when tests fail."""
+    zones = lambda hero: [[card.name for card in zone] for zone in (hero._deck, hero._hand, hero._play_area, hero._discard)]
+    return (g.turns, g.heroes._current,
+            [(hero._hearts, hero._damage_tokens, hero._influence_tokens, zones(hero)) for hero in g.heroes],
+            [(foe.name, foe._damage, foe._influence) for foe in g.villain_deck.current],
+            [foe.name for foe in g.villain_deck._deck],
+            g.locations._current, [location._control for location in g.locations._locations],
+            [(name, len(cards)) for name, cards in g.hogwarts_deck._market.items()],
+            [card.name for card in g.hogwarts_deck._deck],
+            [card.name for card in g.dark_arts_deck._deck])
+
+
+class TestEncoding(unittest.TestCase):
+    """Test encoding.encode and encoding.decode."""
+
+    def setUp(self):
+        self.config = load_config("game_seven")
+
+    def new_game(self, seed=2):
+        return new_game(self.config, HEROES, decision_provider=decisions.GreedyProvider(seed=seed), seed=seed)
+
+    def test_round_trip(self):
+        """Decoding onto a fresh game of the same setup reproduces the board."""
+        played = self.new_game()
+        for _ in range(4):
+            played.play_turn()
+        data = encoding.encode(played)
+        self.assertLess(len(data), 400)
+
+        fresh = self.new_game()
+        encoding.decode(data, fresh)
+        self.assertEqual(board(fresh), board(played))
+        self.assertEqual(encoding.encode(fresh), data)
+
+    def test_rewind(self):
+        """Decoding onto the same game later puts the board back, reusing its objects."""
+        g = self.new_game()
+        g.play_turn()
+        data = encoding.encode(g)
+        before = board(g)
+        cards = {id(card) for hero in g.heroes for card in hero._deck + hero._hand + hero._discard}
+        g.play_turn()
+        g.play_turn()
+        encoding.decode(data, g)
+        self.assertEqual(board(g), before)
+        self.assertTrue(all(id(card) in cards for hero in g.heroes for card in hero._deck + hero._hand + hero._discard))
+
+    def test_villains_by_class(self):
+        """Foes shown under another name, or sharing one, still get their own IDs."""
+        dementor = villains.VILLAINS_BY_NAME["Dementor"]()
+        self.assertNotEqual(dementor.name, "Dementor")
+        self.assertNotEqual(encoding.VILLAIN_IDS[villains.VILLAINS_BY_NAME["Death Eater"]],
+                            encoding.VILLAIN_IDS[villains.VILLAINS_BY_NAME["Death Eater 2"]])
+
+    def test_too_many_cards(self):
+        """Zones too big for a byte are refused rather than wrapped."""
+        g = self.new_game()
+        hero = g.heroes._heroes[0]
+        hero._discard = list(hero._hand) * 60
+        with self.assertRaises(ValueError):
+            encoding.encode(g)
+        hero._discard = []
+        hero._hearts = 300
+        with self.assertRaises(ValueError):
+            encoding.encode(g)
+
+    def test_import_loads_no_cards(self):
+        """Importing the module leaves the card registries lazy; IDs are built on first use."""
+        code = ("import sys, encoding; "
+                "print(any(name.startswith('villains.') and not name.startswith('villains._') "
+                "and name != 'villains.base' for name in sys.modules))")
+        out = subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True)
+        self.assertEqual(out.stdout.strip(), "False")
+
+    def test_wrong_version(self):
+        """Encodings from another layout are refused."""
+        data = bytearray(encoding.encode(self.new_game()))
+        data[0] = encoding.ENCODING_VERSION + 1
+        with self.assertRaises(ValueError):
+            encoding.decode(bytes(data), self.new_game())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+"""
+Test stepping headless games one decision at a time and interleaving them.
+"""
+
+import unittest
+import sys
+import os
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+import decisions
+import engine
+import simulate
+from tests.unit.fakes import HEROES, load_config
+
+
+class TestSteppedGame(unittest.TestCase):
+    """Test engine.SteppedGame and engine.run."""
+
+    def setUp(self):
+        self.config = load_config("game_seven")
+
+    def test_same_as_playing_straight_through(self):
+        """Stepping a game with the greedy bot ends exactly like simulating it."""
+        for seed in range(3):
+            stepped = engine.SteppedGame(self.config, HEROES, seed=seed, max_turns=200)
+            provider = decisions.GreedyProvider(seed=seed)
+            while not stepped.done:
+                stepped.send(provider.choose(stepped.game, stepped.decision))
+            simulated = simulate.play_one(self.config, HEROES, 'greedy', seed, 200)
+            self.assertEqual((stepped.outcome, stepped.game.turns), (simulated['outcome'], simulated['turns']))
+
+    def test_waits_at_decisions(self):
+        """A new game stops at its first decision, and can be abandoned there."""
+        stepped = engine.SteppedGame(self.config, HEROES, seed=1)
+        self.assertFalse(stepped.done)
+        self.assertEqual(stepped.decision.kind, decisions.DecisionKind.DISCARD)
+        self.assertEqual(stepped.game.turns, 0)
+        stepped.close()
+        self.assertTrue(stepped.done)
+        self.assertIsNone(stepped.decision)
+        self.assertIsNone(stepped.outcome)
+
+    def test_run_batches_decisions(self):
+        """run asks about every unfinished game at once until they're all over."""
+        games = [engine.SteppedGame(self.config, HEROES, seed=seed, max_turns=3) for seed in range(4)]
+        provider = decisions.GreedyProvider(seed=0)
+        batches = []
+
+        def choose(pending):
+            batches.append(len(pending))
+            return engine.batched(provider)(pending)
+
+        engine.run(games, choose)
+        self.assertEqual(batches[0], 4)
+        self.assertTrue(all(stepped.done for stepped in games))
+        self.assertEqual({stepped.outcome for stepped in games}, {'timeout'})
+
+    def test_errors_end_the_game(self):
+        """An exception in the rules ends that game and is kept for the caller."""
+        stepped = engine.SteppedGame(self.config, HEROES, seed=1)
+        self.assertIsNone(stepped.send('x'))
+        self.assertEqual(stepped.outcome, 'error')
+        self.assertIsInstance(stepped.error, ValueError)
+        with self.assertRaises(ValueError):
+            stepped.send('0')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+"""
+Test the structured event log games write to instead of a curses pad.
+"""
+
+import unittest
+import sys
+import os
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+import decisions
+import event_log
+from tests.unit.fakes import load_config, new_game
+
+
+class Counted(object):
+    """Counts how often it's turned into text."""
+
+    def __init__(self):
+        self.formatted = 0
+
+    def __str__(self):
+        self.formatted += 1
+        return "counted"
+
+
+class TestEventLog(unittest.TestCase):
+    """Test event_log.EventLog on its own."""
+
+    def test_formats_lazily(self):
+        """Fields aren't formatted until somebody reads the text, and then only once."""
+        log = event_log.EventLog()
+        counted = Counted()
+        event = log.emit(event_log.MESSAGE, "Playing {card}", {'card': counted})
+        self.assertEqual(counted.formatted, 0)
+        self.assertEqual(event.text, "Playing counted")
+        self.assertEqual(event.text, "Playing counted")
+        self.assertEqual(counted.formatted, 1)
+
+    def test_plain_messages_are_not_formatted(self):
+        """Preformatted messages are kept as they are, braces and all."""
+        log = event_log.EventLog()
+        self.assertEqual(log.emit(event_log.MESSAGE, "{not a field}").text, "{not a field}")
+
+    def test_ring_buffer(self):
+        """Only the newest events are kept."""
+        log = event_log.EventLog(capacity=3)
+        for i in range(5):
+            log.emit(event_log.MESSAGE, "{i}", {'i': i})
+        self.assertEqual(len(log), 3)
+        self.assertEqual([event.text for event in log], ["2", "3", "4"])
+
+    def test_subscribers(self):
+        """Subscribers see every event as it happens until they unsubscribe."""
+        log = event_log.EventLog()
+        seen = []
+        log.subscribe(seen.append)
+        log.emit(event_log.PHASE, "first")
+        log.unsubscribe(seen.append)
+        log.emit(event_log.PHASE, "second")
+        self.assertEqual([event.text for event in seen], ["first"])
+
+    def test_disabled(self):
+        """A disabled log keeps nothing and tells nobody."""
+        log = event_log.EventLog(enabled=False)
+        seen = []
+        log.subscribe(seen.append)
+        self.assertIsNone(log.emit(event_log.MESSAGE, "ignored"))
+        self.assertEqual(len(log), 0)
+        self.assertEqual(seen, [])
+
+    def test_export(self):
+        """Exported events are plain data."""
+        log = event_log.EventLog()
+        log.emit(event_log.DRAW, "{hero} draws {count} cards", {'hero': "Harry", 'count': 2})
+        self.assertEqual(log.export(), [{'kind': 'draw', 'text': "Harry draws 2 cards",
+                                         'fields': {'hero': "Harry", 'count': "2"}}])
+
+
+class TestGameEvents(unittest.TestCase):
+    """Test a real game writing to its event log."""
+
+    def setUp(self):
+        config = load_config("game_one")
+        self.game = new_game(config, [("Harry", None), ("Ron", None)],
+                              decision_provider=decisions.GreedyProvider(seed=1), seed=1)
+
+    def test_turn_is_logged(self):
+        """Playing a turn logs its phases, and prompts are their own kind."""
+        self.game.events.clear()
+        self.game.play_turn()
+        kinds = {event.kind for event in self.game.events}
+        self.assertIn(event_log.PHASE, kinds)
+        self.assertIn(event_log.PROMPT, kinds)
+        self.assertEqual(self.game.events[0].text, "-----Turn start-----")
+
+    def test_restore_keeps_events(self):
+        """Restoring a snapshot rewinds the game, not what it has logged."""
+        snapshot = self.game.snapshot()
+        self.game.play_turn()
+        logged = len(self.game.events)
+        self.game.restore(snapshot)
+        self.assertEqual(len(self.game.events), logged)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+"""
+Test building a real Game without a terminal.
+
+With no renderer the game uses display.NullRenderer: decks get no windows,
+display_state is a no-op and logging only fills the game's event log, so the
+full rules engine can be constructed in a plain process.
+"""
+
+import unittest
+import sys
+import os
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+import decisions
+import display
+import game
+import heroes
+import proficiencies
+from tests.unit.fakes import load_config
+
+
+def make_heroes(config, names):
+    proficiency = proficiencies.PROFICIENCIES['Potions'] if config.get('proficiencies') else proficiencies.NullProficiency
+    return [heroes.HEROES[name](config['hero_abilities'], proficiency()) for name in names]
+
+
+class TestHeadlessGame(unittest.TestCase):
+    """Test Game construction with the default no-op renderer."""
+
+    def test_game_one_setup(self):
+        """Game 1 deals the market, villains and opening hands with no windows."""
+        config = load_config("game_one")
+        g = game.Game(config, make_heroes(config, ["Harry", "Ron"]))
+
+        self.assertIsInstance(g._renderer, display.NullRenderer)
+        self.assertIsNone(g.encounters)
+        self.assertEqual(len(g.villain_deck.current), config['villains_deck']['villains_revealed'])
+        self.assertEqual(len(g.hogwarts_deck._market), 6)
+        for hero in g.heroes:
+            self.assertEqual(len(hero._hand), 5)
+
+    def test_encounters_setup(self):
+        """Configs with encounters build the encounters deck headless too."""
+        config = load_config("monster_box_four")
+        g = game.Game(config, make_heroes(config, ["Hermione", "Neville", "Ginny", "Luna"]))
+
+        self.assertIsNotNone(g.encounters)
+        self.assertEqual(len(g.heroes), 4)
+
+    def test_display_and_log_are_noops(self):
+        """display_state and log do nothing without a renderer."""
+        config = load_config("game_seven")
+        g = game.Game(config, make_heroes(config, ["Harry"]))
+
+        g.display_state()
+        g.display_state(resize=True)
+        g.log("nobody is listening")
+
+    def test_input_needs_a_renderer(self):
+        """The default keyboard provider can't read keys from the null renderer."""
+        config = load_config("game_one")
+        g = game.Game(config, make_heroes(config, ["Harry"]))
+
+        with self.assertRaises(ValueError):
+            g.input("Pick one: ", "yn")
+
+    def test_input_uses_decision_provider(self):
+        """Decisions are answered by the game's decision provider."""
+        config = load_config("game_one")
+        g = game.Game(config, make_heroes(config, ["Harry", "Ron"]),
+                      decision_provider=decisions.ScriptedProvider(['n', '1']))
+
+        self.assertEqual(g.input("Pick one: ", "yn"), 'n')
+        self.assertEqual(g.input("Pick a number: ", range(2), kind=decisions.DecisionKind.CHOOSE_HERO), '1')
+        with self.assertRaises(ValueError):
+            g.input("Out of answers: ", "yn")
+
+    def test_random_bot_plays_full_game(self):
+        """A random bot drives a real game to completion without a terminal."""
+        config = load_config("game_one")
+        g = game.Game(config, make_heroes(config, ["Harry", "Ron"]),
+                      decision_provider=decisions.RandomProvider(seed=1))
+
+        self.assertIn(g.play(), (True, False))
+
+    def test_same_seed_same_game(self):
+        """Games with the same seed play out identically, even interleaved."""
+        config = load_config("monster_box_one")
+
+        def new_game():
+            return game.Game(config, make_heroes(config, ["Harry", "Ron"]),
+                             decision_provider=decisions.GreedyProvider(seed=7), seed=7)
+
+        first, second = new_game(), new_game()
+        for _ in range(5):
+            first.play_turn()
+            second.play_turn()
+        for a, b in zip(first.heroes, second.heroes):
+            self.assertEqual([card.name for card in a._deck], [card.name for card in b._deck])
+            self.assertEqual(a._hearts, b._hearts)
+        self.assertEqual(first.rng.getstate(), second.rng.getstate())
+
+
+class TestGroupViews(unittest.TestCase):
+    """Test the cached hero and villain groups."""
+
+    def setUp(self):
+        config = load_config("game_one")
+        self.game = game.Game(config, make_heroes(config, ["Harry", "Ron", "Hermione"]))
+
+    def test_hero_groups_are_reused(self):
+        """all_heroes is built once, and all_heroes_except_active follows the turn."""
+        g = self.game
+        self.assertIs(g.heroes.all_heroes, g.heroes.all_heroes)
+        self.assertEqual([hero.name for hero in g.heroes.all_heroes_except_active], ["Ron", "Hermione"])
+        g.heroes.next()
+        self.assertEqual([hero.name for hero in g.heroes.all_heroes_except_active], ["Harry", "Hermione"])
+
+    def test_batch_hearts_logged_once(self):
+        """Hurting or healing everybody logs one line, not one per hero."""
+        g = self.game
+        g.events.clear()
+        g.heroes.all_heroes.remove_hearts(g, 1)
+        self.assertEqual([str(event) for event in g.events], ["Harry, Ron, Hermione lose 1 hearts!"])
+        self.assertEqual([hero._hearts for hero in g.heroes], [9, 9, 9])
+
+        g.heroes.all_heroes.add_hearts(g, 1)
+        self.assertEqual([str(event) for event in g.events][1:], ["Harry, Ron, Hermione gain 1 hearts!"])
+
+    def test_villain_groups_rebuilt_on_defeat(self):
+        """Defeating a villain gives new groups, leaving ones already handed out alone."""
+        villain_deck = self.game.villain_deck
+        before = villain_deck.all
+        self.assertIs(villain_deck.all, before)
+        self.assertIs(villain_deck.all_villains, villain_deck.all_villains)
+        defeated = villain_deck.current[0]
+        villain_deck._defeated(defeated)
+        self.assertIn(defeated, before)
+        self.assertNotIn(defeated, villain_deck.all)
+        self.assertNotIn(defeated, villain_deck.all_villains)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+"""
+Test the legal choices the rules hand to decision providers.
+
+Prompts accept keys the rules then refuse ("Not enough 💰!"); Decision.legal
+lists only the ones that will actually be carried out.
+"""
+
+import unittest
+import sys
+import os
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+import decisions
+import hogwarts
+import locations
+from tests.unit.fakes import load_config, new_game
+
+
+ACTIONS = ['p', 'a', 'b', 'e', 'q', 'i']
+
+
+class Recorder(decisions.DecisionProvider):
+    """Answers like another provider, keeping every decision it was asked."""
+
+    def __init__(self, provider):
+        self._provider = provider
+        self.decisions = []
+
+    def choose(self, game, decision):
+        self.decisions.append(decision)
+        return self._provider.choose(game, decision)
+
+
+class TestLegalChoices(unittest.TestCase):
+    """Test Hero.legal_actions, Hero.buy_choices and the villain deck's assign choices."""
+
+    def setUp(self):
+        self.config = load_config("game_seven")
+        self.game = new_game(self.config, [("Harry", "Arithmancy"), ("Ron", "Charms")], seed=1)
+        self.hero = self.game.heroes.active_hero
+
+    def test_actions_need_something_to_do(self):
+        """Assigning and buying need tokens; playing needs cards."""
+        self.hero._damage_tokens = 0
+        self.hero._influence_tokens = 0
+        self.assertEqual(self.hero.legal_actions(self.game, ACTIONS), ['p', 'e', 'q'])
+        self.hero._hand.clear()
+        self.hero._damage_tokens = 1
+        self.hero._influence_tokens = 10
+        # Influence only goes on creatures, and game 7 may not have one out
+        assign_influence = ['i'] if self.game.villain_deck.influence_choices(self.game) else []
+        self.assertEqual(self.hero.legal_actions(self.game, ACTIONS), ['a', 'b', 'e', 'q'] + assign_influence)
+
+    def test_extra_actions_only_when_usable(self):
+        """Proficiency and location actions are only legal when they wouldn't be refused."""
+        g = new_game(self.config, [("Ron", "Charms"), ("Harry", "Potions")], seed=1)
+        hero = g.heroes.active_hero
+        hero._proficiency.start_turn(g)
+        hero.add_action(g, *locations.LOCATIONS_BY_NAME["Hogwarts Castle"](None).action)
+        actions = ACTIONS + ['c', 'H']
+        hero._hand = [hogwarts.CARDS_BY_NAME["Lumos"](), hogwarts.CARDS_BY_NAME["Buckbeak"]()]
+        hero._damage_tokens = 4
+        self.assertFalse({'c', 'H'} & set(hero.legal_actions(g, actions)))
+        hero._hand.append(hogwarts.CARDS_BY_NAME["Incendio"]())
+        hero._damage_tokens = 5
+        self.assertTrue({'c', 'H'} <= set(hero.legal_actions(g, actions)))
+        hero._proficiency._used_ability = True
+        self.assertNotIn('c', hero.legal_actions(g, actions))
+
+    def test_buy_choices_use_cost_modifier(self):
+        """Arithmancy makes cards that roll a house die a coin cheaper."""
+        self.hero._influence_tokens = 3
+        market = self.game.hogwarts_deck
+        for i in range(len(market._market)):
+            card = market[i]
+            expected = card.cost - (1 if card.rolls_house_die else 0) <= 3
+            self.assertEqual(str(i) in self.hero.buy_choices(self.game), expected, card.name)
+        self.hero._influence_tokens = 0
+        self.assertEqual(self.hero.buy_choices(self.game), [])
+
+    def test_assign_choices(self):
+        """Only foes that can take another token are legal, and never an invulnerable Voldemort."""
+        deck = self.game.villain_deck
+        self.assertEqual(deck.damage_choices(self.game), [key for key in deck.choices if deck[key].can_take_damage(self.game)])
+        deck._deck.clear()
+        self.assertIn('v', deck.choices)
+        self.assertNotIn('v', deck.damage_choices(self.game))
+        self.assertNotIn('v', deck.influence_choices(self.game))
+
+    def test_legal_choices_reach_providers(self):
+        """Every decision offers legal choices the rules accept, and the random bot sticks to them."""
+        recorder = Recorder(decisions.RandomProvider(seed=3))
+        g = new_game(self.config, [("Harry", "Potions"), ("Ron", "Charms")],
+                      decision_provider=recorder, seed=3)
+        for _ in range(3):
+            g.play_turn()
+        for decision in recorder.decisions:
+            self.assertTrue(set(decision.legal) <= set(decision.choices), decision)
+        self.assertFalse(any(event.text.startswith("Not enough") for event in g.events))
+
+    def test_greedy_fallback_picks_legal(self):
+        """Decisions the greedy bot has no opinion on are answered from the legal choices."""
+        provider = decisions.GreedyProvider(seed=0)
+        decision = decisions.Decision(decisions.DecisionKind.CHOICE, "Pick: ", ['0', '1', '2', '3'], legal=['2'])
+        for _ in range(20):
+            self.assertEqual(provider.choose(None, decision), '2')
+
+
+if __name__ == '__main__':
+    unittest.main()
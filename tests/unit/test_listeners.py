@@ -0,0 +1,152 @@
+"""
+Test effects.Listeners, which runs callbacks waiting on heroes and locations.
+"""
+
+import unittest
+import sys
+import os
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+import effects
+import heroes
+import proficiencies
+import state
+from tests.unit.fakes import FakeGame
+
+
+class Recorder(object):
+    """Callback owner that writes down every call."""
+
+    def __init__(self, name, calls):
+        self.name = name
+        self._calls = calls
+
+    def effect(self, game, *args):
+        self._calls.append((self.name, game.effect_source.current, args))
+
+
+class TestListeners(unittest.TestCase):
+    """Test adding, removing and running callbacks."""
+
+    def setUp(self):
+        self.game = FakeGame()
+        self.listeners = effects.Listeners()
+        self.calls = []
+        self.first = Recorder("first", self.calls)
+        self.second = Recorder("second", self.calls)
+
+    def names(self):
+        return [name for name, _, _ in self.calls]
+
+    def test_runs_in_order_with_owner_as_source(self):
+        """Callbacks run oldest first, each with its owner as the effect source."""
+        self.listeners.add(effects.PLAY_CARD, "hero", self.first.effect)
+        self.listeners.add(effects.PLAY_CARD, "hero", self.second.effect)
+        self.listeners.run(self.game, effects.PLAY_CARD, "hero", "card")
+        self.assertEqual(self.calls, [("first", self.first, ("card",)), ("second", self.second, ("card",))])
+
+    def test_only_matching_trigger_and_subject_run(self):
+        """Other triggers, and the same trigger on someone else, are left alone."""
+        self.listeners.add(effects.PLAY_CARD, "hero", self.first.effect)
+        self.listeners.run(self.game, effects.PLAY_CARD, "other hero", "card")
+        self.listeners.run(self.game, effects.ASSIGN_DAMAGE, "hero", "foe", 1)
+        self.assertEqual(self.calls, [])
+
+    def test_added_twice_runs_twice(self):
+        """A callback added twice runs twice, and removing it takes one away."""
+        self.listeners.add(effects.DISCARD, "hero", self.first.effect)
+        self.listeners.add(effects.DISCARD, "hero", self.first.effect)
+        self.listeners.remove(effects.DISCARD, "hero", self.first.effect)
+        self.listeners.run(self.game, effects.DISCARD, "hero")
+        self.assertEqual(self.names(), ["first"])
+
+    def test_removing_unknown_callback(self):
+        """Removing something that isn't waiting is a programmer error, like list.remove."""
+        with self.assertRaises(ValueError):
+            self.listeners.remove(effects.DISCARD, "hero", self.first.effect)
+
+    def test_turn_callbacks_expire(self):
+        """Turn-scoped callbacks go at the end of their subject's turn, others stay."""
+        self.listeners.add(effects.SHUFFLE, "hero", self.first.effect)
+        self.listeners.add(effects.SHUFFLE, "hero", self.second.effect, turn=True)
+        self.listeners.add(effects.SHUFFLE, "other hero", self.second.effect, turn=True)
+        self.listeners.end_turn("hero")
+        self.listeners.run(self.game, effects.SHUFFLE, "hero")
+        self.listeners.run(self.game, effects.SHUFFLE, "other hero")
+        self.assertEqual(self.names(), ["first", "second"])
+
+    def test_removing_itself_does_not_skip_the_next(self):
+        """A callback that removes itself while running doesn't stop the next one running."""
+        def remove_first(game, *args):
+            self.listeners.remove(effects.ACQUIRE, "hero", remove_first)
+        self.listeners.add(effects.ACQUIRE, "hero", remove_first)
+        self.listeners.add(effects.ACQUIRE, "hero", self.second.effect)
+        self.listeners.run(self.game, effects.ACQUIRE, "hero", "hero", "card")
+        self.assertEqual(self.names(), ["second"])
+
+    def test_removed_by_another_does_not_run(self):
+        """A callback removed by an earlier one in the same run is skipped."""
+        def remove_second(game, *args):
+            self.listeners.remove(effects.ACQUIRE, "hero", self.second.effect)
+        self.listeners.add(effects.ACQUIRE, "hero", remove_second)
+        self.listeners.add(effects.ACQUIRE, "hero", self.second.effect)
+        self.listeners.add(effects.ACQUIRE, "hero", self.first.effect)
+        self.listeners.run(self.game, effects.ACQUIRE, "hero", "hero", "card")
+        self.assertEqual(self.names(), ["first"])
+
+    def test_cleared_during_run(self):
+        """Clearing the trigger from a callback stops the rest of the run."""
+        def clear(game, *args):
+            self.listeners.clear(effects.DISCARD, "hero")
+        self.listeners.add(effects.DISCARD, "hero", clear)
+        self.listeners.add(effects.DISCARD, "hero", self.first.effect)
+        self.listeners.run(self.game, effects.DISCARD, "hero")
+        self.assertEqual(self.calls, [])
+
+    def test_clear_then_end_turn(self):
+        """Clearing a trigger before the turn ends leaves nothing behind."""
+        self.listeners.add(effects.DEFEAT_VILLAIN, "hero", self.first.effect, turn=True)
+        self.listeners.clear(effects.DEFEAT_VILLAIN, "hero")
+        self.listeners.end_turn("hero")
+        self.assertEqual(self.listeners._tables, {})
+        self.assertEqual(self.listeners._tokens, {})
+
+
+class TestHeroListeners(unittest.TestCase):
+    """Test heroes waiting on the game's listeners."""
+
+    def test_join_brings_proficiency_callbacks(self):
+        """Callbacks added before the game started still run once the hero joins."""
+        hero = heroes.HEROES['Harry'](1, proficiencies.DefenseAgainstTheDarkArts())
+        listeners = effects.Listeners()
+        hero.join(listeners)
+        self.assertIs(hero._listeners, listeners)
+        self.assertIn((effects.DISCARD, hero), listeners._tables)
+
+    def test_extra_effects_last_one_turn(self):
+        """Extra card effects go at the end of the turn; shuffle effects stay."""
+        hero = heroes.HEROES['Harry'](1, proficiencies.NullProficiency())
+        game = FakeGame(heroes=[hero])
+        calls = []
+        recorder = Recorder("recorder", calls)
+        hero.add_extra_card_effect(game, recorder.effect)
+        hero.add_extra_shuffle_effect(game, recorder.effect)
+        hero.end_turn(game)
+        self.assertNotIn((effects.PLAY_CARD, hero), hero._listeners._tables)
+        self.assertIn((effects.SHUFFLE, hero), hero._listeners._tables)
+
+    def test_snapshot_restores_callbacks(self):
+        """Restoring a snapshot puts back what was waiting."""
+        hero = heroes.HEROES['Harry'](1, proficiencies.NullProficiency())
+        game = FakeGame(heroes=[hero])
+        recorder = Recorder("recorder", [])
+        snap = state.snapshot(hero)
+        hero.add_extra_card_effect(game, recorder.effect)
+        state.restore(snap)
+        self.assertEqual(hero._listeners._tables, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+"""
+Test the Hogwarts market: refilling, recycling and looking up slots.
+"""
+
+import unittest
+import sys
+import os
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+import random
+
+import hogwarts
+from tests.unit.fakes import FakeGame
+
+
+def card(name):
+    return hogwarts.CARDS_BY_NAME[name]()
+
+
+class TestMarket(unittest.TestCase):
+    """Test HogwartsDeck's market slots."""
+
+    def setUp(self):
+        self.game = FakeGame()
+        self.market = hogwarts.HogwartsDeck(None, [], random.Random(0))
+        # Top of the deck is on the right
+        self.market._deck.extend([card("Incendio"), card("Reparo"), card("Expelliarmus"), card("Descendo"),
+                                  card("Lumos"), card("Stupefy"), card("Lumos"), card("Wingardium Leviosa")])
+
+    def names(self):
+        return [self.market[i].name for i in range(len(self.market._market))]
+
+    def test_refill_stacks_copies(self):
+        """Copies of a card share a slot, and slots are indexed in the order they appeared."""
+        self.market.refill_market(self.game)
+        self.assertEqual(self.names(), ["Wingardium Leviosa", "Lumos", "Stupefy", "Descendo", "Expelliarmus", "Reparo"])
+        self.assertEqual(len(self.market._market["Lumos"]), 2)
+        self.assertEqual([c.name for c in self.market._deck], ["Incendio"])
+
+    def test_slots_reindexed_after_emptying(self):
+        """Once a slot is bought out or recycled, later slots move up and refilling adds at the end."""
+        self.market.refill_market(self.game)
+        self.market.remove("Stupefy")
+        self.assertEqual(self.market[1].name, "Lumos")
+        self.market.empty_market_slot(self.game, "Lumos")
+        self.assertEqual(self.names(), ["Wingardium Leviosa", "Descendo", "Expelliarmus", "Reparo"])
+        self.market.refill_market(self.game)
+        self.assertEqual(self.names(), ["Wingardium Leviosa", "Descendo", "Expelliarmus", "Reparo", "Incendio", "Lumos"])
+        with self.assertRaises(ValueError):
+            self.market[6]
+
+    def test_recycled_cards_go_to_the_bottom(self):
+        """Recycling the market puts its cards under the deck, last slot lowest."""
+        self.market.refill_market(self.game)
+        self.market.empty_market(self.game)
+        self.assertEqual(self.market._market, {})
+        self.assertEqual([c.name for c in self.market._deck],
+                         ["Reparo", "Expelliarmus", "Descendo", "Stupefy", "Lumos", "Lumos", "Wingardium Leviosa", "Incendio"])
+
+    def test_affordable(self):
+        """affordable compares against the cheapest card in the market."""
+        self.assertFalse(self.market.affordable(10))
+        self.market.refill_market(self.game)
+        cheapest = min(self.market[i].cost for i in range(6))
+        self.assertTrue(self.market.affordable(cheapest))
+        self.assertFalse(self.market.affordable(cheapest - 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
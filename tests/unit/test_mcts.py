@@ -0,0 +1,176 @@
+"""
+Test the Monte Carlo tree search bot on real headless games.
+
+Budgets are kept tiny so the tests stay fast; they check the search plumbing
+(snapshot, replay, restore), not how well the bot plays.
+"""
+
+import unittest
+import sys
+import os
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+import decisions
+import mcts
+from tests.unit.fakes import HEROES, load_config, new_game
+
+
+def summary(g):
+    """Enough of the game state to tell two games apart."""
+    heroes = [(hero._hearts, hero._damage_tokens, hero._influence_tokens,
+               [card.name for card in hero._deck], [card.name for card in hero._hand],
+               [card.name for card in hero._discard]) for hero in g.heroes]
+    villains = [(foe.name, foe._damage, foe._influence) for foe in g.villain_deck.current]
+    return (g.turns, heroes, villains, g.locations._current, g.locations.current._control, g.rng.getstate())
+
+
+class TestMCTSProvider(unittest.TestCase):
+    """Test mcts.MCTSProvider driving game 7."""
+
+    def setUp(self):
+        self.config = load_config("game_seven")
+
+    def new_game(self, provider, seed=3):
+        return new_game(self.config, decision_provider=provider, seed=seed)
+
+    def test_search_leaves_game_untouched(self):
+        """Replaying the bot's answers without searching reaches exactly the same state."""
+        provider = mcts.MCTSProvider(rollouts=8, horizon=1, seed=1)
+        searched = self.new_game(provider)
+        for _ in range(3):
+            searched.play_turn()
+
+        replayed = self.new_game(decisions.ScriptedProvider(provider._history))
+        for _ in range(3):
+            replayed.play_turn()
+        self.assertEqual(summary(searched), summary(replayed))
+
+    def test_same_seed_same_answers(self):
+        """Search is deterministic given the game and provider seeds."""
+        answers = []
+        for _ in range(2):
+            provider = mcts.MCTSProvider(rollouts=8, horizon=1, seed=4)
+            g = self.new_game(provider)
+            g.play_turn()
+            g.play_turn()
+            answers.append(provider._history)
+        self.assertEqual(answers[0], answers[1])
+
+    def test_time_budget(self):
+        """The time budget stops the search long before the rollout budget would."""
+        provider = mcts.MCTSProvider(rollouts=10**9, time_budget=0.01, horizon=1, seed=1)
+        g = self.new_game(provider)
+        g.play_turn()
+        self.assertGreater(len(provider._history), 0)
+
+    def test_plays_full_game(self):
+        """The bot plays a game to the end without a terminal."""
+        g = self.new_game(mcts.MCTSProvider(rollouts=4, horizon=1, seed=2))
+        self.assertIn(g.play(max_turns=100), (True, False))
+
+    def test_answers_are_accepted(self):
+        """Every answer is one the decision accepts, whatever the rollouts ran into below it."""
+        class Checked(decisions.DecisionProvider):
+            def __init__(self, provider):
+                self.provider = provider
+                self.wrong = []
+
+            def start_turn(self, game):
+                self.provider.start_turn(game)
+
+            def choose(self, game, decision):
+                answer = self.provider.choose(game, decision)
+                if answer not in decision.choices:
+                    self.wrong.append((decision, answer))
+                return answer
+
+        for name in ("game_seven", "monster_box_one"):
+            config = load_config(name)
+            for seed in range(3):
+                with self.subTest(config=name, seed=seed):
+                    # The default budget: small searches rarely get deep enough to go wrong
+                    checked = Checked(mcts.MCTSProvider(seed=seed))
+                    new_game(config, decision_provider=checked, seed=seed).play(max_turns=12)
+                    self.assertEqual(checked.wrong, [])
+
+    def test_rollouts_are_not_logged(self):
+        """Only the moves actually made end up in the game's log."""
+        provider = mcts.MCTSProvider(rollouts=8, horizon=1, seed=1)
+        searched = self.new_game(provider)
+        searched.play_turn()
+
+        replayed = self.new_game(decisions.ScriptedProvider(provider._history))
+        replayed.play_turn()
+        self.assertEqual([event.text for event in searched.events], [event.text for event in replayed.events])
+
+    def test_workers(self):
+        """Searching in worker processes picks answers the same game can replay."""
+        provider = mcts.MCTSProvider(rollouts=4, horizon=1, seed=1, workers=2, game_spec=(self.config, HEROES, 3))
+        try:
+            g = self.new_game(provider)
+            g.play_turn()
+        finally:
+            provider.close()
+
+        replayed = self.new_game(decisions.ScriptedProvider(provider._history))
+        replayed.play_turn()
+        self.assertEqual(summary(g), summary(replayed))
+
+    def test_crashed_rollouts_are_counted(self):
+        """Rollouts that crash count as losses, and are counted and logged rather than hidden."""
+        class CrashInRollouts(decisions.GreedyProvider):
+            def choose(self, game, decision):
+                if not game.events.enabled:
+                    raise RuntimeError("rules bug")
+                return super().choose(game, decision)
+
+        provider = mcts.MCTSProvider(rollouts=4, horizon=1, seed=1, default_policy=CrashInRollouts)
+        g = self.new_game(provider)
+        g.play_turn()
+        self.assertGreater(provider.rollout_errors["RuntimeError('rules bug')"], 0)
+        self.assertTrue(any(event.text.startswith("MCTS: ") for event in g.events))
+
+    def test_workers_need_game_spec(self):
+        """Workers rebuild the game, so they need to know how it was built."""
+        with self.assertRaises(ValueError):
+            mcts.MCTSProvider(workers=2)
+
+
+class TestCandidates(unittest.TestCase):
+    """Test mcts.candidates pruning legal choices that can't help."""
+
+    def setUp(self):
+        config = load_config("game_one")
+        self.game = new_game(config, [("Harry", None)], seed=1)
+        self.hero = self.game.heroes.active_hero
+
+    def decision(self, kind, choices, legal=None):
+        return decisions.Decision(kind, "", choices, self.hero, legal)
+
+    def action(self):
+        actions = ['p', 'a', 'b', 'e', 'q', 'i']
+        return self.decision(decisions.DecisionKind.ACTION, actions, self.hero.legal_actions(self.game, actions))
+
+    def test_never_quit(self):
+        """Quitting is never searched; with cards in hand, playing is the only option."""
+        self.assertEqual(mcts.candidates(self.game, self.action()), ['p'])
+
+    def test_end_turn_with_empty_hand(self):
+        """With nothing to play or spend, ending the turn is all that's left."""
+        self.hero._hand.clear()
+        self.assertEqual(mcts.candidates(self.game, self.action()), ['e'])
+
+    def test_assign_damage_skips_cancel(self):
+        """Cancelling an assignment just goes back to the menu."""
+        choices = mcts.candidates(self.game, self.decision(decisions.DecisionKind.ASSIGN_DAMAGE, ['c', '0']))
+        self.assertEqual(choices, ['0'])
+
+    def test_cancel_when_nothing_is_legal(self):
+        """Cancelling is still an answer when it's the only legal one."""
+        choices = mcts.candidates(self.game, self.decision(decisions.DecisionKind.BUY, ['c', 't', 'r', '0'], ['c']))
+        self.assertEqual(choices, ['c'])
+
+if __name__ == '__main__':
+    unittest.main()
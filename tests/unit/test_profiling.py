@@ -0,0 +1,125 @@
+"""
+Test the profiler that times phases, cards, villains and callbacks.
+"""
+
+import unittest
+import sys
+import os
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+import decisions
+import effects
+import hogwarts
+import profiling
+import simulate
+from tests.unit.fakes import FakeGame, HEROES, load_config, new_game
+
+
+class FakeClock(object):
+    """Clock that moves on one second every time it's read."""
+
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        self.now += 1
+        return self.now
+
+
+class TestProfiler(unittest.TestCase):
+    """Test Profiler's bookkeeping and exports."""
+
+    def setUp(self):
+        self.profiler = profiling.Profiler(clock=FakeClock())
+
+    def test_own_and_total_time(self):
+        """Frames count their total time, and their own time without the frames under them."""
+        with self.profiler.frame("phase", "heroes"):
+            with self.profiler.frame("card", "Lumos"):
+                pass
+            with self.profiler.frame("card", "Lumos"):
+                pass
+        totals = self.profiler.totals()
+        self.assertEqual(totals['card']['Lumos'], {'calls': 2, 'seconds': 2, 'own_seconds': 2})
+        self.assertEqual(totals['phase']['heroes'], {'calls': 1, 'seconds': 5, 'own_seconds': 3})
+        self.assertEqual(self.profiler.as_dict()['seconds'], 5)
+
+    def test_nested_in_itself_counted_once(self):
+        """A frame inside itself adds its calls and own time, but not its total twice."""
+        with self.profiler.frame("decision", "ACTION"):
+            with self.profiler.frame("decision", "ACTION"):
+                pass
+        self.assertEqual(self.profiler.totals()['decision']['ACTION'], {'calls': 2, 'seconds': 3, 'own_seconds': 3})
+
+    def test_collapsed_stacks(self):
+        """Collapsed stacks list each stack's own time in microseconds."""
+        with self.profiler.frame("phase", "villains"):
+            with self.profiler.frame("villain", "Draco; Malfoy"):
+                pass
+        self.assertEqual(self.profiler.collapsed(), ["phase:villains 2000000", "phase:villains;villain:Draco, Malfoy 1000000"])
+
+    def test_merge(self):
+        """Merging adds another profiler's counts to this one's."""
+        other = profiling.Profiler(clock=FakeClock())
+        for profiler in (self.profiler, other):
+            with profiler.frame("phase", "cleanup"):
+                pass
+        self.profiler.merge(other)
+        self.assertEqual(self.profiler.totals()['phase']['cleanup']['calls'], 2)
+
+    def test_describe(self):
+        """Sources are named by the package their base class is from."""
+        self.assertEqual(profiling.describe(hogwarts.CARDS_BY_NAME["Lumos"]()), ('card', 'Lumos'))
+
+
+class TestProfiledGames(unittest.TestCase):
+    """Test profiling real games."""
+
+    def setUp(self):
+        self.config = load_config("game_three")
+
+    def test_unprofiled_games_use_plain_sources(self):
+        """Games nobody is timing keep the plain effect source stack."""
+        g = new_game(self.config)
+        self.assertIs(type(g.effect_source), effects.EffectSources)
+
+    def test_profiled_game(self):
+        """A profiled game records every phase, the cards played and the callbacks run."""
+        profiler = profiling.Profiler()
+        g = new_game(self.config,
+                      decision_provider=decisions.GreedyProvider(seed=1), seed=1, profiler=profiler)
+        g.play(5)
+        totals = profiler.totals()
+        self.assertEqual(set(totals['phase']), {"dark arts", "villains", "heroes", "cleanup"})
+        self.assertEqual(totals['phase']['heroes']['calls'], 5)
+        self.assertIn('card', totals)
+        self.assertIn('villain', totals)
+        self.assertIn('decision', totals)
+        self.assertEqual(profiler._path, [])
+
+    def test_callbacks_named_by_trigger(self):
+        """Callbacks show up under the trigger they ran for."""
+        profiler = profiling.Profiler()
+        g = FakeGame()
+        g.effect_source = effects.ProfiledEffectSources(profiler)
+        listeners = effects.Listeners()
+        card = hogwarts.CARDS_BY_NAME["Lumos"]()
+        listeners.add(effects.ACQUIRE, "hero", lambda game, *args: None)
+        listeners.run(g, effects.ACQUIRE, "hero")
+        with g.effect_source(card):
+            self.assertIs(g.effect_source.current, card)
+        self.assertIn(effects.ACQUIRE, profiler.totals())
+        self.assertEqual(profiler.totals()['card']['Lumos']['calls'], 1)
+
+    def test_simulate_with_workers(self):
+        """Profiles from worker processes are added together."""
+        profiler = profiling.Profiler()
+        summary = simulate.simulate(self.config, HEROES, games=4, workers=2, batch_size=2, max_turns=3, profiler=profiler)
+        self.assertEqual(summary.games, 4)
+        self.assertEqual(profiler.totals()['phase']['heroes']['calls'], 12)
+
+
+if __name__ == '__main__':
+    unittest.main()
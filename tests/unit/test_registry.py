@@ -0,0 +1,72 @@
+"""
+Test the static card registries and loading cards lazily through them.
+"""
+
+import unittest
+import sys
+import os
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+import subprocess
+
+import hogwarts
+import registry
+import villains
+
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+
+
+class TestRegistry(unittest.TestCase):
+    """Test registry.Registry and the generated _registry.py files."""
+
+    def test_generated_registries_up_to_date(self):
+        """Every package's _registry.py matches the modules actually in it."""
+        for package_name in registry.PACKAGES:
+            with self.subTest(package=package_name):
+                self.assertEqual(registry.registry_path(package_name).read_text(), registry.generate(package_name),
+                                 "Out of date, run: python3 registry.py")
+
+    def test_lookup_finds_registered_class(self):
+        """Looking a name up gives the class its module registered."""
+        from hogwarts.lumos import Lumos
+        self.assertIs(hogwarts.CARDS_BY_NAME['Lumos'], Lumos)
+        self.assertIn('Lumos', hogwarts.CARDS_BY_NAME)
+        self.assertNotIn('Lumos Maxima', hogwarts.CARDS_BY_NAME)
+
+    def test_names_listed_in_order(self):
+        """Names come out sorted, whatever has been loaded so far."""
+        names = list(villains.VILLAINS_BY_NAME)
+        self.assertEqual(names, sorted(names))
+        self.assertEqual(len(villains.VILLAINS_BY_NAME), len(names))
+
+    def test_stale_registry_reported(self):
+        """A name its module doesn't register is a programmer error, not a KeyError."""
+        stale = registry.Registry('hogwarts', {'Lumos Maxima': 'lumos'})
+        with self.assertRaises(ValueError):
+            stale['Lumos Maxima']
+        with self.assertRaises(KeyError):
+            stale['Nox']
+
+    def test_game_one_loads_only_its_cards(self):
+        """A game 1 imports its own cards, and no monster box ones."""
+        script = (
+            "import sys\n"
+            "from yaml import safe_load\n"
+            "import game\n"
+            "config = safe_load(open('config/game_one.yaml'))\n"
+            "game.Game(config, game.create_heroes(config, [('Harry', None), ('Ron', None)]), seed=1)\n"
+            "print(' '.join(sorted(m for m in sys.modules if m.startswith(('hogwarts.', 'villains.', 'encounters.')))))\n"
+        )
+        modules = subprocess.run([sys.executable, "-c", script], cwd=PROJECT_ROOT, check=True,
+                                 capture_output=True, text=True).stdout.split()
+        self.assertIn('villains.draco_malfoy', modules)
+        self.assertNotIn('encounters.monster_box_one', modules)
+        self.assertNotIn('villains.werewolf', modules)
+        self.assertNotIn('hogwarts.elder_wand', modules)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+"""
+Test that copies of a card share one definition, except where they keep state.
+"""
+
+import unittest
+import sys
+import os
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+import random
+
+import heroes
+import hogwarts
+import proficiencies
+import state
+
+
+class TestSharedCards(unittest.TestCase):
+    """Test card construction through the _Shared metaclass."""
+
+    def test_copies_are_one_object(self):
+        """Test that every copy of a stateless card is the same object."""
+        self.assertIs(hogwarts.Reparo(), hogwarts.Reparo())
+        self.assertIs(hogwarts.CARDS_BY_NAME['Hogwarts: A History'](), hogwarts.CARDS_BY_NAME['Hogwarts: A History']())
+        self.assertIs(hogwarts.Detention(), hogwarts.Detention())
+
+    def test_constructor_arguments_kept_apart(self):
+        """Test that cards built from different arguments aren't mixed up."""
+        hedwig = heroes.base.StarterAlly("Hedwig")
+        self.assertIs(heroes.base.StarterAlly("Hedwig"), hedwig)
+        self.assertIsNot(heroes.base.StarterAlly("Pigwidgeon"), hedwig)
+        self.assertEqual(heroes.base.StarterAlly("Pigwidgeon").name, "Pigwidgeon")
+
+    def test_stateful_cards_are_per_copy(self):
+        """Test that cards tracking their own state get an object per copy."""
+        for name in ('Confundus', 'Fleur Delacour', 'Luna Lovegood', 'O.W.L.S.'):
+            card_class = hogwarts.CARDS_BY_NAME[name]
+            self.assertIsNot(card_class(), card_class(), name)
+
+    def test_definitions_are_read_only(self):
+        """Test that a shared card's definition can't be changed."""
+        card = hogwarts.Reparo()
+        with self.assertRaises(AttributeError):
+            card.cost = 1
+        with self.assertRaises(AttributeError):
+            card.anything = 1
+        self.assertEqual(card.cost, 3)
+
+    def test_starting_decks_share_cards(self):
+        """Test that heroes' starting decks hold shared cards."""
+        harry = heroes.HEROES['Harry'](1, proficiencies.NullProficiency())
+        ron = heroes.HEROES['Ron'](1, proficiencies.NullProficiency())
+        alohomoras = [card for card in harry._discard + ron._discard if card.name == "Alohomora"]
+        self.assertEqual(len(alohomoras), 14)
+        self.assertEqual(len({id(card) for card in alohomoras}), 1)
+
+    def test_snapshot_skips_shared_but_restores_per_copy_state(self):
+        """Test that snapshots leave shared cards alone and roll back stateful ones."""
+        shared = hogwarts.Reparo()
+        confundus = hogwarts.CARDS_BY_NAME['Confundus']()
+        holder = hogwarts.HogwartsDeck(None, [], random.Random(0))
+        holder._deck = [shared, confundus]
+        snap = state.snapshot(holder)
+        self.assertNotIn(shared, [obj for obj, _ in snap._objects])
+        confundus._used_ability = True
+        state.restore(snap)
+        self.assertFalse(confundus._used_ability)
+
+
+class TestTakeFromDiscard(unittest.TestCase):
+    """Test Hero.take_from_discard."""
+
+    def test_takes_the_offered_position(self):
+        """Test that the chosen copy is taken, leaving the pile's order alone."""
+        hero = heroes.HEROES['Harry'](1, proficiencies.NullProficiency())
+        reparo = hogwarts.Reparo()
+        hero._discard = [reparo, hogwarts.Tergeo(), reparo, hogwarts.Detention()]
+        # Second Reparo is offered under the third letter
+        self.assertIs(hero.take_from_discard(heroes.base.ALPHA_OPTIONS[2]), reparo)
+        self.assertEqual([card.name for card in hero._discard], ["Reparo", "Tergeo", "Detention!"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+"""
+Test the batch simulator on real headless games.
+"""
+
+import unittest
+import sys
+import os
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+import game
+import simulate
+from tests.unit.fakes import load_config
+
+
+class TestSimulate(unittest.TestCase):
+    """Test simulate.simulate and its summary."""
+
+    def setUp(self):
+        self.config = load_config("game_one")
+
+    def test_create_heroes_builds_fresh_heroes(self):
+        """Each call builds new hero objects from the same specs."""
+        specs = [("Harry", None), ("Ron", None)]
+        first = game.create_heroes(self.config, specs)
+        second = game.create_heroes(self.config, specs)
+        self.assertEqual([hero.name for hero in first], ["Harry", "Ron"])
+        self.assertIsNot(first[0], second[0])
+
+    def test_every_game_is_counted(self):
+        """All games end up in exactly one outcome."""
+        summary = simulate.simulate(self.config, [("Harry", None), ("Ron", None)], games=5, batch_size=2)
+        self.assertEqual(summary.games, 5)
+        self.assertEqual(sum(summary.outcomes.values()), 5)
+        self.assertEqual(len(summary.turns_to_win), summary.outcomes['win'])
+
+    def test_results_are_streamed(self):
+        """on_result sees each game's result as it finishes."""
+        seen = []
+        simulate.simulate(self.config, [("Hermione", None)], games=3, first_seed=10, on_result=seen.append)
+        self.assertEqual(sorted(result['seed'] for result in seen), [10, 11, 12])
+
+    def test_max_turns(self):
+        """Games that run past the turn limit are timeouts."""
+        summary = simulate.simulate(self.config, [("Harry", None)], games=2, max_turns=1)
+        self.assertEqual(summary.outcomes['timeout'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
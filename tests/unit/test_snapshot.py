@@ -0,0 +1,135 @@
+"""
+Test Game.snapshot and Game.restore on real headless games.
+"""
+
+import unittest
+import sys
+import os
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+import decisions
+import encounters
+import game
+import state
+from tests.unit.fakes import load_config, new_game
+
+
+def summary(g):
+    """Enough of the game state to tell two games apart."""
+    heroes = [(hero._hearts, hero._damage_tokens, hero._influence_tokens,
+               [card.name for card in hero._deck], [card.name for card in hero._hand],
+               [card.name for card in hero._discard]) for hero in g.heroes]
+    villains = [(foe.name, foe._damage, foe._influence, foe._stunned) for foe in g.villain_deck.current]
+    market = [(name, len(cards)) for name, cards in g.hogwarts_deck._market.items()]
+    return (g.turns, heroes, villains, market, g.locations._current, g.locations.current._control,
+            [card.name for card in g.dark_arts_deck._deck], g.encounters.current.name)
+
+
+class TestSnapshot(unittest.TestCase):
+    """Test snapshotting and restoring a game 7."""
+
+    def setUp(self):
+        config = load_config("game_seven")
+        chosen_heroes = game.create_heroes(config, [("Harry", "Potions"), ("Ron", "Charms"), ("Neville", "Herbology")])
+        self.game = game.Game(config, chosen_heroes, decision_provider=decisions.GreedyProvider(seed=5), seed=5)
+        for _ in range(3):
+            self.game.play_turn()
+
+    def test_restore_rewinds_state(self):
+        """Restoring puts every deck, hero and foe back where it was."""
+        before = summary(self.game)
+        snapshot = self.game.snapshot()
+        for _ in range(3):
+            self.game.play_turn()
+        self.assertNotEqual(summary(self.game), before)
+
+        self.game.restore(snapshot)
+        self.assertEqual(summary(self.game), before)
+
+    def test_restore_keeps_identity(self):
+        """Restored games keep the same hero and deck objects."""
+        hero = self.game.heroes.active_hero
+        villain_deck = self.game.villain_deck
+        snapshot = self.game.snapshot()
+        self.game.play_turn()
+        self.game.restore(snapshot)
+        self.assertIs(self.game.heroes.active_hero, hero)
+        self.assertIs(self.game.villain_deck, villain_deck)
+
+    def test_restore_includes_rng(self):
+        """Replaying from a snapshot with the same decisions gives the same game."""
+        snapshot = self.game.snapshot()
+        bot_state = self.game._decision_provider._random.getstate()
+        self.game.play_turn()
+        after = summary(self.game)
+
+        self.game.restore(snapshot)
+        self.game._decision_provider._random.setstate(bot_state)
+        self.game.play_turn()
+        self.assertEqual(summary(self.game), after)
+
+    def test_snapshot_can_be_restored_twice(self):
+        """Restoring doesn't consume the snapshot."""
+        before = summary(self.game)
+        snapshot = self.game.snapshot()
+        for _ in range(2):
+            self.game.play_turn()
+            self.game.restore(snapshot)
+            self.assertEqual(summary(self.game), before)
+
+
+class TestFingerprint(unittest.TestCase):
+    """Test state.fingerprint, which display panels use to skip redraws."""
+
+    def setUp(self):
+        config = load_config("game_one")
+        self.game = new_game(config, [("Harry", None), ("Ron", None)], seed=1)
+        self.hero = self.game.heroes.active_hero
+
+    def test_unchanged_state_same_fingerprint(self):
+        """Nothing changed, nothing to redraw."""
+        self.assertEqual(state.fingerprint(self.hero), state.fingerprint(self.hero))
+
+    def test_tokens_change_fingerprint(self):
+        """Atomic fields are compared by value."""
+        before = state.fingerprint(self.hero)
+        self.hero.add_damage(self.game, 1)
+        self.assertNotEqual(state.fingerprint(self.hero), before)
+
+    def test_zone_mutated_in_place_changes_fingerprint(self):
+        """Cards moved between zones in place, as card effects do, are noticed."""
+        before = state.fingerprint(self.hero)
+        self.hero._discard.append(self.hero._hand.pop())
+        self.assertNotEqual(state.fingerprint(self.hero), before)
+
+    def test_reordered_zone_changes_fingerprint(self):
+        """Zones are compared by which cards they hold, in order."""
+        before = state.fingerprint(self.hero)
+        self.hero._hand.reverse()
+        self.assertNotEqual(state.fingerprint(self.hero), before)
+
+
+class TestSlots(unittest.TestCase):
+    """Test snapshots of slotted objects (heroes, foes, locations, encounters)."""
+
+    def test_game_objects_have_no_dict(self):
+        """Heroes, foes, locations and encounters are fully slotted."""
+        config = load_config("game_seven")
+        g = new_game(config, [("Ginny", None), ("Luna", None)], seed=1)
+        objects = list(g.heroes) + list(g.villain_deck.all) + g.locations._locations + [g.encounters.current]
+        for obj in objects:
+            self.assertFalse(hasattr(obj, '__dict__'), type(obj).__name__)
+
+    def test_slot_set_after_snapshot_is_unset_again(self):
+        """Slots first set after a snapshot go back to unset, like a cleared __dict__."""
+        ring = encounters.ENCOUNTERS_BY_NAME['Ring']()
+        snapshot = state.snapshot(ring)
+        ring._used_ability = True
+        state.restore(snapshot)
+        self.assertFalse(hasattr(ring, '_used_ability'))
+
+
+if __name__ == '__main__':
+    unittest.main()
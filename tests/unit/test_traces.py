@@ -0,0 +1,85 @@
+"""
+Test recording games to trace files and replaying them headlessly.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from pathlib import Path
+
+import decisions
+import replay
+import simulate
+import traces
+from tests.unit.fakes import HEROES, load_config, new_game
+
+
+class TestTraces(unittest.TestCase):
+    """Test traces.TraceWriter, traces.load and replay.replay."""
+
+    def setUp(self):
+        self.config = load_config("game_seven")
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def record(self, name, seed=5, max_turns=None):
+        path = Path(self.directory.name) / name
+        with traces.TraceWriter(path, self.config, HEROES, seed, max_turns) as trace:
+            provider = traces.RecordingProvider(decisions.GreedyProvider(seed=seed), trace)
+            g = new_game(self.config, decision_provider=provider, seed=seed)
+            won = g.play(max_turns)
+            trace.finish('win' if won else 'loss')
+        return path, g
+
+    def test_round_trip(self):
+        """Loading a trace gives back the setup and answers, gzipped or not."""
+        for name in ("game.jsonl", "game.jsonl.gz"):
+            path = Path(self.directory.name) / name
+            with traces.TraceWriter(path, self.config, HEROES, 7) as trace:
+                trace.answer('p')
+                trace.answer('a')
+                trace.finish('error', "ValueError('oops')")
+            loaded = traces.load(path)
+            self.assertEqual(loaded.config, self.config)
+            self.assertEqual(loaded.hero_specs, HEROES)
+            self.assertEqual(loaded.seed, 7)
+            self.assertEqual(loaded.answers, ['p', 'a'])
+            self.assertEqual((loaded.result, loaded.error), ('error', "ValueError('oops')"))
+
+    def test_replay_matches_recording(self):
+        """Replaying a recorded game ends the same way after the same turns."""
+        path, recorded = self.record("game.jsonl.gz")
+        result, error, replayed = replay.replay(traces.load(path))
+        self.assertEqual(result, traces.load(path).result)
+        self.assertIsNone(error)
+        self.assertEqual(replayed.turns, recorded.turns)
+        self.assertTrue(replay.check(path)['matches'])
+
+    def test_unfinished_trace(self):
+        """A trace that stops mid-game replays up to where it stopped."""
+        path = Path(self.directory.name) / "game.jsonl"
+        with traces.TraceWriter(path, self.config, HEROES, 1) as trace:
+            trace.answer('0')
+        result, error, g = replay.replay(traces.load(path))
+        self.assertEqual((result, error), (None, None))
+        self.assertTrue(replay.check(path)['matches'])
+
+    def test_simulate_records(self):
+        """Simulated games can be recorded and replayed, timeouts included."""
+        directory = Path(self.directory.name) / "simulated"
+        simulate.simulate(self.config, HEROES, games=3, max_turns=2, record_dir=directory)
+        paths = sorted(directory.iterdir())
+        self.assertEqual(len(paths), 3)
+        for path in paths:
+            report = replay.check(path)
+            self.assertEqual(report['recorded'], 'timeout')
+            self.assertTrue(report['matches'], report)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+Test the Gym-style vectorized environment over stepped headless games.
+
+numpy isn't required: without it observations come back as lists, which is
+what these tests index into either way.
+"""
+
+import unittest
+import sys
+import os
+import random
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+import vector_env
+from tests.unit.fakes import HEROES, load_config
+
+
+class TestVectorEnv(unittest.TestCase):
+    """Test vector_env.VectorEnv and vector_env.observe."""
+
+    def setUp(self):
+        self.config = load_config("game_seven")
+        self.env = vector_env.VectorEnv(self.config, HEROES, 3, max_turns=2)
+        self.addCleanup(self.env.close)
+
+    def test_card_ids(self):
+        """Starting cards and the market cards all have their own IDs."""
+        for name in ("Alohomora", "Detention!", "Firebolt", "Expelliarmus"):
+            self.assertNotEqual(vector_env.CARD_IDS[name], vector_env.OTHER_CARD)
+        self.assertEqual(len(set(vector_env.CARD_IDS.values())), len(vector_env.CARD_NAMES))
+
+    def test_reset(self):
+        """Every game gets a fixed-size observation and its legal actions."""
+        obs, infos = self.env.reset(seeds=[1, 2, 3])
+        self.assertEqual(len(obs), 3)
+        for row, info in zip(obs, infos):
+            self.assertEqual(len(row), vector_env.OBSERVATION_SIZE)
+            self.assertEqual(row[3], len(info['legal']))
+            self.assertGreater(len(info['legal']), 0)
+
+    def test_hand_counts(self):
+        """The hand section counts each hero's cards by ID."""
+        obs, infos = self.env.reset(seeds=[1, 2, 3])
+        game = self.env._games[0].game
+        for i, hero in enumerate(game.heroes):
+            start = vector_env.DECISION_FIELDS + i * vector_env.HERO_FIELDS
+            self.assertEqual(obs[0][start + 1], hero._hearts)
+            self.assertEqual(sum(obs[0][start + 7:start + vector_env.HERO_FIELDS]), len(hero._hand))
+
+    def test_games_restart(self):
+        """Finished games report how they ended and are dealt again on the next seed."""
+        obs, infos = self.env.reset(seeds=[1, 2, 3])
+        rng = random.Random(0)
+        finished = []
+        for _ in range(2000):
+            obs, rewards, terminated, truncated, infos = self.env.step([rng.randrange(len(info['legal'])) for info in infos])
+            finished.extend(info['outcome'] for info in infos if 'outcome' in info)
+            for i, info in enumerate(infos):
+                self.assertEqual(terminated[i] or truncated[i], 'outcome' in info)
+            if len(finished) >= 3:
+                break
+        self.assertGreaterEqual(len(finished), 3)
+        self.assertTrue(set(finished) <= {'win', 'loss', 'timeout', 'error'})
+        self.assertGreater(self.env._next_seed, 4)
+
+    def test_bad_actions(self):
+        """Actions index the legal list and there must be one per game."""
+        obs, infos = self.env.reset(seeds=[1, 2, 3])
+        with self.assertRaises(ValueError):
+            self.env.step([0, 0])
+        with self.assertRaises(ValueError):
+            self.env.step([len(infos[0]['legal']), 0, 0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+"""
+Test the villain board's counts of who's out, stunned and open to attack.
+"""
+
+import unittest
+import sys
+import os
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+import encoding
+from tests.unit.fakes import new_game
+
+
+def active(villain_deck):
+    """What count_active should say, worked out the slow way."""
+    return {foe.name: sum(1 for other in villain_deck.current if other.name == foe.name and not other._stunned)
+            for foe in villain_deck.current}
+
+
+class TestVillainBoard(unittest.TestCase):
+    """Test VillainDeck's board counts."""
+
+    def setUp(self):
+        self.game = new_game("game_five", seed=3)
+        self.villain_deck = self.game.villain_deck
+
+    def counts(self):
+        return {foe.name: self.villain_deck.count_active(foe.name) for foe in self.villain_deck.current}
+
+    def test_counts_follow_stun_and_recover(self):
+        """Stunned foes stop counting until they recover on their stunner's turn."""
+        foe = self.villain_deck.current[0]
+        foe.stun(self.game)
+        self.assertEqual(self.counts(), active(self.villain_deck))
+        self.assertIn(foe, self.villain_deck._stunned_foes)
+        foe.play_turn(self.game)
+        self.assertFalse(foe._stunned)
+        self.assertEqual(self.counts(), active(self.villain_deck))
+        self.assertEqual(self.villain_deck._stunned_foes, set())
+
+    def test_counts_follow_defeat_and_reveal(self):
+        """Defeated foes leave the counts, stunned or not, and revealed ones join them."""
+        first, second = self.villain_deck.current[:2]
+        first.stun(self.game)
+        self.villain_deck._defeated(first)
+        self.villain_deck._defeated(second)
+        self.assertEqual(self.villain_deck._stunned_foes, set())
+        self.assertEqual(self.villain_deck.count_active(second.name), active(self.villain_deck).get(second.name, 0))
+        self.villain_deck.reveal(self.game)
+        self.assertEqual(self.counts(), active(self.villain_deck))
+        self.assertEqual(self.villain_deck.count_active("Nobody"), 0)
+
+    def test_decode_recounts(self):
+        """Decoding a board rebuilds its counts."""
+        data = encoding.encode(self.game)
+        foe = self.villain_deck.current[0]
+        foe.stun(self.game)
+        encoding.decode(data, self.game)
+        self.assertEqual(self.counts(), active(self.villain_deck))
+        self.assertEqual(self.villain_deck._stunned_foes, set())
+
+    def test_voldemort_vulnerable_once_board_clears(self):
+        """Voldemort is only open to attack once every villain is gone."""
+        villain_deck = self.villain_deck
+        self.assertFalse(villain_deck.voldemort_vulnerable(self.game))
+        villain_deck._deck.clear()
+        for foe in list(villain_deck.current):
+            self.assertFalse(villain_deck.voldemort_vulnerable(self.game))
+            villain_deck._defeated(foe)
+        self.assertTrue(villain_deck.voldemort_vulnerable(self.game))
+
+    def test_voldemort_waits_for_encounters(self):
+        """With encounters, Voldemort becomes vulnerable as soon as the last one is complete."""
+        g = new_game("monster_box_one", seed=3)
+        villain_deck = g.villain_deck
+        villain_deck._deck.clear()
+        for foe in list(villain_deck.current):
+            villain_deck._defeated(foe)
+        self.assertFalse(villain_deck.voldemort_vulnerable(g))
+        g.encounters._deck.clear()
+        g.encounters._current.completed = True
+        self.assertTrue(villain_deck.voldemort_vulnerable(g))
+
+
+class TestLegalChoices(unittest.TestCase):
+    """Test VillainDeck's cached damage and influence choices."""
+
+    def setUp(self):
+        self.game = new_game("game_five", seed=3)
+        self.villain_deck = self.game.villain_deck
+
+    def fresh(self):
+        deck = self.villain_deck
+        return ([key for key in deck.choices if deck[key].can_take_damage(self.game)],
+                [key for key in deck.choices if deck[key].can_take_influence(self.game)])
+
+    def test_kept_until_something_changes(self):
+        """Choices are worked out once, then again after damage or the end of the turn."""
+        deck = self.villain_deck
+        self.assertEqual((deck.damage_choices(self.game), deck.influence_choices(self.game)), self.fresh())
+        self.assertIsNotNone(deck._legal)
+        foe = deck.current[0]
+        foe.limit_damage_per_turn(self.game, 1)
+        foe.add_damage(self.game)
+        self.assertNotIn('0', deck.damage_choices(self.game))
+        foe.end_turn(self.game)
+        self.assertIn('0', deck.damage_choices(self.game))
+        self.assertTrue(deck.can_assign_damage(self.game))
+
+    def test_setters_clear_cache(self):
+        """Cards changing what foes can take go through setters that clear the cached choices."""
+        deck = self.villain_deck
+        foe = deck.current[0]
+        self.assertIn('0', deck.damage_choices(self.game))
+        foe.set_can_take_damage(self.game, False)
+        self.assertNotIn('0', deck.damage_choices(self.game))
+        foe.set_can_take_damage(self.game, True)
+        self.assertIn('0', deck.damage_choices(self.game))
+        foe._took_influence = foe._max_influence_per_turn
+        deck._legality_changed()
+        self.assertNotIn('0', deck.influence_choices(self.game))
+        foe.allow_extra_influence(self.game)
+        self.assertEqual(deck.influence_choices(self.game), self.fresh()[1])
+
+    def test_not_kept_while_voldemort_waits_on_encounters(self):
+        """Voldemort becomes a choice as soon as the last encounter is complete."""
+        g = new_game("monster_box_one", seed=3)
+        villain_deck = g.villain_deck
+        villain_deck._deck.clear()
+        for foe in list(villain_deck.current):
+            villain_deck._defeated(foe)
+        self.assertEqual(villain_deck.damage_choices(g), [])
+        self.assertIsNone(villain_deck._legal)
+        g.encounters._deck.clear()
+        g.encounters._current.completed = True
+        self.assertEqual(villain_deck.damage_choices(g), ['v'])
+
+
+if __name__ == '__main__':
+    unittest.main()
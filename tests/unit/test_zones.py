@@ -0,0 +1,112 @@
+"""
+Test heroes' card zones and the counts they keep.
+"""
+
+import unittest
+import sys
+import os
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+import random
+
+import heroes
+import hogwarts
+import proficiencies
+import state
+from heroes.base import Zone
+from tests.unit.fakes import FakeGame
+
+
+def card(name):
+    return hogwarts.CARDS_BY_NAME[name]()
+
+
+def counts(zone):
+    """What a zone's counts should be, worked out the slow way."""
+    names = {}
+    for c in zone:
+        names[c.name] = names.get(c.name, 0) + 1
+    return (names, sum(1 for c in zone if c.is_ally()), sum(1 for c in zone if c.is_item()),
+            sum(1 for c in zone if c.is_spell()))
+
+
+def counted(zone):
+    """What a zone's counts are."""
+    return ({name: zone.count_named(name) for name in {c.name for c in zone}},
+            zone.count_allies(), zone.count_items(), zone.count_spells())
+
+
+class TestZone(unittest.TestCase):
+    """Test Zone's counts through the list methods."""
+
+    def setUp(self):
+        self.zone = Zone([card("Lumos"), card("Lumos"), card("Wingardium Leviosa"), card("Buckbeak")])
+
+    def test_counts_on_creation(self):
+        """A new zone counts what it starts with."""
+        self.assertEqual(self.zone.count_named("Lumos"), 2)
+        self.assertEqual(self.zone.count_named("Lumos", "Buckbeak", "Stupefy"), 3)
+        self.assertEqual(self.zone.count_spells(), 3)
+        self.assertEqual(self.zone.count_allies(), 1)
+        self.assertEqual(self.zone.count_items(), 0)
+
+    def test_counts_follow_list_methods(self):
+        """Every way of putting cards in or taking them out keeps the counts right."""
+        zone = self.zone
+        zone.append(card("Butterbeer"))
+        zone.pop(0)
+        zone.insert(1, card("Stupefy"))
+        zone.remove(zone[0])
+        zone += [card("Buckbeak"), hogwarts.Detention()]
+        zone[0] = card("Incendio")
+        zone[1:3] = [card("Reparo")]
+        del zone[-1]
+        self.assertEqual(counted(zone), counts(zone))
+        zone.clear()
+        self.assertEqual(counted(zone), ({}, 0, 0, 0))
+
+    def test_shuffle_keeps_cards(self):
+        """Shuffling reorders like rng.shuffle on a list, leaving the counts alone."""
+        cards = list(self.zone)
+        random.Random(3).shuffle(cards)
+        self.zone.shuffle(random.Random(3))
+        self.assertEqual(list(self.zone), cards)
+        self.assertEqual(counted(self.zone), counts(self.zone))
+
+
+class TestHeroZones(unittest.TestCase):
+    """Test zones on real heroes."""
+
+    def setUp(self):
+        self.hero = heroes.HEROES['Harry'](1, proficiencies.NullProficiency())
+        self.game = FakeGame(heroes=[self.hero])
+
+    def test_assigned_lists_become_zones(self):
+        """Assigning a plain list to a zone makes a Zone of it."""
+        self.hero._hand = [card("Lumos")]
+        self.assertIsInstance(self.hero._hand, Zone)
+        self.assertEqual(self.hero._hand.count_spells(), 1)
+
+    def test_counts_follow_play(self):
+        """Drawing, playing and ending the turn keep every zone's counts right."""
+        self.hero.draw(self.game, 5)
+        self.hero.play_card(self.game, 0)
+        self.hero.end_turn(self.game)
+        for zone in (self.hero._deck, self.hero._hand, self.hero._play_area, self.hero._discard):
+            self.assertEqual(counted(zone), counts(zone))
+
+    def test_restore_keeps_counts(self):
+        """Restoring a snapshot puts the counts back along with the cards."""
+        self.hero.draw(self.game, 5)
+        snap = state.snapshot(self.hero)
+        hand = list(self.hero._hand)
+        self.hero.discard(self.game, 0)
+        state.restore(snap)
+        self.assertEqual(list(self.hero._hand), hand)
+        self.assertEqual(counted(self.hero._hand), counts(self.hero._hand))
+
+
+if __name__ == '__main__':
+    unittest.main()
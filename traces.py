@@ -0,0 +1,118 @@
+import gzip
+import json
+
+import decisions
+
+# Bump when the trace layout changes in a way old readers can't handle
+TRACE_VERSION = 1
+
+
+class TraceExhausted(Exception):
+    pass
+
+
+class Trace(object):
+    """Everything needed to play a game again: how it was set up and every answer given."""
+
+    def __init__(self, config, hero_specs, seed, answers, max_turns=None, result=None, error=None):
+        self.config = config
+        self.hero_specs = hero_specs
+        self.seed = seed
+        # Games given up on after this many turns count as timeouts
+        self.max_turns = max_turns
+        self.answers = answers
+        # None if the game never finished (killed, or still being played)
+        self.result = result
+        self.error = error
+
+
+def _open(path, mode):
+    # Gzipped traces are about a tenth the size, for keeping thousands around
+    if str(path).endswith('.gz'):
+        return gzip.open(path, mode + 't', encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+class TraceWriter(object):
+    """Streams a game's trace to a JSONL file (gzipped if the name ends in .gz).
+
+    The first line is the setup, then one line per answer, then the result.
+    With flush, every line is written out straight away, so even a game that
+    dies without reaching finish() leaves a trace that replays up to the end.
+    """
+
+    def __init__(self, path, config, hero_specs, seed, max_turns=None, flush=True):
+        self._file = _open(path, 'w')
+        self._flush = flush
+        self._write({
+            'version': TRACE_VERSION,
+            'config': config,
+            'heroes': [[hero_name, proficiency_name] for hero_name, proficiency_name in hero_specs],
+            'seed': seed,
+            'max_turns': max_turns,
+        })
+
+    def answer(self, answer):
+        self._write(answer)
+
+    def finish(self, result, error=None):
+        line = {'result': result}
+        if error is not None:
+            line['error'] = error
+        self._write(line)
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _write(self, line):
+        self._file.write(json.dumps(line, ensure_ascii=False, separators=(',', ':')))
+        self._file.write('\n')
+        if self._flush:
+            self._file.flush()
+
+
+def load(path):
+    with _open(path, 'r') as f:
+        header = json.loads(f.readline())
+        if header.get('version') != TRACE_VERSION:
+            raise ValueError(f"{path} is not a version {TRACE_VERSION} trace")
+        trace = Trace(header['config'], [tuple(spec) for spec in header['heroes']], header['seed'], [], header['max_turns'])
+        for line in f:
+            entry = json.loads(line)
+            if isinstance(entry, str):
+                trace.answers.append(entry)
+            else:
+                trace.result = entry['result']
+                trace.error = entry.get('error')
+    return trace
+
+
+class RecordingProvider(decisions.DecisionProvider):
+    """Passes decisions through to another provider, writing down every answer."""
+
+    def __init__(self, provider, writer):
+        self._provider = provider
+        self._writer = writer
+
+    def start_turn(self, game):
+        self._provider.start_turn(game)
+
+    def choose(self, game, decision):
+        answer = self._provider.choose(game, decision)
+        self._writer.answer(answer)
+        return answer
+
+
+class ReplayProvider(decisions.ScriptedProvider):
+    """Answers from a trace, and says so when the trace runs out."""
+
+    def choose(self, game, decision):
+        if self._next >= len(self._answers):
+            raise TraceExhausted()
+        return super().choose(game, decision)
@@ -0,0 +1,162 @@
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+import configs
+import decisions
+import encoding
+import engine
+
+
+# Card IDs are shared with the compact state encoding
+CARD_NAMES = encoding.CARD_NAMES
+CARD_IDS = encoding.CARD_IDS
+# Cards nobody registered (added by some effect) all count here
+OTHER_CARD = len(CARD_NAMES)
+NUM_CARD_IDS = OTHER_CARD + 1
+
+MAX_HEROES = 4
+# Up to three villains or creatures out, plus Voldemort
+MAX_FOES = 4
+MARKET_SLOTS = 6
+
+DECISION_FIELDS = 4
+HERO_FIELDS = 7 + NUM_CARD_IDS
+FOE_FIELDS = 9
+LOCATION_FIELDS = 4
+MARKET_FIELDS = 3
+OBSERVATION_SIZE = (DECISION_FIELDS + MAX_HEROES * HERO_FIELDS + MAX_FOES * FOE_FIELDS
+                    + LOCATION_FIELDS + MARKET_SLOTS * MARKET_FIELDS)
+
+
+def card_id(card):
+    return CARD_IDS.get(card.name, OTHER_CARD)
+
+
+def legal_actions(decision):
+    """The answers an agent picks from by index: everything legal except quitting."""
+    if decision.kind == decisions.DecisionKind.ACTION:
+        return [choice for choice in decision.legal if choice != 'q']
+    return decision.legal
+
+
+def observe(game, decision):
+    """Flat, fixed-size list of ints describing the game at a decision (OBSERVATION_SIZE long)."""
+    all_heroes = game.heroes._heroes
+    obs = [decision.kind.value, game.heroes._current,
+           all_heroes.index(decision.hero) if decision.hero in all_heroes else -1,
+           len(legal_actions(decision))]
+
+    for i in range(MAX_HEROES):
+        if i >= len(all_heroes):
+            obs.extend([0] * HERO_FIELDS)
+            continue
+        hero = all_heroes[i]
+        obs.extend([1, hero._hearts, hero._max_hearts, hero._damage_tokens, hero._influence_tokens,
+                    len(hero._deck), len(hero._discard)])
+        hand = [0] * NUM_CARD_IDS
+        for card in hero._hand:
+            hand[card_id(card)] += 1
+        obs.extend(hand)
+
+    villain_deck = game.villain_deck
+    foes = list(villain_deck.current)
+    if villain_deck.voldemort_active():
+        foes.append(villain_deck._voldemort)
+    for i in range(MAX_FOES):
+        if i >= len(foes):
+            obs.extend([0] * FOE_FIELDS)
+            continue
+        foe = foes[i]
+        obs.extend([1, foe._damage, foe._hearts, foe._influence, foe._cost, int(foe.is_villain), int(foe.is_creature),
+                    int(foe.can_take_damage(game)), int(foe.can_take_influence(game))])
+
+    locations = game.locations
+    location = locations.current
+    obs.extend([locations._current, len(locations._locations), location._control, location._control_max])
+
+    market = game.hogwarts_deck._market
+    slots = list(market.values())
+    for i in range(MARKET_SLOTS):
+        if i >= len(slots):
+            obs.extend([0] * MARKET_FIELDS)
+            continue
+        # Card IDs are shifted by one so an empty slot is all zeros
+        obs.extend([card_id(slots[i][0]) + 1, len(slots[i]), slots[i][0].cost])
+    return obs
+
+
+class VectorEnv(object):
+    """N headless games stepped together, Gym style.
+
+    Actions are indexes into legal_actions(decision) for each game's pending
+    decision; infos carry those lists. Games that end are started again
+    straight away on the next seed, with the reward and outcome on that step.
+    Observations are an int16 numpy array if numpy is installed, otherwise a
+    list of lists. Each game is an engine.SteppedGame, so holds an OS thread
+    until it ends or the env is closed.
+    """
+
+    def __init__(self, config, hero_specs, num_games, max_turns=200):
+        self._config = configs.definition(config)
+        self._hero_specs = hero_specs
+        self.num_games = num_games
+        self._max_turns = max_turns
+        self._games = []
+        self._next_seed = 0
+
+    def reset(self, seeds=None):
+        if seeds is None:
+            seeds = range(self._next_seed, self._next_seed + self.num_games)
+        if len(seeds) != self.num_games:
+            raise ValueError(f"Programmer Error! Need {self.num_games} seeds, got {len(seeds)}")
+        self.close()
+        self._next_seed = max(seeds) + 1
+        self._games = [self._start(seed) for seed in seeds]
+        return self._observations(), [self._info(stepped) for stepped in self._games]
+
+    def step(self, actions):
+        if len(actions) != self.num_games:
+            raise ValueError(f"Programmer Error! Need {self.num_games} actions, got {len(actions)}")
+        rewards = [0.0] * self.num_games
+        terminated = [False] * self.num_games
+        truncated = [False] * self.num_games
+        infos = []
+        for i, (stepped, action) in enumerate(zip(self._games, actions)):
+            choices = legal_actions(stepped.decision)
+            if not 0 <= action < len(choices):
+                raise ValueError(f"Programmer Error! Action {action} out of range for {stepped.decision}")
+            stepped.send(choices[action])
+            if not stepped.done:
+                infos.append(self._info(stepped))
+                continue
+            outcome = stepped.outcome
+            rewards[i] = {'win': 1.0, 'loss': -1.0}.get(outcome, 0.0)
+            terminated[i] = outcome != 'timeout'
+            truncated[i] = outcome == 'timeout'
+            self._games[i] = self._start(self._next_seed)
+            self._next_seed += 1
+            info = self._info(self._games[i])
+            info['outcome'] = outcome
+            if stepped.error is not None:
+                info['error'] = repr(stepped.error)
+            infos.append(info)
+        return self._observations(), rewards, terminated, truncated, infos
+
+    def close(self):
+        for stepped in self._games:
+            stepped.close()
+        self._games = []
+
+    def _start(self, seed):
+        return engine.SteppedGame(self._config, self._hero_specs, seed=seed, max_turns=self._max_turns)
+
+    def _info(self, stepped):
+        return {'kind': stepped.decision.kind, 'legal': legal_actions(stepped.decision)}
+
+    def _observations(self):
+        rows = [observe(stepped.game, stepped.decision) for stepped in self._games]
+        if numpy is None:
+            return rows
+        return numpy.asarray(rows, dtype=numpy.int16)
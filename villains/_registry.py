@@ -0,0 +1,43 @@
+# Generated by registry.py from the modules in this package; don't edit by hand.
+# After adding, renaming or removing a card, run: python3 registry.py
+
+VILLAINS_BY_NAME = {
+    "Aragog": "aragog",
+    "Barty Crouch Jr.": "barty_crouch_jr",
+    "Basilisk": "basilisk",
+    "Bellatrix Lestrange": "bellatrix_lestrange",
+    "Boggart": "boggart",
+    "Centaur": "centaur",
+    "Chinese Fireball": "chinese_fireball",
+    "Common Welsh Green": "common_welsh_green",
+    "Cornish Pixies": "cornish_pixies",
+    "Crabbe & Goyle": "crabbe_and_goyle",
+    "Death Eater": "death_eater",
+    "Death Eater 2": "death_eater",
+    "Dementor": "dementor",
+    "Dolores Umbridge": "dolores_umbridge",
+    "Draco Malfoy": "draco_malfoy",
+    "Fenrir Greyback": "fenrir_greyback",
+    "Fluffy": "fluffy",
+    "Grawp": "grawp",
+    "Grindylow": "grindylow",
+    "Hungarian Horntail": "hungarian_horntail",
+    "Lucius Malfoy": "lucius_malfoy",
+    "Mermaid": "mermaid",
+    "Norbert": "norbert",
+    "Peter Pettigrew": "peter_pettigrew",
+    "Quirinus Quirrell": "quirinus_quirrell",
+    "Scabbers": "scabbers",
+    "Swedish Short-Snout": "swedish_short_snout",
+    "Tom Riddle": "tom_riddle",
+    "Troll": "troll",
+    "Ukrainian Ironbelly": "ukranian_ironbelly",
+    "Werewolf": "werewolf",
+}
+
+VOLDEMORTS_BY_NAME = {
+    "Game Five Voldemort": "game_five_voldemort",
+    "Game Seven Voldemort": "game_seven_voldemort",
+    "Game Six Voldemort": "game_six_voldemort",
+    "Monster Box Four Voldemort": "monster_box_four_voldemort",
+}
@@ -3,6 +3,8 @@ import constants
 
 
 class Aragog(Creature):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
                 "Aragog",
@@ -11,7 +13,7 @@ class Aragog(Creature):
                 hearts=8)
 
     def _effect(self, game):
-        total = sum(1 for card in game.villain_deck.current if card.is_creature)
+        total = len(game.villain_deck.all_creatures)
         game.log(f"Aragog: {total} Creatures in play")
         game.heroes.active_hero.remove_hearts(game, total)
 
@@ -3,6 +3,8 @@ import constants
 
 
 class BartyCrouchJr(Villain):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
                 "Barty Crouch Jr.",
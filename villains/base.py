@@ -1,21 +1,43 @@
 import curses
-import random
 
 import constants
+import event_log
+import registry
+import state
+
+from ._registry import VILLAINS_BY_NAME as _VILLAIN_MODULES, VOLDEMORTS_BY_NAME as _VOLDEMORT_MODULES
 
 class VillainDeck(object):
-    def __init__(self, window, config, encounters):
+    def __init__(self, window, config, encounters, rng):
         self._window = window
-        self._init_window()
-        self._pad = curses.newpad(100, 100)
-        self._deck = build_deck(config, encounters)
+        if self._window is not None:
+            self._init_window()
+            self._pad = curses.newpad(100, 100)
+        # What the panel last drew, to skip redrawing when nothing changed
+        self._displayed = None
+        self._deck = build_deck(config, encounters, rng)
         self._discard = []
         self._max = config['villains_revealed']
         self._voldemort = VOLDEMORTS_BY_NAME[config['voldemort']]() if config['voldemort'] else None
         self._rewards_allowed = True
 
-        random.shuffle(self._deck)
+        rng.shuffle(self._deck)
         self.current = []
+        # Views of who's out, built when first asked for after a change (see
+        # _membership_changed). Immutable, so handing the same one out is safe.
+        self._all = None
+        self._all_villains = None
+        self._all_creatures = None
+        # Whether Voldemort can be hurt, worked out when first asked for after
+        # a change (see voldemort_vulnerable)
+        self._vulnerable = None
+        # Foes out by name, not counting stunned ones, and the stunned foes.
+        # Kept up to date by reveal, _stunned_foe, _recovered and _defeated.
+        self._active = {}
+        self._stunned_foes = set()
+        # Choice keys that can take damage and influence, worked out when first
+        # asked for after a change (see _legality_changed)
+        self._legal = None
 
     def _init_window(self):
         self._window.box()
@@ -29,11 +51,18 @@ class VillainDeck(object):
         self._pad_end_col = self._pad_start_col + end[1] - 3
 
     def display_state(self, game, resize=False, size=None):
+        if self._window is None:
+            return
         if resize:
             self._window.resize(*size)
             self._window.clear()
             self._init_window()
-        self._window.clear()
+        key = (len(self._deck), self._voldemort is not None, self.voldemort_vulnerable(game),
+               tuple(state.fingerprint(foe) for foe in self.all))
+        if not resize and key == self._displayed:
+            return
+        self._displayed = key
+        self._window.erase()
         self._window.box()
         left_str = f"({len(self._deck)}"
         if self._voldemort is not None:
@@ -41,7 +70,7 @@ class VillainDeck(object):
         self._window.addstr(0, 1, f"Villains {left_str} left)")
         self._window.noutrefresh()
 
-        self._pad.clear()
+        self._pad.erase()
         for i, villain in enumerate(self.current):
             villain.display_state(self._pad, i)
         if self.voldemort_active():
@@ -57,19 +86,22 @@ class VillainDeck(object):
         self._voldemort.display_state(self._pad, 'v')
 
     def play_turn(self, game):
-        game.log("-----Villain phase-----")
+        game.log("-----Villain phase-----", event_log.PHASE)
         self.all.play_turn(game)
 
     def reveal(self, game):
         self.all.end_turn(game)
         voldemort_was_active = self.voldemort_active()
         while len(self.current) < self._max and len(self._deck) > 0:
-            death_eaters = sum(1 for v in game.villain_deck.current if v.name == "Death Eater" and not v._stunned)
-            welsh_greens = sum(1 for v in game.villain_deck.current if v.name == "Common Welsh Green" and not v._stunned)
+            death_eaters = self.count_active("Death Eater")
+            welsh_greens = self.count_active("Common Welsh Green")
             villain = self._deck.pop()
             self.current.append(villain)
-            game.log(f"Revealed {villain.type_name}: {villain.name}")
-            villain._on_reveal(game)
+            self._active[villain.name] = self._active.get(villain.name, 0) + 1
+            self._membership_changed()
+            game.log("Revealed {type}: {villain}", event_log.VILLAIN, type=villain.type_name, villain=villain.name)
+            with game.effect_source(villain):
+                villain._on_reveal(game)
             if death_eaters > 0 and villain.is_villain:
                 game.log(f"Death Eater (x{death_eaters}): Villain revealed, ALL heroes lose {death_eaters}{constants.HEART}")
                 game.heroes.all_heroes.remove_hearts(game, death_eaters)
@@ -78,16 +110,79 @@ class VillainDeck(object):
                 game.heroes.all_heroes.remove_hearts(game, 2)
         if self.voldemort_active() and not voldemort_was_active:
             game.log("Voldemort revealed!")
-            self._voldemort._on_reveal(game)
+            with game.effect_source(self._voldemort):
+                self._voldemort._on_reveal(game)
             if death_eaters > 0:
                 game.log(f"Death Eater (x{death_eaters}): Villain revealed, ALL heroes lose {death_eaters}{constants.HEART}")
                 game.heroes.all_heroes.remove_hearts(game, death_eaters)
 
+    def _membership_changed(self):
+        self._all = None
+        self._all_villains = None
+        self._all_creatures = None
+        self._vulnerable = None
+        self._legal = None
+
+    def _legality_changed(self):
+        self._legal = None
+
+    def _recount(self):
+        """Rebuild the board's counts after it was set up some other way (see encoding.decode)."""
+        self._active = {}
+        self._stunned_foes = set()
+        for foe in self.current:
+            if foe._stunned:
+                self._stunned_foes.add(foe)
+            else:
+                self._active[foe.name] = self._active.get(foe.name, 0) + 1
+        if self._voldemort is not None and self._voldemort._stunned:
+            self._stunned_foes.add(self._voldemort)
+        self._membership_changed()
+
+    def _stunned_foe(self, foe):
+        if foe in self._stunned_foes:
+            return
+        self._stunned_foes.add(foe)
+        if foe is not self._voldemort:
+            self._active[foe.name] -= 1
+        self._legal = None
+
+    def _recovered(self, foe):
+        self._stunned_foes.discard(foe)
+        if foe is not self._voldemort:
+            self._active[foe.name] += 1
+        self._legal = None
+
+    def _defeated(self, foe):
+        if foe == self._voldemort:
+            self._voldemort = None
+            self._stunned_foes.discard(foe)
+        else:
+            self.current.remove(foe)
+            if foe in self._stunned_foes:
+                self._stunned_foes.remove(foe)
+            else:
+                self._active[foe.name] -= 1
+        self._discard.append(foe)
+        self._membership_changed()
+
+    def count_active(self, name):
+        """How many foes called name are out and not stunned."""
+        return self._active.get(name, 0)
+
     def voldemort_active(self):
         return self._voldemort is not None and len(self._deck) == 0
 
     def voldemort_vulnerable(self, game):
-        return self.voldemort_active() and len(self.current) == 0 and (game.encounters is None or game.encounters.all_complete)
+        if self._vulnerable is None:
+            if not self.voldemort_active() or len(self.current) > 0:
+                self._vulnerable = False
+            elif game.encounters is None or game.encounters.all_complete:
+                # Encounters only ever get completed, so this holds until the board changes
+                self._vulnerable = True
+            else:
+                return False
+        return self._vulnerable
 
     def disallow_rewards(self):
         self._rewards_allowed = False
@@ -109,6 +204,30 @@ class VillainDeck(object):
             choices.append('v')
         return choices
 
+    def damage_choices(self, game):
+        return list(self._legal_choices(game)[0])
+
+    def influence_choices(self, game):
+        return list(self._legal_choices(game)[1])
+
+    def can_assign_damage(self, game):
+        return len(self._legal_choices(game)[0]) > 0
+
+    def can_assign_influence(self, game):
+        return len(self._legal_choices(game)[1]) > 0
+
+    def _legal_choices(self, game):
+        if self._legal is not None:
+            return self._legal
+        choices = self.choices
+        legal = (tuple(key for key in choices if self[key].can_take_damage(game)),
+                 tuple(key for key in choices if self[key].can_take_influence(game)))
+        # Encounters get completed all over the place, so while Voldemort is
+        # waiting on one the answer can't be kept
+        if not self.voldemort_active() or self._vulnerable is not None:
+            self._legal = legal
+        return legal
+
     @property
     def villain_choices(self):
         choices = [str(i) for i in range(len(self.current)) if self.current[i].is_villain]
@@ -133,32 +252,47 @@ class VillainDeck(object):
 
     @property
     def all(self):
-        if self.voldemort_active():
-            return _VillainList(*self.current, self._voldemort)
-        return _VillainList(*self.current)
+        if self._all is None:
+            if self.voldemort_active():
+                self._all = _VillainList(*self.current, self._voldemort)
+            else:
+                self._all = _VillainList(*self.current)
+        return self._all
 
     @property
     def all_villains(self):
-        villains = filter(lambda foe: foe.is_villain, self.current)
-        if self.voldemort_active():
-            return _VillainList(*villains, self._voldemort)
-        return _VillainList(*villains)
+        if self._all_villains is None:
+            self._all_villains = _VillainList(*[foe for foe in self.all if foe.is_villain])
+        return self._all_villains
 
     @property
     def all_creatures(self):
-        creatures = filter(lambda foe: foe.is_creature, self.current)
-        return _VillainList(*creatures)
+        if self._all_creatures is None:
+            self._all_creatures = _VillainList(*[foe for foe in self.current if foe.is_creature])
+        return self._all_creatures
+
 
+class _VillainList(tuple):
+    __slots__ = ()
 
-class _VillainList(list):
-    def __init__(self, *args):
-        super().__init__(args)
+    def __new__(cls, *foes):
+        return super().__new__(cls, foes)
 
-    def __getattr__(self, attr):
-        def f(game, *args, **kwargs):
-            for villain in self:
-                getattr(villain, attr)(game, *args, **kwargs)
-        return f
+    def play_turn(self, game):
+        for foe in self:
+            foe.play_turn(game)
+
+    def end_turn(self, game):
+        for foe in self:
+            foe.end_turn(game)
+
+    def remove_damage(self, game, amount=1):
+        for foe in self:
+            foe.remove_damage(game, amount)
+
+    def remove_influence(self, game, amount=1):
+        for foe in self:
+            foe.remove_influence(game, amount)
 
     def effect(self, game, effect=None):
         if effect is None:
@@ -167,23 +301,30 @@ class _VillainList(list):
             effect(game, villain)
 
 
-def build_deck(config, encounters):
+def build_deck(config, encounters, rng):
     if isinstance(config['villains'], list):
         return [VILLAINS_BY_NAME[name]() for name in config['villains']]
     total_villains = config['villains']
     names = set(encounters.required_villains())
     available = list(VILLAINS_BY_NAME.keys())
     while len(names) < total_villains:
-        names.add(random.choice(available))
-    return [VILLAINS_BY_NAME[name]() for name in names]
+        names.add(rng.choice(available))
+    # Sort so the deck doesn't depend on string hashing, which varies per process
+    return [VILLAINS_BY_NAME[name]() for name in sorted(names)]
 
 
-VILLAINS_BY_NAME = {}
+VILLAINS_BY_NAME = registry.Registry(__package__, _VILLAIN_MODULES)
 
-VOLDEMORTS_BY_NAME = {}
+VOLDEMORTS_BY_NAME = registry.Registry(__package__, _VOLDEMORT_MODULES)
 
 
 class _Foe(object):
+    __slots__ = (
+        'name', 'unique_name', 'description', 'reward_desc', '_hearts', '_cost', '_damage', '_can_take_damage',
+        '_took_damage', '_max_damage_per_turn', '_influence', '_took_influence', '_max_influence_per_turn',
+        '_stunned', '_stunned_by'
+    )
+
     def __init__(self, name, description, reward_desc, hearts=0, cost=0):
         self.name = name
         self.unique_name = name
@@ -221,10 +362,12 @@ class _Foe(object):
                 game.log(f"{self.name} was stunned by {self._stunned_by.name}, so recovers")
                 self._stunned = False
                 self._stunned_by = None
+                game.villain_deck._recovered(self)
                 self._on_recover_from_stun(game)
             return
-        game.log(f"Villain: {self}")
-        self._effect(game)
+        game.log("Villain: {villain}", event_log.VILLAIN, villain=self)
+        with game.effect_source(self):
+            self._effect(game)
 
     def _on_reveal(self, game):
         pass
@@ -244,6 +387,7 @@ class _Foe(object):
         self._max_damage_per_turn = -1
         self._took_influence = 0
         self._max_influence_per_turn = 1
+        game.villain_deck._legality_changed()
 
     def __str__(self):
         return f"{self.name}: {self.description}"
@@ -282,6 +426,7 @@ class _Foe(object):
             raise Exception(f"Prgammer Error! {self.name} cannot take damage!")
         self._took_damage += 1
         self._damage += 1
+        game.villain_deck._legality_changed()
         if self._defeated:
             self._apply_defeat(game)
             return True
@@ -291,6 +436,15 @@ class _Foe(object):
         self._damage -= amount
         if self._damage < 0:
             self._damage = 0
+        game.villain_deck._legality_changed()
+
+    def set_can_take_damage(self, game, allowed):
+        self._can_take_damage = allowed
+        game.villain_deck._legality_changed()
+
+    def limit_damage_per_turn(self, game, amount):
+        self._max_damage_per_turn = amount
+        game.villain_deck._legality_changed()
 
     @property
     def took_influence(self):
@@ -314,6 +468,7 @@ class _Foe(object):
             raise Exception(f"Programmer Error! {self.name} cannot take more influence!")
         self._took_influence += 1
         self._influence += 1
+        game.villain_deck._legality_changed()
         if self._defeated:
             self._apply_defeat(game)
             return True
@@ -323,10 +478,16 @@ class _Foe(object):
         self._influence -= amount
         if self._influence < 0:
             self._influence = 0
+        game.villain_deck._legality_changed()
+
+    def allow_extra_influence(self, game, amount=1):
+        self._max_influence_per_turn += amount
+        game.villain_deck._legality_changed()
 
     def stun(self, game):
         self._stunned = True
         self._stunned_by = game.heroes.active_hero
+        game.villain_deck._stunned_foe(self)
         self._on_stun(game)
 
     @property
@@ -339,24 +500,23 @@ class _Foe(object):
             self.reward(game)
         else:
             game.log(f"{self.name} defeated, but rewards are not allowed!")
-        if self == game.villain_deck._voldemort:
-            game.villain_deck._voldemort = None
-        else:
-            game.villain_deck.current.remove(self)
-        game.villain_deck._discard.append(self)
+        game.villain_deck._defeated(self)
 
     def remove_callbacks(self, game):
         pass
 
     def reward(self, game):
         game.log(f"{self.name} defeated! {self.reward_desc}")
-        self._reward(game)
+        with game.effect_source(self):
+            self._reward(game)
 
     def _reward(self, game):
         raise ValueError(f"Programmer Error! Forgot to implement reward for {self.name}")
 
 
 class Villain(_Foe):
+    __slots__ = ()
+
     @property
     def is_villain(self):
         return True
@@ -367,6 +527,8 @@ class Villain(_Foe):
 
 
 class Creature(_Foe):
+    __slots__ = ()
+
     @property
     def is_creature(self):
         return True
@@ -377,6 +539,8 @@ class Creature(_Foe):
 
 
 class VillainCreature(_Foe):
+    __slots__ = ()
+
     @property
     def is_villain(self):
         return True
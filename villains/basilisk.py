@@ -3,6 +3,8 @@ import constants
 
 
 class Basilisk(VillainCreature):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
                 "Basilisk",
@@ -3,6 +3,8 @@ import constants
 
 
 class BellatrixLestrange(Villain):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
                 "Bellatrix Lestrange",
@@ -28,7 +30,7 @@ class BellatrixLestrange(Villain):
         if choice == 'c':
             return
         item = items[choice]
-        hero._discard.remove(item)
+        hero.take_from_discard(choice)
         hero._hand.append(item)
 
 VILLAINS_BY_NAME["Bellatrix Lestrange"] = BellatrixLestrange
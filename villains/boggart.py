@@ -1,10 +1,10 @@
-import random
-
 from . import VILLAINS_BY_NAME, Creature
 import constants
 
 
 class Boggart(Creature):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
                 "Boggart",
@@ -14,9 +14,9 @@ class Boggart(Creature):
 
     def _effect(self, game):
         faces = [constants.HEART, constants.HEART + constants.HEART, constants.CARD, constants.CARD + constants.CARD, constants.DAMAGE, constants.CONTROL]
-        die_result = random.choice(faces)
+        die_result = game.rng.choice(faces)
         if game.heroes.active_hero.can_reroll_die(house_die=False) and game.input(f"Rolled {die_result}, (a)ccept or (r)eroll? ", "ar") == "r":
-            die_result = random.choice(faces)
+            die_result = game.rng.choice(faces)
         if die_result == constants.HEART:
             game.log(f"Rolled {constants.HEART}, ALL Creatures heal 1{constants.DAMAGE} and/or {constants.INFLUENCE}")
             game.villain_deck.all_creatures.remove_damage(game, 1)
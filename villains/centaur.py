@@ -3,6 +3,8 @@ import constants
 
 
 class Centaur(Creature):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
                 "Centaur",
@@ -12,7 +14,7 @@ class Centaur(Creature):
 
     def _effect(self, game):
         hero = game.heroes.active_hero
-        spells = sum(1 for card in hero._hand if card.is_spell())
+        spells = hero._hand.count_spells()
         if hero.is_stunned:
             game.log(f"{hero.name} is stunned and can't lose {constants.HEART}. Ignoring {self.name}!")
             return
@@ -49,7 +51,7 @@ class Centaur(Creature):
         if choice == 'c':
             return
         card = cards[choice]
-        hero._discard.remove(card)
+        hero.take_from_discard(choice)
         hero._hand.append(card)
 
 VILLAINS_BY_NAME["Centaur"] = Centaur
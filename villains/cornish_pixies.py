@@ -3,6 +3,8 @@ import constants
 
 
 class CornishPixies(Creature):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
                 "Cornish Pixies",
@@ -3,6 +3,8 @@ import constants
 
 
 class CrabbeAndGoyle(Villain):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
                 "Crabbe & Goyle",
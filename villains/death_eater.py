@@ -3,6 +3,8 @@ import constants
 
 
 class DeathEater(Villain):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
                 "Death Eater",
@@ -19,6 +21,8 @@ class DeathEater(Villain):
 
 
 class DeathEater2(DeathEater):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.unique_name = "Death Eater 2"
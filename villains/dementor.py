@@ -3,6 +3,8 @@ import constants
 
 
 class Dementor(VillainCreature):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
                 "Dementy-whatsit",
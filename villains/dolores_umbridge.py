@@ -3,6 +3,8 @@ import constants
 
 
 class DoloresUmbridge(Villain):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
                 "Dolores Umbridge",
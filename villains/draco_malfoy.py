@@ -2,6 +2,8 @@ from . import VILLAINS_BY_NAME, Villain
 import constants
 
 class DracoMalfoy(Villain):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
                 "Draco Malfoy",
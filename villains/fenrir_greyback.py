@@ -3,6 +3,8 @@ import constants
 
 
 class FenrirGreyback(Villain):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
                 "Fenrir Greyback",
@@ -3,6 +3,8 @@ import constants
 
 
 class Fluffy(Creature):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
                 "Fluffy",
@@ -12,7 +14,7 @@ class Fluffy(Creature):
 
     def _effect(self, game):
         hero = game.heroes.active_hero
-        items = sum(1 for card in hero._hand if card.is_item())
+        items = hero._hand.count_items()
         if items == 0:
             game.log(f"{hero.name} has no Items in hand, safe!")
             return
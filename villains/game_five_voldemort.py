@@ -3,6 +3,8 @@ import constants
 
 
 class GameFiveVoldemort(Villain):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
                 "Lord Voldemort",
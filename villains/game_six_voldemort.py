@@ -1,10 +1,10 @@
-import random
-
 from . import VOLDEMORTS_BY_NAME, Villain
 import constants
 
 
 class GameSixVoldemort(Villain):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
                 "Lord Voldemort",
@@ -14,9 +14,9 @@ class GameSixVoldemort(Villain):
 
     def _effect(self, game):
         faces = [constants.DAMAGE, constants.DAMAGE, constants.DAMAGE, constants.INFLUENCE, constants.HEART, constants.CARD]
-        die_result = random.choice(faces)
+        die_result = game.rng.choice(faces)
         if game.heroes.active_hero.can_reroll_die(house_die=True) and game.input(f"Rolled {die_result}, (a)ccept or (r)eroll? ", "ar") == "r":
-            die_result = random.choice(faces)
+            die_result = game.rng.choice(faces)
         if die_result == constants.DAMAGE:
             game.log(f"Rolled {constants.DAMAGE}, ALL heroes lose 1{constants.HEART}")
             game.heroes.all_heroes.remove_hearts(game, 1)
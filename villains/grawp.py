@@ -3,6 +3,8 @@ import constants
 
 
 class Grawp(Creature):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
                 "Grawp",
@@ -3,6 +3,8 @@ import constants
 
 
 class Grindylow(Creature):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
                 "Grindylow",
@@ -12,7 +14,7 @@ class Grindylow(Creature):
 
     def _effect(self, game):
         hero = game.heroes.active_hero
-        allies = sum(1 for card in hero._hand if card.is_ally())
+        allies = hero._hand.count_allies()
         game.log(f"{hero.name} has {allies} Allies in hand")
         if allies >= 2:
             game.locations.add_control(game)
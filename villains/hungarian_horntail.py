@@ -3,6 +3,8 @@ import constants
 
 
 class HungarianHorntail(Creature):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
                 "Hungarian Horntail",
@@ -14,19 +16,19 @@ class HungarianHorntail(Creature):
         for foe in game.villain_deck.current:
             if foe is self:
                 continue
-            foe._can_take_damage = False
+            foe.set_can_take_damage(game, False)
 
     def _on_stun(self, game):
         for foe in game.villain_deck.current:
             if foe is self:
                 continue
-            foe._can_take_damage = True
+            foe.set_can_take_damage(game, True)
 
     def _on_recover_from_stun(self, game):
         for foe in game.villain_deck.current:
             if foe is self:
                 continue
-            foe._can_take_damage = False
+            foe.set_can_take_damage(game, False)
 
     def _reward(self, game):
         game.roll_creature_die()
@@ -3,6 +3,8 @@ import constants
 
 
 class Mermaid(Creature):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
                 "Mermaid",
@@ -40,7 +42,7 @@ class Mermaid(Creature):
         if choice == 'c':
             return
         ally = allies[choice]
-        hero._discard.remove(ally)
+        hero.take_from_discard(choice)
         hero._hand.append(ally)
 
 VILLAINS_BY_NAME["Mermaid"] = Mermaid
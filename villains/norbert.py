@@ -3,6 +3,8 @@ import constants
 
 
 class Norbert(Creature):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
                 "Norbert",
@@ -12,7 +14,7 @@ class Norbert(Creature):
 
     def _effect(self, game):
         hero = game.heroes.active_hero
-        detentions = sum(1 for card in hero._hand if card.name == "Detention!")
+        detentions = hero._hand.count_named("Detention!")
         game.log(f"{hero.name} has {detentions} Detention! in hand")
         hero.remove_hearts(game, 1 + detentions)
 
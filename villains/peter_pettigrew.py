@@ -3,6 +3,8 @@ import constants
 
 
 class PeterPettigrew(Villain):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
                 "Peter Pettigrew",
@@ -36,7 +38,7 @@ class PeterPettigrew(Villain):
         if choice == 'c':
             return
         spell = spells[choice]
-        hero._discard.remove(spell)
+        hero.take_from_discard(choice)
         hero._hand.append(spell)
 
 VILLAINS_BY_NAME["Peter Pettigrew"] = PeterPettigrew
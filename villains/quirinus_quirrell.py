@@ -3,6 +3,8 @@ import constants
 
 
 class QuirinusQuirrell(Villain):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
                 "Quirinus Quirrell",
@@ -3,6 +3,8 @@ import constants
 
 
 class Scabbers(VillainCreature):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
                 "Scabbers",
@@ -36,7 +38,7 @@ class Scabbers(VillainCreature):
         if choice == 'c':
             return
         card = cards[choice]
-        hero._discard.remove(card)
+        hero.take_from_discard(choice)
         hero._hand.append(card)
 
 VILLAINS_BY_NAME["Scabbers"] = Scabbers
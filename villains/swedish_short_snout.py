@@ -1,10 +1,10 @@
-import random
-
 from . import VILLAINS_BY_NAME, Creature
 import constants
 
 
 class SwedishShortSnout(Creature):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
                 "Swedish Short-Snout",
@@ -15,9 +15,9 @@ class SwedishShortSnout(Creature):
     def _effect(self, game):
         faces = [constants.INFLUENCE, constants.HEART, constants.HEART, constants.HEART, constants.CARD, constants.DAMAGE]
         game.log("Rolling Hufflepuff die")
-        die_result = random.choice(faces)
+        die_result = game.rng.choice(faces)
         if game.heroes.active_hero.can_reroll_die(house_die=True) and game.input(f"Rolled {die_result}, (a)ccept or (r)eroll? ", "ar") == "r":
-            die_result = random.choice(faces)
+            die_result = game.rng.choice(faces)
         if die_result == constants.HEART:
             game.log(f"Rolled {constants.HEART}, ALL Creatures heal 1{constants.DAMAGE}")
             game.villain_deck.all_creatures.remove_damage(game, 1)
@@ -3,6 +3,8 @@ import constants
 
 
 class TomRiddle(Villain):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
                 "Tom Riddle",
@@ -12,7 +14,7 @@ class TomRiddle(Villain):
 
     def _effect(self, game):
         hero = game.heroes.active_hero
-        allies = sum(1 for card in hero._hand if card.is_ally())
+        allies = hero._hand.count_allies()
         if allies == 0:
             game.log(f"{hero.name} has no allies in hand, safe!")
             return
@@ -44,7 +46,7 @@ class TomRiddle(Villain):
             hero.add_hearts(game, 2)
             return
         ally = allies[choice]
-        hero._discard.remove(ally)
+        hero.take_from_discard(choice)
         hero._hand.append(ally)
 
 VILLAINS_BY_NAME["Tom Riddle"] = TomRiddle
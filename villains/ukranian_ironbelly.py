@@ -3,6 +3,8 @@ import constants
 
 
 class UkrainianIronbelly(Creature):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
                 "Ukrainian Ironbelly",
@@ -12,8 +14,8 @@ class UkrainianIronbelly(Creature):
 
     def _effect(self, game):
         hero = game.heroes.active_hero
-        allies = sum(1 for card in hero._hand if card.is_ally())
-        items = sum(1 for card in hero._hand if card.is_item())
+        allies = hero._hand.count_allies()
+        items = hero._hand.count_items()
         if hero.is_stunned:
             game.log(f"{hero.name} is stunned and can't lose {constants.HEART}. Ignoring {self.name}!")
             return
@@ -3,6 +3,8 @@ import constants
 
 
 class Werewolf(Creature):
+    __slots__ = ('_hero_damage_taken', '_used_ability')
+
     def __init__(self):
         super().__init__(
                 "Werewolf",